@@ -0,0 +1,65 @@
+"""On-disk cache for slow-changing WFS documents.
+
+GetCapabilities and DescribeFeatureType responses change on the order of
+days, so the debug scripts keep a copy under .cache/wfs and only hit
+GeoServer again once it is older than the TTL.
+"""
+
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import requests
+
+CACHE_DIR = Path(__file__).parent / ".cache" / "wfs"
+DEFAULT_TTL = 6 * 60 * 60  # 6 hours
+CHUNK_SIZE = 64 * 1024
+
+
+def cache_path(url: str, params: dict) -> Path:
+    """Cache file for a request, keyed by URL and sorted params."""
+    key = url + "?" + urlencode(sorted(params.items()))
+    return CACHE_DIR / hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def cached_get(
+    session: requests.Session,
+    url: str,
+    params: dict,
+    *,
+    headers: dict | None = None,
+    timeout: float = 30,
+    ttl: float = DEFAULT_TTL,
+    refresh: bool = False,
+) -> Path:
+    """GET a document into the cache, reusing it while younger than ``ttl``.
+
+    Returns the path of the cached file so callers can stream-parse it
+    from disk. The body is streamed to disk as it downloads, so it is
+    never held in memory. Raises ``requests.HTTPError`` on a non-2xx
+    response; failed responses are never cached.
+    """
+    path = cache_path(url, params)
+    if not refresh and path.exists() and time.time() - path.stat().st_mtime < ttl:
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with session.get(
+        url, params=params, headers=headers, timeout=timeout, stream=True
+    ) as resp:
+        resp.raise_for_status()
+        # Write to a private temp file then rename, so concurrent callers
+        # never see a half-written cache entry
+        tmp = tempfile.NamedTemporaryFile(dir=path.parent, delete=False)
+        try:
+            with tmp:
+                for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                    tmp.write(chunk)
+            Path(tmp.name).replace(path)
+        except BaseException:
+            # Don't leave a partial download behind in the cache directory
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+    return path
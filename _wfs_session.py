@@ -0,0 +1,74 @@
+"""Shared HTTP session and WFS constants for the debug scripts.
+
+Keeps one pooled keep-alive connection per host so repeated GeoServer
+calls skip the TCP/TLS handshake.
+"""
+
+import json
+from types import MappingProxyType
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also parses bytes
+    json_loads = json.loads
+
+# Capabilities/DescribeFeatureType calls ask for the plain XML representation
+XML_HEADERS = {"Accept": "application/xml"}
+
+# Qualified tag prefixes, as ElementTree spells them, so parsers can compare
+# elem.tag against a constant instead of stripping the namespace per element
+WFS_NS = "{http://www.opengis.net/wfs}"
+WFS2_NS = "{http://www.opengis.net/wfs/2.0}"
+GML_NS = "{http://www.opengis.net/gml}"
+GML32_NS = "{http://www.opengis.net/gml/3.2}"
+
+_LOCAL_NAMES: dict[str, str] = {}
+
+
+def local_name(tag: str) -> str:
+    """Namespace-free element name, memoized per distinct qualified tag."""
+    name = _LOCAL_NAMES.get(tag)
+    if name is None:
+        name = _LOCAL_NAMES[tag] = tag.rsplit("}", 1)[-1]
+    return name
+
+
+# Common GetFeature params for the plan_zone debug probes; merge per-call keys
+# in with {**PLAN_ZONE_PARAMS, ...}
+PLAN_ZONE_PARAMS = MappingProxyType(
+    {
+        "service": "WFS",
+        "version": "1.1.0",
+        "request": "GetFeature",
+        "typeName": "open-data-platform:plan_zone",
+        "outputFormat": "application/json",
+        "maxFeatures": "5",
+    }
+)
+
+_session: requests.Session | None = None
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    if _session is None:
+        session = requests.Session()
+        session.headers.update(
+            {
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "feasibility-dashboard/1.0",
+            }
+        )
+        retries = Retry(total=2, backoff_factor=0.2)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
@@ -2,45 +2,156 @@
 Debug script to list hazards in Eastern Suburbs.
 """
 
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
 
-import requests
+from lxml import etree
 from rich.console import Console
 from rich.table import Table
 
+from _wfs_session import (
+    GML32_NS,
+    GML_NS,
+    WFS2_NS,
+    get_session,
+    json_loads,
+    local_name,
+)
+from describe_layer import layer_fields
+
 console = Console()
 VICMAP_WFS_BASE = "https://opendata.maps.vic.gov.au/geoserver/wfs"
 
+# Feature wrappers across WFS 1.1 (GML 3.1) and WFS 2.0 (GML 3.2) responses
+MEMBER_TAGS = frozenset(
+    {
+        GML_NS + "featureMember",
+        GML_NS + "featureMembers",
+        GML32_NS + "featureMember",
+        WFS2_NS + "member",
+    }
+)
+
 
 def parse_wfs_features(resp, label):
     """Try to parse JSON or GML."""
     if "json" in resp.headers.get("Content-Type", "").lower():
         try:
-            return resp.json().get("features", [])
+            return json_loads(resp.content).get("features", [])
         except Exception:
             console.print(f"[red]JSON parse failed for {label}[/red]")
             return []
 
-    # Try GML
+    # Try GML, streaming one feature member at a time
     try:
-        root = ET.fromstring(resp.text)
         features = []
-        for member in root.iter():
-            if "featureMember" in member.tag or "member" in member.tag:
-                props = {}
-                for child in member:
-                    for elem in child:
-                        tag = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        if elem.text:
-                            props[tag] = elem.text.strip()
-                if props:
-                    features.append({"properties": props})
+        for _, member in etree.iterparse(
+            BytesIO(resp.content), events=("end",), tag=MEMBER_TAGS
+        ):
+            props = {}
+            for child in member.iterchildren(etree.Element):
+                for elem in child.iterchildren(etree.Element):
+                    if elem.text:
+                        props[local_name(elem.tag)] = elem.text.strip()
+            if props:
+                features.append({"properties": props})
+            member.clear(keep_tail=True)
         return features
     except Exception as e:
         console.print(f"[red]GML parse failed for {label}: {e}[/red]")
         return []
 
 
+def _landfill_filter(layer, bbox):
+    """CQL selecting features in the bbox with 'landfill' in any text attribute.
+
+    Returns None when the layer schema can't be read, in which case the
+    caller falls back to scanning attribute values client-side.
+    """
+    try:
+        fields = layer_fields(layer)
+    except Exception as e:
+        console.print(f"[yellow]Schema lookup failed for {layer}: {e}[/yellow]")
+        return None
+
+    geom_col = next((n for n, t in fields.items() if t.startswith("gml:")), None)
+    text_cols = [n for n, t in fields.items() if t.rsplit(":", 1)[-1] == "string"]
+    if not geom_col or not text_cols:
+        return None
+
+    keyword = " OR ".join(f"strToLowerCase({c}) LIKE '%landfill%'" for c in text_cols)
+    return f"BBOX({geom_col},{bbox},'EPSG:4326') AND ({keyword})"
+
+
+def _build_params(layer, bbox, cql_filter=None):
+    """WFS GetFeature params for a hazard layer within the bbox."""
+    params = {
+        "service": "WFS",
+        "version": "2.0.0",
+        "request": "GetFeature",
+        "typeName": layer,
+        "outputFormat": "application/json",
+        "srsName": "EPSG:4326",
+    }
+    # GeoServer rejects bbox combined with cql_filter, so the filter carries its own BBOX
+    if cql_filter:
+        params["cql_filter"] = cql_filter
+        params["count"] = 1000
+    else:
+        params["bbox"] = f"{bbox},EPSG:4326"
+        params["count"] = 100
+    return params
+
+
+def _fetch_hazards(session, label, layer, bbox):
+    """GET a layer's features, filtered server-side when possible.
+
+    Returns (response, server_filtered).
+    """
+    cql_filter = None if "landfill" in label.lower() else _landfill_filter(layer, bbox)
+    resp = session.get(
+        VICMAP_WFS_BASE, params=_build_params(layer, bbox, cql_filter), timeout=15
+    )
+    return resp, cql_filter is not None
+
+
+def _render_hazards(label, resp, server_filtered):
+    """Print landfill candidates found in a single layer response."""
+    console.print(f"\n[bold]Results for {label}...[/bold]")
+
+    if resp.status_code != 200:
+        console.print(f"[red]Error {resp.status_code}[/red]")
+        return
+
+    features = parse_wfs_features(resp, label)
+    console.print(f"Found {len(features)} features")
+
+    if server_filtered or "landfill" in label.lower():
+        landfill_candidates = [f["properties"] for f in features]
+    else:
+        # No usable schema: search every attribute value for the keyword
+        landfill_candidates = [
+            f["properties"]
+            for f in features
+            if any(v and "landfill" in str(v).lower() for v in f["properties"].values())
+        ]
+
+    if landfill_candidates:
+        console.print(
+            f"[green]Found {len(landfill_candidates)} potential landfill records in {label}[/green]"
+        )
+        table = Table(title=f"Landfill Candidates ({label})")
+        keys = list(landfill_candidates[0].keys())[:5]  # First 5 cols
+        for k in keys:
+            table.add_column(k)
+        for p in landfill_candidates[:20]:  # Show top 20
+            vals = [str(p.get(k, "")) for k in keys]
+            table.add_row(*vals)
+        console.print(table)
+    else:
+        console.print(f"No 'landfill' keywords found in {len(features)} records.")
+
+
 def list_hazards():
     # Ringwood BBOX
     bbox = "145.10,-37.95,145.40,-37.70"
@@ -51,65 +162,23 @@ def list_hazards():
         ("Enviro Audit Sites", "open-data-platform:enviro_audit_point"),
     ]
 
-    for label, layer in layers:
-        console.print(f"\n[bold]Querying {label}...[/bold]")
-
-        # Try JSON first
-        params = {
-            "service": "WFS",
-            "version": "2.0.0",
-            "request": "GetFeature",
-            "typeName": layer,
-            "outputFormat": "application/json",
-            "srsName": "EPSG:4326",
-            "bbox": f"{bbox},EPSG:4326",
-            "count": 100,
+    console.print(f"[bold]Querying {len(layers)} layers...[/bold]")
+
+    # Layers are independent, so fan the requests out and render as they land
+    session = get_session()
+    with ThreadPoolExecutor(max_workers=len(layers)) as ex:
+        futures = {
+            ex.submit(_fetch_hazards, session, label, layer, bbox): label
+            for label, layer in layers
         }
 
-        try:
-            resp = requests.get(VICMAP_WFS_BASE, params=params, timeout=15)
-            if resp.status_code != 200:
-                console.print(f"[red]Error {resp.status_code}[/red]")
-                continue
-
-            features = parse_wfs_features(resp, label)
-            console.print(f"Found {len(features)} features")
-
-            landfill_candidates = []
-            for f in features:
-                props = f["properties"]
-                # Search for keyword
-                is_landfill = False
-                for v in props.values():
-                    if v and "landfill" in str(v).lower():
-                        is_landfill = True
-                        break
-
-                if "landfill" in label.lower() or is_landfill:
-                    landfill_candidates.append(props)
-
-            if landfill_candidates:
-                console.print(
-                    f"[green]Found {len(landfill_candidates)} potential landfill records in {label}[/green]"
-                )
-                table = Table(title=f"Landfill Candidates ({label})")
-                keys = list(landfill_candidates[0].keys())[:5]  # First 5 cols
-                for k in keys:
-                    table.add_column(k)
-                for p in landfill_candidates[:20]:  # Show top 20
-                    vals = [str(p.get(k, "")) for k in keys]
-                    table.add_row(*vals)
-                console.print(table)
-            else:
-                console.print(
-                    f"No 'landfill' keywords found in {len(features)} records."
-                )
-
-        except Exception as e:
-            console.print(f"[red]Request failed: {e}[/red]")
+        for fut in as_completed(futures):
+            label = futures[fut]
+            try:
+                _render_hazards(label, *fut.result())
+            except Exception as e:
+                console.print(f"[red]Request failed for {label}: {e}[/red]")
 
 
 if __name__ == "__main__":
     list_hazards()
-    list_hazards()
-    list_hazards()
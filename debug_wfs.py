@@ -1,8 +1,9 @@
 import json
 
-import requests
 from rich.console import Console
 
+from _wfs_session import PLAN_ZONE_PARAMS, get_session, json_loads
+
 console = Console()
 
 
@@ -11,27 +12,18 @@ def test_zone_layer():
     # 2 Quamby Place, Donvale
     bbox = "145.182, -37.786, 145.183, -37.784"  # Lon,Lat ~100m box
 
-    params = {
-        "service": "WFS",
-        "version": "1.1.0",
-        "request": "GetFeature",
-        "typeName": "open-data-platform:plan_zone",
-        "outputFormat": "application/json",
-        "bbox": bbox,
-        "maxFeatures": "5",
-        "srsName": "EPSG:4326",
-    }
+    params = {**PLAN_ZONE_PARAMS, "bbox": bbox, "srsName": "EPSG:4326"}
 
     console.print(f"Requesting: {url}")
     console.print(f"Params: {json.dumps(params, indent=2)}")
 
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = get_session().get(url, params=params, timeout=10)
         console.print(f"Status: {resp.status_code}")
 
         if resp.status_code == 200:
             try:
-                data = resp.json()
+                data = json_loads(resp.content)
                 features = data.get("features", [])
                 console.print(f"Features: {len(features)}")
                 if features:
@@ -50,4 +42,3 @@ def test_zone_layer():
 
 if __name__ == "__main__":
     test_zone_layer()
-    test_zone_layer()
@@ -1,8 +1,9 @@
 import json
 
-import requests
 from rich.console import Console
 
+from _wfs_session import PLAN_ZONE_PARAMS, get_session, json_loads
+
 console = Console()
 
 
@@ -22,34 +23,26 @@ def test_coords():
 
         cql = f"INTERSECTS(geom, {point})"
 
-        params = {
-            "service": "WFS",
-            "version": "1.1.0",
-            "request": "GetFeature",
-            "typeName": "open-data-platform:plan_zone",
-            "outputFormat": "application/json",
-            "cql_filter": cql,
-            "maxFeatures": "5",
-            "srsName": srs,
-        }
+        params = {**PLAN_ZONE_PARAMS, "cql_filter": cql, "srsName": srs}
 
         try:
-            resp = requests.get(url, params=params, timeout=10)
+            resp = get_session().get(url, params=params, timeout=10)
             if resp.status_code == 200:
-                data = resp.json()
+                data = json_loads(resp.content)
                 features = data.get("features", [])
                 console.print(f"Features: {len(features)}")
                 if features:
                     props = features[0].get("properties", {})
                     console.print(f"MATCH! Zone: {props.get('zone_code')}")
-                    return
+                    break
             else:
                 console.print(f"Status: {resp.status_code}")
                 # console.print(resp.text[:200])
         except Exception as e:
             console.print(f"Error: {e}")
+    else:
+        console.print("[yellow]No variation matched[/yellow]")
 
 
 if __name__ == "__main__":
     test_coords()
-    test_coords()
@@ -1,8 +1,10 @@
 import json
 
-import requests
 from rich.console import Console
 
+from _wfs_session import PLAN_ZONE_PARAMS, get_session, json_loads
+from describe_layer import layer_fields
+
 console = Console()
 
 
@@ -12,30 +14,30 @@ def test_zone_intersects():
     lat = -37.7849813
     lon = 145.1825641
 
-    geom_cols = ["SHAPE", "the_geom", "geom", "geometry"]
+    # Ask the (cached) schema which column holds the geometry, so a single
+    # query suffices; only fall back to blind probing if that lookup fails
+    try:
+        fields = layer_fields(PLAN_ZONE_PARAMS["typeName"])
+        geom_cols = [n for n, t in fields.items() if t.startswith("gml:")][:1]
+    except Exception as e:
+        console.print(f"[yellow]Schema lookup failed, probing columns: {e}[/yellow]")
+        geom_cols = []
+    if not geom_cols:
+        geom_cols = ["SHAPE", "the_geom", "geom", "geometry"]
 
     for col in geom_cols:
         console.print(f"\nTesting CQL INTERSECTS with column: {col}")
 
         cql = f"INTERSECTS({col}, POINT({lon} {lat}))"
 
-        params = {
-            "service": "WFS",
-            "version": "1.1.0",
-            "request": "GetFeature",
-            "typeName": "open-data-platform:plan_zone",
-            "outputFormat": "application/json",
-            "cql_filter": cql,
-            "maxFeatures": "5",
-            "srsName": "EPSG:4326",
-        }
+        params = {**PLAN_ZONE_PARAMS, "cql_filter": cql, "srsName": "EPSG:4326"}
 
         try:
-            resp = requests.get(url, params=params, timeout=10)
+            resp = get_session().get(url, params=params, timeout=10)
 
             if resp.status_code == 200:
                 try:
-                    data = resp.json()
+                    data = json_loads(resp.content)
                     features = data.get("features", [])
                     console.print(f"Features found: {len(features)}")
                     if features:
@@ -43,7 +45,7 @@ def test_zone_intersects():
                         console.print(
                             f"Zone: {props.get('ZONE_CODE')} - {props.get('ZONE_DESC')}"
                         )
-                        return  # Success!
+                        break  # Success!
                 except Exception as e:
                     console.print(f"JSON Parse Error: {e}")
             else:
@@ -52,8 +54,9 @@ def test_zone_intersects():
 
         except Exception as e:
             console.print(f"Request Error: {e}")
+    else:
+        console.print("[yellow]No zone found at point[/yellow]")
 
 
 if __name__ == "__main__":
     test_zone_intersects()
-    test_zone_intersects()
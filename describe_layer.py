@@ -1,28 +1,63 @@
-import requests
+import argparse
+
+from lxml import etree
 from rich.console import Console
 
+from _wfs_cache import cached_get
+from _wfs_session import XML_HEADERS, get_session
+
 console = Console()
 
+VICMAP_WFS_BASE = "https://opendata.maps.vic.gov.au/geoserver/wfs"
+XSD_NS = "{http://www.w3.org/2001/XMLSchema}"
 
-def describe_layer():
-    url = "https://opendata.maps.vic.gov.au/geoserver/wfs"
-    params = {
+
+def _describe_params(type_name):
+    return {
         "service": "WFS",
         "version": "1.1.0",
         "request": "DescribeFeatureType",
-        "typeName": "open-data-platform:plan_zone",
+        "typeName": type_name,
     }
 
+
+def layer_fields(type_name, refresh=False):
+    """Map each attribute of a WFS layer to its XSD type (e.g. xsd:string, gml:PointPropertyType)."""
+    path = cached_get(
+        get_session(),
+        VICMAP_WFS_BASE,
+        _describe_params(type_name),
+        headers=XML_HEADERS,
+        refresh=refresh,
+    )
+    fields = {}
+    for _, elem in etree.iterparse(str(path), events=("end",), tag=XSD_NS + "element"):
+        if elem.get("name") and elem.get("type"):
+            fields[elem.get("name")] = elem.get("type")
+    return fields
+
+
+def describe_layer(refresh: bool = False):
+    url = VICMAP_WFS_BASE
+    params = _describe_params("open-data-platform:plan_zone")
+
     console.print(f"Requesting schema from: {url}")
 
     try:
-        resp = requests.get(url, params=params, timeout=30)
-        console.print(f"Status: {resp.status_code}")
-        console.print(resp.text[:2000])  # Print start of XSD
+        path = cached_get(
+            get_session(), url, params, headers=XML_HEADERS, refresh=refresh
+        )
+        with path.open("rb") as f:
+            console.print(f.read(2000).decode("utf-8", "replace"))  # Print start of XSD
 
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
 
 
 if __name__ == "__main__":
-    describe_layer()
+    parser = argparse.ArgumentParser(description="Describe the plan_zone WFS layer")
+    parser.add_argument(
+        "--refresh", action="store_true", help="Bypass the on-disk WFS cache"
+    )
+    args = parser.parse_args()
+    describe_layer(refresh=args.refresh)
@@ -1,28 +1,39 @@
-import re
+import argparse
 
-import requests
+from lxml import etree
+
+from _wfs_cache import cached_get
+from _wfs_session import WFS_NS, XML_HEADERS, get_session
 
 WFS_URL = "https://opendata.maps.vic.gov.au/geoserver/wfs"
 
 
-def list_all_layers():
+def list_all_layers(refresh: bool = False):
     print(f"Fetching capabilities from {WFS_URL}...")
     params = {"service": "WFS", "version": "1.1.0", "request": "GetCapabilities"}
     try:
-        resp = requests.get(WFS_URL, params=params, timeout=60)  # Increased timeout
-        content = resp.text
-
-        # Regex to find <Name>...</Name> inside <FeatureType>
-        # but simple regex for <Name>...</Name> is usually enough
-        names = re.findall(r"<Name>(.*?)</Name>", content)
-
-        # Filter out common non-layer names if any (like ows:...)
-        layers = [n for n in names if ":" in n]  # Most layers are namespace:name
+        path = cached_get(
+            get_session(),
+            WFS_URL,
+            params,
+            headers=XML_HEADERS,
+            timeout=60,  # Increased timeout
+            refresh=refresh,
+        )
+
+        # Stream the capabilities document; layers are namespace:name
+        layers = []
+        for _, feature_type in etree.iterparse(
+            str(path), events=("end",), tag=WFS_NS + "FeatureType"
+        ):
+            for name in feature_type.iterchildren(WFS_NS + "Name"):
+                if name.text and ":" in name.text:
+                    layers.append(name.text)
+            feature_type.clear(keep_tail=True)
 
         print(f"Found {len(layers)} layers.")
         with open("layer_list.txt", "w") as f:
-            for l in sorted(layers):
-                f.write(l + "\n")
+            f.writelines(l + "\n" for l in sorted(layers))
         print("Saved to layer_list.txt")
 
     except Exception as e:
@@ -30,5 +41,9 @@ def list_all_layers():
 
 
 if __name__ == "__main__":
-    list_all_layers()
-    list_all_layers()
+    parser = argparse.ArgumentParser(description="Dump all WFS layer names")
+    parser.add_argument(
+        "--refresh", action="store_true", help="Bypass the on-disk WFS cache"
+    )
+    args = parser.parse_args()
+    list_all_layers(refresh=args.refresh)
@@ -1,5 +1,7 @@
 import os
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from rich.console import Console
 
@@ -10,6 +12,8 @@ from scanner.scan_single import scan_single
 
 console = Console()
 
+MAX_WORKERS = 4
+
 CANDIDATES = [
     # Donvale
     ("2 Quamby Place, Donvale VIC 3111", 1_725_000),  # Mid-point of 1.65-1.8
@@ -23,18 +27,20 @@ CANDIDATES = [
 
 console.print("[bold green]STARTING BATCH LDRZ SCAN[/bold green]")
 
-for address, price in CANDIDATES:
-    console.print(f"\n[bold]{'#'*60}[/bold]")
-    console.print(f"[bold]SCANNING: {address} @ ${price:,.0f}[/bold]")
-    console.print(f"[bold]{'#'*60}[/bold]")
-
-    try:
-        scan_single(address, purchase_price=price)
-    except Exception as e:
-        console.print(f"[red]Error scanning {address}: {e}[/red]")
-        import traceback
+# Each scan is dominated by geocoder/WFS round-trips, so overlap them
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+    futures = {}
+    for address, price in CANDIDATES:
+        console.print(f"[bold]QUEUED: {address} @ ${price:,.0f}[/bold]")
+        futures[ex.submit(scan_single, address, purchase_price=price)] = address
+
+    for fut in as_completed(futures):
+        address = futures[fut]
+        try:
+            fut.result()
+            console.print(f"[green]Done: {address}[/green]")
+        except Exception as e:
+            console.print(f"[red]Error scanning {address}: {e}[/red]")
+            traceback.print_exception(e)
 
-        traceback.print_exc()
-
-console.print("\n[bold green]BATCH SCAN COMPLETE[/bold green]")
 console.print("\n[bold green]BATCH SCAN COMPLETE[/bold green]")
@@ -1,6 +1,7 @@
 import os
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from rich.console import Console
 
@@ -11,6 +12,8 @@ from scanner.scan_single import scan_single
 
 console = Console()
 
+MAX_WORKERS = 4
+
 CANDIDATES = [
     # Priority 1: Largest blocks (>10,000 sqm)
     "23 Websters Road, Templestowe",  # 14,200 sqm - TOP CANDIDATE
@@ -30,15 +33,22 @@ def run_batch():
 
     results = []
 
-    for address in CANDIDATES:
-        console.print(f"\n[bold magenta]Scanning: {address}[/bold magenta]")
-        try:
+    # Each scan is dominated by geocoder/WFS round-trips, so overlap them
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = {}
+        for address in CANDIDATES:
+            console.print(f"\n[bold magenta]Scanning: {address}[/bold magenta]")
             # Run scan (assuming default strategy for now, LDRZ logic is embedded)
-            scan_single(address)
-            results.append((address, "Completed"))
-        except Exception as e:
-            console.print(f"[red]Error scanning {address}: {e}[/red]")
-            traceback.print_exc()
+            futures[ex.submit(scan_single, address)] = address
+
+        for fut in as_completed(futures):
+            address = futures[fut]
+            try:
+                fut.result()
+                results.append((address, "Completed"))
+            except Exception as e:
+                console.print(f"[red]Error scanning {address}: {e}[/red]")
+                traceback.print_exception(e)
 
 
 if __name__ == "__main__":
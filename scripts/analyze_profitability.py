@@ -1,5 +1,10 @@
 """Quick profitability analysis for Donvale listings."""
 
+import sys
+
+import numpy as np
+from sqlalchemy import func, select
+
 from scanner.config import get_config
 from scanner.db import get_session
 from scanner.models import Site
@@ -16,127 +21,141 @@ def analyze_profitability():
     finance_rate = config.feasibility.finance_rate  # 7.5%
     holding_months = config.feasibility.holding_months  # 18
 
-    print("=" * 70)
-    print("DONVALE SUBDIVISION POTENTIAL ANALYSIS")
-    print("=" * 70)
-    print()
-    print(
+    # Build the whole report in memory and write it once at the end
+    lines = []
+    lines.append("=" * 70)
+    lines.append("DONVALE SUBDIVISION POTENTIAL ANALYSIS")
+    lines.append("=" * 70)
+    lines.append("")
+    lines.append(
         f"Assumptions: Build ${build_cost_per_m2}/m², {soft_costs_pct*100:.0f}% soft costs, {finance_rate*100:.1f}% finance, {holding_months} months"
     )
-    print()
+    lines.append("")
 
     with get_session() as session:
-        sites = session.query(Site).order_by(Site.land_size_listed.desc()).all()
-
-        high_potential = []
-        medium_potential = []
-        low_potential = []
-
-        for site in sites:
-            land = site.land_size_listed or 0
-            price = site.price_guide or 0
-
-            if land == 0:
-                continue
-
-            # Estimate lots (assume min 300m2 per lot, with 20% for roads/access)
-            usable_land = land * 0.8
-            potential_lots = max(1, int(usable_land / 300))
-
-            # Price per m2
-            price_per_m2 = price / land if land > 0 else 0
+        total_sites = session.scalar(select(func.count()).select_from(Site))
+
+        # Only the three columns the analysis needs, as plain rows
+        rows = session.execute(
+            select(Site.address_raw, Site.land_size_listed, Site.price_guide)
+            .where(Site.land_size_listed != 0)
+            .order_by(Site.land_size_listed.desc())
+        ).all()
+
+        # Column arrays so every site is costed in one vectorized pass
+        addresses = [r[0] for r in rows]
+        land = np.fromiter((r[1] or 0 for r in rows), dtype=np.float64, count=len(rows))
+        price = np.fromiter(
+            (r[2] or 0 for r in rows), dtype=np.float64, count=len(rows)
+        )
 
-            # Estimated townhouse sizes: 180m2 each
-            townhouse_size = 180
-            total_build_area = potential_lots * townhouse_size
+        # Estimate lots (assume min 300m2 per lot, with 20% for roads/access)
+        usable_land = land * 0.8
+        potential_lots = np.maximum(1, (usable_land / 300).astype(np.int64))
+
+        # Price per m2 (zero land sizes are filtered out in SQL)
+        price_per_m2 = price / land
+
+        # Estimated townhouse sizes: 180m2 each
+        townhouse_size = 180
+        total_build_area = potential_lots * townhouse_size
+
+        # Total development cost
+        land_cost = price
+        construction = total_build_area * build_cost_per_m2
+        soft_costs = (land_cost + construction) * soft_costs_pct
+        finance_cost = (land_cost + construction) * finance_rate * (holding_months / 12)
+        total_cost = land_cost + construction + soft_costs + finance_cost
+
+        # Estimated sale value (Donvale townhouse ~$1.1m each)
+        sale_price_per_unit = 1_100_000
+        total_revenue = potential_lots * sale_price_per_unit
+
+        # Profit
+        profit = total_revenue - total_cost
+        profit_margin = np.divide(
+            profit * 100,
+            total_cost,
+            out=np.zeros_like(total_cost),
+            where=total_cost > 0,
+        )
 
-            # Total development cost
-            land_cost = price
-            construction = total_build_area * build_cost_per_m2
-            soft_costs = (land_cost + construction) * soft_costs_pct
-            finance_cost = (
-                (land_cost + construction) * finance_rate * (holding_months / 12)
-            )
-            total_cost = land_cost + construction + soft_costs + finance_cost
-
-            # Estimated sale value (Donvale townhouse ~$1.1m each)
-            sale_price_per_unit = 1_100_000
-            total_revenue = potential_lots * sale_price_per_unit
-
-            # Profit
-            profit = total_revenue - total_cost
-            profit_margin = (profit / total_cost) * 100 if total_cost > 0 else 0
-
-            result = {
-                "address": site.address_raw,
-                "land_m2": land,
-                "price": price,
-                "price_per_m2": price_per_m2,
-                "potential_lots": potential_lots,
-                "total_cost": total_cost,
-                "total_revenue": total_revenue,
-                "profit": profit,
-                "profit_margin": profit_margin,
+        # Classify
+        is_high = (profit_margin > 20) & (land > 2000)
+        is_medium = ~is_high & ((profit_margin > 10) | (land > 1500))
+        is_low = ~is_high & ~is_medium
+
+        def result(i):
+            return {
+                "address": addresses[i],
+                "land_m2": land[i],
+                "price": price[i],
+                "price_per_m2": price_per_m2[i],
+                "potential_lots": potential_lots[i],
+                "total_cost": total_cost[i],
+                "total_revenue": total_revenue[i],
+                "profit": profit[i],
+                "profit_margin": profit_margin[i],
             }
 
-            # Classify
-            if profit_margin > 20 and land > 2000:
-                high_potential.append(result)
-            elif profit_margin > 10 or land > 1500:
-                medium_potential.append(result)
-            else:
-                low_potential.append(result)
+        # Only the rows that get printed are turned back into dicts
+        high_potential = [result(i) for i in np.flatnonzero(is_high)]
+        medium_potential = [result(i) for i in np.flatnonzero(is_medium)[:5]]
+        medium_count = int(is_medium.sum())
+        low_count = int(is_low.sum())
 
         # Print results
-        print("🟢 HIGH POTENTIAL (>20% margin, >2000m²)")
-        print("-" * 70)
+        lines.append("🟢 HIGH POTENTIAL (>20% margin, >2000m²)")
+        lines.append("-" * 70)
         for r in high_potential:
-            print(f"  {r['address']}")
-            print(
+            lines.append(f"  {r['address']}")
+            lines.append(
                 f"    Land: {r['land_m2']:,.0f}m² @ ${r['price']:,.0f} (${r['price_per_m2']:.0f}/m²)"
             )
-            print(
+            lines.append(
                 f"    Potential: {r['potential_lots']} lots → ${r['total_revenue']:,.0f} revenue"
             )
-            print(
+            lines.append(
                 f"    Cost: ${r['total_cost']:,.0f} | Profit: ${r['profit']:,.0f} ({r['profit_margin']:.1f}%)"
             )
-            print()
-
-        print()
-        print("🟡 MEDIUM POTENTIAL")
-        print("-" * 70)
-        for r in medium_potential[:5]:  # Top 5 only
-            print(f"  {r['address']}")
-            print(
+            lines.append("")
+
+        lines.append("")
+        lines.append("🟡 MEDIUM POTENTIAL")
+        lines.append("-" * 70)
+        for r in medium_potential:  # Top 5 only
+            lines.append(f"  {r['address']}")
+            lines.append(
                 f"    Land: {r['land_m2']:,.0f}m² | {r['potential_lots']} lots | Margin: {r['profit_margin']:.1f}%"
             )
-            print()
+            lines.append("")
 
-        print()
-        print(
-            f"🔴 LOW POTENTIAL: {len(low_potential)} sites (too small or too expensive)"
+        lines.append("")
+        lines.append(
+            f"🔴 LOW POTENTIAL: {low_count} sites (too small or too expensive)"
         )
-        print()
+        lines.append("")
 
-        print("=" * 70)
-        print("SUMMARY")
-        print("=" * 70)
-        print(f"  Total sites: {len(sites)}")
-        print(f"  High potential: {len(high_potential)}")
-        print(f"  Medium potential: {len(medium_potential)}")
-        print(f"  Low potential: {len(low_potential)}")
+        lines.append("=" * 70)
+        lines.append("SUMMARY")
+        lines.append("=" * 70)
+        lines.append(f"  Total sites: {total_sites}")
+        lines.append(f"  High potential: {len(high_potential)}")
+        lines.append(f"  Medium potential: {medium_count}")
+        lines.append(f"  Low potential: {low_count}")
 
         if high_potential:
             best = high_potential[0]
-            print()
-            print(f"  🏆 BEST OPPORTUNITY: {best['address']}")
-            print(f"     {best['land_m2']:,.0f}m² for ${best['price']:,.0f}")
-            print(
+            lines.append("")
+            lines.append(f"  🏆 BEST OPPORTUNITY: {best['address']}")
+            lines.append(f"     {best['land_m2']:,.0f}m² for ${best['price']:,.0f}")
+            lines.append(
                 f"     Est. profit: ${best['profit']:,.0f} ({best['profit_margin']:.1f}% margin)"
             )
 
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
+
 
 if __name__ == "__main__":
     analyze_profitability()
-    analyze_profitability()
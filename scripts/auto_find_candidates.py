@@ -1,10 +1,14 @@
 import csv
 import os
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from rich.console import Console
 
@@ -12,16 +16,19 @@ from rich.console import Console
 sys.path.insert(0, os.path.join(os.getcwd(), "src"))
 
 from scanner.constraints.quick_kill import evaluate_quick_kill
-from scanner.feasibility.model import calculate_simple_feasibility
+from scanner.feasibility.model import (
+    calculate_simple_feasibility,
+    calculate_simple_feasibility_batch,
+)
 from scanner.planning.rules import calculate_max_footprint, check_yield_limits
-from scanner.scan_single import extract_suburb, geocode_address
+from scanner.scan_single import extract_suburb, geocode_batch
 from scanner.spatial.geometry import (
     calculate_approx_area_sqm,
     calculate_frontage,
     calculate_slope_and_elevation,
-    get_property_polygon,
 )
 from scanner.spatial.ldrz_checks import assess_ldrz_subdivision
+from scanner.spatial.parcel_cache import get_property_polygon_cached
 from scanner.spatial.transmission_cache import (
     check_transmission_proximity_cached,
     ensure_transmission_cache,
@@ -31,15 +38,28 @@ console = Console()
 
 REPORTS_DIR = Path("reports")
 CANDIDATES_CSV = REPORTS_DIR / "weekly_ldrz_candidates_latest.csv"
-FOUND_DB = (
-    REPORTS_DIR / "viability_tracking.csv"
-)  # Track what we've checked to avoid reprocessing
+# Track what we've checked to avoid reprocessing
+CHECKED_DB = REPORTS_DIR / "viability.db"
+LEGACY_TRACKING_CSV = REPORTS_DIR / "viability_tracking.csv"
 
 TARGET_COUNT = 5
+# Candidates are assessed concurrently; each one is mostly waiting on WFS I/O
+MAX_WORKERS = int(os.getenv("HARVEST_CONCURRENCY", "16"))
+
+# Above roughly this size the dual-occ build hits its 2x220m2 cap, so the
+# modelled margin no longer depends on land area (see margin_ceiling)
+MARGIN_GATE_MIN_AREA = 1000
+
+_save_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+_checked: set[str] | None = None
+
 
+def start_scraper_batch() -> subprocess.Popen:
+    """Starts one batch of the scanner directly (bypassing VPN wrapper).
 
-def run_scraper_batch():
-    """Runs one batch of the scanner directly (bypassing VPN wrapper)."""
+    Returns without waiting, so candidates can be assessed while it runs.
+    """
     console.print("[bold cyan]Running Scraper Batch (Direct)...[/bold cyan]")
 
     # Ensure VPN is off or rely on current state
@@ -68,44 +88,112 @@ def run_scraper_batch():
         "--max-area",
         "50000",
     ]
-    subprocess.run(cmd, check=False)
+    return subprocess.Popen(cmd)
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Open the tracking DB once, importing the old CSV log on first use."""
+    global _conn
+    if _conn is None:
+        REPORTS_DIR.mkdir(exist_ok=True)
+        conn = sqlite3.connect(CHECKED_DB, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS checked("
+            "address TEXT PRIMARY KEY, status TEXT, margin REAL, ts REAL)"
+        )
+        empty = conn.execute("SELECT 1 FROM checked LIMIT 1").fetchone() is None
+        if empty and LEGACY_TRACKING_CSV.exists():
+            with open(LEGACY_TRACKING_CSV, newline="", encoding="utf-8") as f:
+                rows = [
+                    (r["address"], r["status"], r["margin"], r["timestamp"])
+                    for r in csv.DictReader(f)
+                ]
+            conn.executemany("INSERT OR REPLACE INTO checked VALUES (?, ?, ?, ?)", rows)
+            conn.commit()
+        _conn = conn
+    return _conn
 
 
 def load_checked_sites():
-    if not FOUND_DB.exists():
-        return set()
-    df = pd.read_csv(FOUND_DB)
-    return set(df["address"].tolist())
+    """Addresses already assessed; read from disk once, then kept in memory."""
+    global _checked
+    if _checked is None:
+        rows = _get_conn().execute("SELECT address FROM checked")
+        _checked = {address for (address,) in rows}
+    return _checked
 
 
 def save_checked_site(address, status, margin=0.0):
-    file_exists = FOUND_DB.exists()
-    with open(FOUND_DB, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["address", "status", "margin", "timestamp"])
-        writer.writerow([address, status, margin, time.time()])
+    """Record a result; call commit_checked_sites() to make it durable."""
+    checked = load_checked_sites()
+    # Called from worker threads; the connection and set are shared
+    with _save_lock:
+        _get_conn().execute(
+            "INSERT OR REPLACE INTO checked VALUES (?, ?, ?, ?)",
+            (address, status, margin, time.time()),
+        )
+        checked.add(address)
+
+
+def commit_checked_sites():
+    with _save_lock:
+        _get_conn().commit()
+
+
+def margin_ceiling(cands):
+    """Best-case margin per candidate from its listed price and land size.
+
+    assess_candidate picks DualOcc or Subdivision from the parcel area; above
+    MARGIN_GATE_MIN_AREA neither margin depends on area, so the better of
+    the two bounds the real result. NaN where the listing lacks the data.
+    """
+    prices = pd.to_numeric(
+        pd.Series([c.get("price_est") for c in cands], dtype=object), errors="coerce"
+    ).to_numpy(dtype=float)
+    areas = pd.to_numeric(
+        pd.Series([c.get("land_size_m2") for c in cands], dtype=object),
+        errors="coerce",
+    ).to_numpy(dtype=float)
+    footprints = np.array([calculate_max_footprint(a, "GRZ1")[0] for a in areas])
+
+    dual = calculate_simple_feasibility_batch(
+        prices, areas, "DualOcc", max_footprints_sqm=footprints, max_dwellings=2
+    )
+    subdivision = calculate_simple_feasibility_batch(prices, areas, "Subdivision")
 
+    known = (prices > 0) & (areas >= MARGIN_GATE_MIN_AREA)
+    return np.where(known, np.maximum(dual, subdivision), np.nan)
 
-def assess_candidate(address, price_est):
+
+def assess_candidate(address, price_est, geo):
     """
+    geo is the (lat, lon, full_address) tuple from geocode_batch, or None.
+
     Returns (is_viable, margin, reason)
     """
     console.print(f"\n[bold]Assessing: {address} (Est: ${price_est/1e6:.2f}M)[/bold]")
 
-    # 1. Geocode
-    geo = geocode_address(address)
+    # 1. Geocode (resolved up front for the whole batch)
     if not geo:
         return False, 0, "Geocode failed"
     lat, lon, full_address = geo
 
-    # 2. Quick Kill
+    # 2. Transmission: a local cache lookup, so it runs before anything that
+    # hits a remote service
+    try:
+        is_near, _, _ = check_transmission_proximity_cached(lat, lon, 300)
+        if is_near:
+            return False, 0, "Near transmission lines"
+    except:
+        pass
+
+    # 3. Quick Kill
     kill = evaluate_quick_kill(lat, lon)
     if kill.should_reject:
         return False, 0, f"Quick Kill: {', '.join(kill.reasons)}"
 
-    # 3. Geometry / Parcel
-    poly = get_property_polygon(lat, lon)
+    # 4. Geometry / Parcel
+    poly = get_property_polygon_cached(lat, lon)
     if not poly:
         return False, 0, "No parcel data"
 
@@ -120,15 +208,6 @@ def assess_candidate(address, price_est):
     if slope > 15:  # User critera <15%
         return False, 0, f"Slope too steep ({slope:.1f}%)"
 
-    # 4. Transmission (ensure cache)
-    try:
-        ensure_transmission_cache()
-        is_near, _, _ = check_transmission_proximity_cached(lat, lon, 300)
-        if is_near:
-            return False, 0, "Near transmission lines"
-    except:
-        pass
-
     # 5. Feasibility
     # Assume LDRZ if not explicitly checked (or rely on assess_ldrz_subdivision)
     # We'll use the robust simple feasibility for the 'margin > 20%' check
@@ -162,37 +241,81 @@ def main():
         f"[bold green]Starting Search for {TARGET_COUNT} Viable Candidates...[/bold green]"
     )
 
+    # Populate the transmission line cache once rather than per candidate
+    try:
+        ensure_transmission_cache()
+    except Exception as e:
+        console.print(f"[yellow]Transmission cache unavailable: {e}[/yellow]")
+
+    # Kept up to date in memory by save_checked_site
+    checked = load_checked_sites()
+    candidates = []
+    candidates_mtime = None
+    scraper = None
+
     while len(found_candidates) < TARGET_COUNT:
-        checked = load_checked_sites()
+        if scraper is not None and scraper.poll() is not None:
+            scraper = None
 
-        # 1. Read current candidates
-        if CANDIDATES_CSV.exists():
+        # 1. Read current candidates, only when the scraper has rewritten them
+        mtime = CANDIDATES_CSV.stat().st_mtime if CANDIDATES_CSV.exists() else None
+        if mtime != candidates_mtime:
+            candidates_mtime = mtime
             try:
                 # Handle empty csv
-                df = pd.read_csv(CANDIDATES_CSV)
+                df = pd.read_csv(
+                    CANDIDATES_CSV,
+                    usecols=lambda c: c in ("address", "price_est", "land_size_m2"),
+                )
                 if df.empty:
                     candidates = []
                 else:
                     candidates = df.to_dict("records")
             except:
                 candidates = []
-        else:
-            candidates = []
 
         # 2. Filter for unchecked
         unchecked = [c for c in candidates if c["address"] not in checked]
 
         if not unchecked:
-            console.print(
-                "[yellow]No unchecked candidates. Running Scraper...[/yellow]"
-            )
-            run_scraper_batch()
+            if scraper is None:
+                console.print(
+                    "[yellow]No unchecked candidates. Running Scraper...[/yellow]"
+                )
+                scraper = start_scraper_batch()
+            else:
+                console.print("[yellow]Waiting for scraper batch...[/yellow]")
+            scraper.wait()
             continue
 
+        # Scrape the next batch in the background while this one is assessed;
+        # the mtime check above picks up its report when it lands
+        if scraper is None:
+            scraper = start_scraper_batch()
+
         # 3. Process batch
         console.print(f"[bold]Processing {len(unchecked)} pending candidates...[/bold]")
 
-        for cand in unchecked:
+        # Drop listings whose asking price can't reach the target margin
+        # before spending any geocode/WFS calls on them
+        ceiling = margin_ceiling(unchecked)
+        gated = ceiling <= 20  # NaN (unknown) compares False
+        for cand, margin in zip(unchecked, ceiling):
+            if margin <= 20:
+                save_checked_site(cand["address"], "REJECTED", float(margin))
+        if gated.any():
+            console.print(
+                f"[dim]{int(gated.sum())} rejected on listed price "
+                f"(best-case margin <= 20%)[/dim]"
+            )
+            unchecked = [c for c, g in zip(unchecked, gated) if not g]
+            if not unchecked:
+                commit_checked_sites()
+                continue
+
+        coords = geocode_batch([c["address"] for c in unchecked])
+
+        def _process(cand):
             addr = cand["address"]
             price = cand.get("price_est")
             try:
@@ -200,22 +323,45 @@ def main():
             except:
                 price = None
 
-            is_viable, margin, reason = assess_candidate(addr, price)
-
-            save_checked_site(addr, "VIABLE" if is_viable else "REJECTED", margin)
-
-            if is_viable:
-                console.print(
-                    f"[green]Found Candidate! {addr} (Margin: {margin:.1f}%)[/green]"
-                )
-                found_candidates.append(
-                    {"address": addr, "margin": margin, "price_est": price}
+            try:
+                is_viable, margin, reason = assess_candidate(
+                    addr, price, coords.get(addr)
                 )
-            else:
-                console.print(f"[red]Rejected: {reason}[/red]")
-
-            if len(found_candidates) >= TARGET_COUNT:
-                break
+            except Exception as e:
+                # One failed lookup shouldn't sink the rest of the batch
+                is_viable, margin, reason = False, 0, f"Error: {e}"
+            save_checked_site(addr, "VIABLE" if is_viable else "REJECTED", margin)
+            return cand, price, is_viable, margin, reason
+
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                futures = [ex.submit(_process, c) for c in unchecked]
+                for fut in as_completed(futures):
+                    cand, price, is_viable, margin, reason = fut.result()
+                    addr = cand["address"]
+
+                    if is_viable:
+                        console.print(
+                            f"[green]Found Candidate! {addr} (Margin: {margin:.1f}%)[/green]"
+                        )
+                        found_candidates.append(
+                            {"address": addr, "margin": margin, "price_est": price}
+                        )
+                    else:
+                        console.print(f"[red]Rejected: {reason}[/red]")
+
+                    if len(found_candidates) >= TARGET_COUNT:
+                        # Drop queued work; in-flight assessments still finish
+                        for f in futures:
+                            f.cancel()
+                        break
+        finally:
+            # One transaction per batch rather than per candidate; still made
+            # if the batch is interrupted, so finished assessments are kept
+            commit_checked_sites()
+
+    if scraper is not None and scraper.poll() is None:
+        scraper.terminate()
 
     console.print("\n[bold green]MISSION ACCOMPLISHED. TOP 5 CANDIDATES:[/bold green]")
     for i, c in enumerate(found_candidates, 1):
@@ -1,9 +1,15 @@
 """Batch script to harvest market intelligence for multiple suburbs."""
 
+import asyncio
 import os
-import subprocess
+import random
 import sys
 
+# Add src to path
+sys.path.insert(0, os.path.join(os.getcwd(), "src"))
+
+from scanner.ingest.domain import scrape_sold_domain
+
 suburbs = [
     "Doncaster East",
     "Doncaster",
@@ -13,30 +19,31 @@ suburbs = [
     "Bulleen",
 ]
 
-print(f"🚀 Starting batch market intelligence harvest for {len(suburbs)} suburbs...")
+# Scrapes mostly wait on Domain; keep this low so we don't trip Cloudflare
+MAX_WORKERS = 3
 
-# Ensure PYTHONPATH is set
-env = os.environ.copy()
-env["PYTHONPATH"] = "src"
 
-for suburb in suburbs:
-    print(f"\n--- Processing {suburb} ---")
+async def harvest(worker_suburbs):
+    # Stagger start times so parallel scrapes don't hit Domain in lockstep
+    await asyncio.sleep(random.uniform(0.5, 1.5))
+    print(f"\n--- Processing {', '.join(worker_suburbs)} ---")
     try:
-        # Run Domain SOLD scrape
-        cmd = [
-            sys.executable,
-            "-m",
-            "scanner.ingest.domain",
-            "--suburb",
-            suburb,
-            "--type",
-            "sold",
-            "--limit",
-            "3",  # 3 pages per suburb = ~60 listings
-        ]
-        subprocess.run(cmd, env=env, check=True)
-        print(f"✅ Finished {suburb}")
+        # Run Domain SOLD scrape; one browser is reused for all of this
+        # worker's suburbs. 3 pages per suburb = ~60 listings
+        await scrape_sold_domain(worker_suburbs, max_pages=3)
+        print(f"✅ Finished {', '.join(worker_suburbs)}")
     except Exception as e:
-        print(f"❌ Failed to process {suburb}: {e}")
+        print(f"❌ Failed to process {', '.join(worker_suburbs)}: {e}")
+
+
+async def harvest_all():
+    # Round-robin the suburbs over the workers
+    shares = [suburbs[i::MAX_WORKERS] for i in range(MAX_WORKERS)]
+    await asyncio.gather(*(harvest(share) for share in shares if share))
+
+
+print(f"🚀 Starting batch market intelligence harvest for {len(suburbs)} suburbs...")
+
+asyncio.run(harvest_all())
 
 print("\n✨ All suburbs processed!")
@@ -1,37 +1,38 @@
-def calculate_profit():
-    # --- revenue ---
-    # Unit 1: Sold $1,372,000
-    # Unit 2: Sold $1,182,000
-    # Unit 3: Est $1,350,000 (Conservative estimate based on U1/U2)
-    sales_gross = [1_372_000, 1_182_000, 1_350_000]
-    total_sales = sum(sales_gross)
+import numpy as np
 
-    # --- Costs ---
-    purchase_price = 1_160_000
 
-    # Stamp Duty (VIC) ~5.5% + fees
-    stamp_duty = 63800 + 2000  # Approx slab
+def feasibility(
+    sales_gross: np.ndarray,
+    purchase: np.ndarray,
+    build_inc_gst: np.ndarray,
+    stamp_duty: np.ndarray | float = 63800 + 2000,  # VIC ~5.5% + fees, approx slab
+    planning_design: np.ndarray | float = 50_000,  # Permits, Architect
+    subdivision: np.ndarray | float = 15_000,
+    finance_cost: np.ndarray | float = 200_000,
+) -> dict[str, np.ndarray]:
+    """Development P&L for one or many scenarios at once.
+
+    sales_gross has shape (..., n_units); every other input broadcasts
+    against sales_gross[..., 0], so a sensitivity sweep is a single call.
+    Returns each line item as an array of the scenario shape.
+    """
+    sales_gross = np.asarray(sales_gross, dtype=float)
+    purchase = np.asarray(purchase, dtype=float)
+
+    # --- revenue ---
+    total_sales = sales_gross.sum(axis=-1)
 
-    # Construction (Inc GST from User) -> convert to Ex GST for P&L usually,
+    # --- Costs ---
+    # Construction (Inc GST) -> convert to Ex GST for P&L usually,
     # but cashflow matters. Let's do Ex GST for profit, and handle GST net position.
-    build_inc_gst = 1_200_000
-    build_ex_gst = build_inc_gst / 1.1
+    build_ex_gst = np.asarray(build_inc_gst, dtype=float) / 1.1
 
     # Soft Costs
-    planning_design = 50_000  # Permits, Architect
-    subdivision = 15_000
-    open_space_levy = 1_160_000 * 0.05  # 5% of site value usually
+    open_space_levy = purchase * 0.05  # 5% of site value usually
 
     # Selling Costs
     agent_fees = total_sales * 0.022  # 2.2% inc marketing
-    legal_sales = 3 * 1500
-
-    # Interest (Holding)
-    # Bought 2021, Sold 2024/25. ~3-4 years holding?
-    # Say 1.5years construction, 1 year planning/settlement.
-    # Land Loan: $1.16m + costs. Construction drawn down.
-    # Simple Interest Est for Project: ~ $200,000 (Conservative)
-    finance_cost = 200_000
+    legal_sales = sales_gross.shape[-1] * 1500
 
     # --- Tax (GST) ---
     # Margin Scheme on Land portion?
@@ -42,12 +43,11 @@ def calculate_profit():
     # Be simple: GST Net Payable = (Sales / 11) - (Build GST Credits) - (Agent GST Credits)
     # Using Margin Scheme on Land: Limit GST liability to value added.
     # GST Payable = (Total Sales - Purchase Price) / 11
-
-    gst_margin_scheme = (total_sales - purchase_price) / 11
+    gst_margin_scheme = (total_sales - purchase) / 11
 
     # Total Costs (Ex GST where claimable)
     total_dev_cost = (
-        purchase_price
+        purchase
         + stamp_duty
         + build_ex_gst
         + planning_design
@@ -61,27 +61,66 @@ def calculate_profit():
     gross_profit = total_sales - total_dev_cost - gst_margin_scheme
     margin = (gross_profit / total_dev_cost) * 100
 
+    return {
+        "total_sales": total_sales,
+        "stamp_duty": np.broadcast_to(stamp_duty, total_sales.shape),
+        "build_ex_gst": build_ex_gst,
+        "soft_costs": planning_design + subdivision + open_space_levy,
+        "finance_cost": np.broadcast_to(finance_cost, total_sales.shape),
+        "selling_costs": (agent_fees / 1.1) + legal_sales,
+        "gst_margin_scheme": gst_margin_scheme,
+        "total_dev_cost": total_dev_cost,
+        "gross_profit": gross_profit,
+        "margin": margin,
+    }
+
+
+def calculate_profit():
+    # --- revenue ---
+    # Unit 1: Sold $1,372,000
+    # Unit 2: Sold $1,182,000
+    # Unit 3: Est $1,350,000 (Conservative estimate based on U1/U2)
+    sales_gross = np.array([1_372_000, 1_182_000, 1_350_000])
+
+    # --- Costs ---
+    purchase_price = 1_160_000
+    build_inc_gst = 1_200_000  # From User
+
+    # Interest (Holding)
+    # Bought 2021, Sold 2024/25. ~3-4 years holding?
+    # Say 1.5years construction, 1 year planning/settlement.
+    # Land Loan: $1.16m + costs. Construction drawn down.
+    # Simple Interest Est for Project: ~ $200,000 (Conservative)
+    finance_cost = 200_000
+
+    f = {
+        k: float(v)
+        for k, v in feasibility(
+            sales_gross, purchase_price, build_inc_gst, finance_cost=finance_cost
+        ).items()
+    }
+
     print(f"--- FEASIBILITY REPORT: Property Dashboard ---")
     print(f"REVENUE")
-    print(f"  Sales Gross:    ${total_sales:,.0f}")
+    print(f"  Sales Gross:    ${f['total_sales']:,.0f}")
     print(f"    - Unit 1: $1.372m")
     print(f"    - Unit 2: $1.182m")
     print(f"    - Unit 3: $1.350m (Est)")
     print("-" * 30)
     print(f"COSTS")
     print(f"  Purchase:       ${purchase_price:,.0f}")
-    print(f"  Stamp Duty:     ${stamp_duty:,.0f}")
-    print(f"  Construction:   ${build_ex_gst:,.0f} (Ex GST)")
-    print(f"  Planning/Soft:  ${planning_design + subdivision + open_space_levy:,.0f}")
-    print(f"  Finance (Est):  ${finance_cost:,.0f}")
-    print(f"  Selling/Legal:  ${(agent_fees/1.1) + legal_sales:,.0f}")
-    print(f"  GST Payable:    ${gst_margin_scheme:,.0f} (Margin Scheme)")
+    print(f"  Stamp Duty:     ${f['stamp_duty']:,.0f}")
+    print(f"  Construction:   ${f['build_ex_gst']:,.0f} (Ex GST)")
+    print(f"  Planning/Soft:  ${f['soft_costs']:,.0f}")
+    print(f"  Finance (Est):  ${f['finance_cost']:,.0f}")
+    print(f"  Selling/Legal:  ${f['selling_costs']:,.0f}")
+    print(f"  GST Payable:    ${f['gst_margin_scheme']:,.0f} (Margin Scheme)")
     print("-" * 30)
-    print(f"  TOTAL COSTS:    ${total_dev_cost + gst_margin_scheme:,.0f}")
+    print(f"  TOTAL COSTS:    ${f['total_dev_cost'] + f['gst_margin_scheme']:,.0f}")
     print("-" * 30)
     print(f"PROFIT")
-    print(f"  Net Profit:     ${gross_profit:,.0f}")
-    print(f"  Margin on Cost: {margin:.1f}%")
+    print(f"  Net Profit:     ${f['gross_profit']:,.0f}")
+    print(f"  Margin on Cost: {f['margin']:.1f}%")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,51 @@
-from sqlalchemy import text
+from sqlalchemy import func, select, text
 
 from scanner.db import get_session
 from scanner.models import CachedSchoolZone, CachedZone, PlanningZone, Site
 
 
+def _row_count(session, model) -> str:
+    """Row count from planner statistics when available, else COUNT(*).
+
+    Statistics are only as fresh as the last ANALYZE, so estimates are
+    marked with "~".
+    """
+    table = model.__tablename__
+    dialect = session.get_bind().dialect.name
+    try:
+        if dialect == "sqlite":
+            stat = session.execute(
+                text("SELECT stat FROM sqlite_stat1 WHERE tbl = :t LIMIT 1"),
+                {"t": table},
+            ).scalar()
+            estimate = int(stat.split()[0]) if stat else None
+        elif dialect == "postgresql":
+            estimate = session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :t"),
+                {"t": table},
+            ).scalar()
+        else:
+            estimate = None
+    except Exception:
+        # sqlite_stat1 only exists once ANALYZE has been run
+        session.rollback()
+        estimate = None
+
+    if estimate is not None and estimate >= 0:
+        return f"~{estimate}"
+    return str(session.scalar(select(func.count()).select_from(model)))
+
+
 def check_db_state():
     with get_session() as session:
         # Check Address
         print("--- Address Check ---")
-        sites = session.query(Site).filter(Site.address_raw.ilike("%Dryden%")).all()
+        # Only the printed columns; avoids hydrating full Site rows
+        sites = session.execute(
+            select(Site.address_raw, Site.lat, Site.lon).where(
+                Site.address_raw.ilike("%Dryden%")
+            )
+        ).all()
         if sites:
             for s in sites:
                 print(f"Found Site: {s.address_raw} ({s.lat}, {s.lon})")
@@ -17,18 +54,18 @@ def check_db_state():
 
         # Check Zoning Data
         print("\n--- Zoning Data Check ---")
-        z_count = session.query(PlanningZone).count()
+        z_count = _row_count(session, PlanningZone)
         print(f"PlanningZone rows: {z_count}")
 
         # Check School Data
         print("\n--- School Data Check ---")
-        s_count = session.query(CachedSchoolZone).count()
-        print(f"CachedSchoolZone rows: {s_count}")
-        for s in session.query(CachedSchoolZone).all():
+        schools = session.execute(
+            select(CachedSchoolZone.school_name, CachedSchoolZone.school_type)
+        ).all()
+        print(f"CachedSchoolZone rows: {len(schools)}")
+        for s in schools:
             print(f" - {s.school_name} ({s.school_type})")
 
 
 if __name__ == "__main__":
     check_db_state()
-if __name__ == "__main__":
-    check_db_state()
@@ -1,4 +1,3 @@
-import re
 from pathlib import Path
 
 import pandas as pd
@@ -6,32 +5,24 @@ import pandas as pd
 REPORT_PATH = Path("reports/dual_occ_candidates.csv")
 
 
-def clean_address_from_url(url):
-    try:
-        # Example: https://www.domain.com.au/5-dellwood-court-templestowe-vic-3106-2020402665
-        if not isinstance(url, str):
-            return None
+def clean_addresses_from_urls(urls: pd.Series) -> pd.Series:
+    """Derive title-cased addresses from Domain listing URL slugs.
 
-        # Split by domain
-        parts = url.split("www.domain.com.au/")[-1].split("?")[0]
-
-        # Remove ID at end (last numeric sequence after dash)
-        # But some addresses end in numbers, so be careful.
-        # Domain format usually: address-suburb-state-postcode-listingID
-
-        # safely split by hyphens
-        segments = parts.split("-")
-
-        # If the last segment is purely numeric and long (listing ID), drop it
-        if segments[-1].isdigit() and len(segments[-1]) > 6:
-            segments = segments[:-1]
-
-        # Rejoin and Title Case
-        slug = " ".join(segments)
-        return slug.title()
-    except Exception as e:
-        print(f"Error parsing URL {url}: {e}")
-        return None
+    Example: https://www.domain.com.au/5-dellwood-court-templestowe-vic-3106-2020402665
+    Non-string URLs give NA.
+    """
+    # Domain format usually: address-suburb-state-postcode-listingID
+    slugs = (
+        urls.astype("string")
+        .where(urls.map(type).eq(str))
+        .str.split("www.domain.com.au/")
+        .str[-1]
+        .str.split("?")
+        .str[0]
+    )
+    # Some addresses end in numbers, so only drop a long trailing listing ID
+    slugs = slugs.str.replace(r"(?:^|-)\d{7,}$", "", regex=True)
+    return slugs.str.replace("-", " ", regex=False).str.title()
 
 
 def clean_duplicates():
@@ -44,35 +35,38 @@ def clean_duplicates():
     print(f"Original count: {len(df)}")
 
     # Clean Addresses
-    fixed_count = 0
-    for idx, row in df.iterrows():
-        addr = str(row["address"])
-
-        # Heuristic: If address looks like a name (no digits) or matches known bad patterns
-        # Or if it came from the scraping bug (e.g. "Values", "Sold", Agent Name)
-        # Or if it contains a price symbol "$"
-        is_suspicious = False
-        if not any(c.isdigit() for c in addr):
-            is_suspicious = True
-        if "$" in addr:
-            is_suspicious = True
-
-        if is_suspicious:
-            new_addr = clean_address_from_url(row["url"])
-            if new_addr:
-                # Only update if new address looks better (has digits, no $)
-                if any(c.isdigit() for c in new_addr) and "$" not in new_addr:
-                    print(f"Fixing '{addr}' -> '{new_addr}'")
-                    df.at[idx, "address"] = new_addr
-                    fixed_count += 1
-
-    # Deduplicate
-    df.drop_duplicates(subset=["address"], keep="last", inplace=True)
+    # Heuristic: If address looks like a name (no digits) or matches known bad patterns
+    # Or if it came from the scraping bug (e.g. "Values", "Sold", Agent Name)
+    # Or if it contains a price symbol "$"
+    addrs = df["address"].astype(str)
+    is_suspicious = ~addrs.str.contains(r"\d") | addrs.str.contains("$", regex=False)
+
+    # Only update if new address looks better (has digits, no $)
+    new_addrs = clean_addresses_from_urls(df["url"])
+    looks_better = new_addrs.str.contains(r"\d", na=False) & ~new_addrs.str.contains(
+        "$", regex=False, na=True
+    )
+    fix = is_suspicious & looks_better
+
+    for old, new in zip(addrs[fix], new_addrs[fix]):
+        print(f"Fixing '{old}' -> '{new}'")
+    df.loc[fix, "address"] = new_addrs[fix]
+    fixed_count = int(fix.sum())
+
+    # Deduplicate: a hashed last-wins mask, so no deduplicated copy of the
+    # frame is built unless there is something to drop
+    dupes = df.duplicated(subset=["address"], keep="last")
+    dupe_count = int(dupes.sum())
 
     print(f"Fixed {fixed_count} addresses.")
-    print(f"Final unique count: {len(df)}")
+    print(f"Final unique count: {len(df) - dupe_count}")
+
+    # Repeat runs are usually no-ops; don't rewrite the whole report for nothing
+    if not fixed_count and not dupe_count:
+        print("Report already clean.")
+        return
 
-    df.to_csv(REPORT_PATH, index=False)
+    (df[~dupes] if dupe_count else df).to_csv(REPORT_PATH, index=False)
     print("Saved clean report.")
 
 
@@ -3,12 +3,13 @@ ABS QuickStats Scraper
 Fetches key demographics from the 2021 Census QuickStats page for a given LGA.
 
 Usage:
-    python scripts/connectors/abs_scraper.py <LGA_CODE>
+    python scripts/connectors/abs_scraper.py <LGA_CODE> [<LGA_CODE> ...]
 
 Example:
     python scripts/connectors/abs_scraper.py LGA18450
+    python scripts/connectors/abs_scraper.py LGA24210 LGA24650 LGA21110
 
-Returns JSON with:
+Returns JSON (keyed by LGA code when several are given) with:
     - Population
     - Median Age
     - Median Household Income
@@ -17,21 +18,53 @@ Returns JSON with:
 """
 
 import json
-import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared keep-alive session: every page is on www.abs.gov.au, so after the
+# first fetch requests skip the TCP/TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
+MAX_WORKERS = 8
+
+# Compiled once and reused for every LGA page. Header regexes are matched with
+# the EXSLT regular-expressions extension, which lxml supports natively.
+_NS = {"re": "http://exslt.org/regular-expressions"}
+_ROW_CELLS_BY_HEADER = etree.XPath(
+    "(//th[re:test(normalize-space(), $pattern, 'i')])[1]/ancestor::tr[1]//td",
+    namespaces=_NS,
+)
+_EDU_HEADING = etree.XPath(
+    "//text()[contains(., 'Level of highest educational attainment')]"
+)
+_BACHELOR_ROW_CELLS = etree.XPath(
+    "(//table[.//th[contains(., 'Bachelor Degree')]])[1]"
+    "//th[contains(., 'Bachelor Degree level and above')]/ancestor::tr[1]//td"
+)
 
 
 def scrape_abs_quickstats(lga_code):
     url = f"https://www.abs.gov.au/census/find-census-data/quickstats/2021/{lga_code}"
     try:
-        r = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+        r = SESSION.get(url)
         if r.status_code != 200:
             return {"error": f"Failed to fetch {url} (Status {r.status_code})"}
 
-        soup = BeautifulSoup(r.content, "html.parser")
+        tree = html.fromstring(r.content)
         data = {}
 
         # 1. Key Statistics (Top Table)
@@ -40,17 +73,10 @@ def scrape_abs_quickstats(lga_code):
 
         # Helper to find value by row header
         def get_value(header_text):
-            # Find th containing text
-            th = soup.find("th", string=re.compile(header_text, re.IGNORECASE))
-            if th:
-                # Value is in the next td? Or same row next cell?
-                # QuickStats tables: [Header] [Value]
-                # Sometimes tr -> th, td
-                tr = th.find_parent("tr")
-                if tr:
-                    tds = tr.find_all("td")
-                    if tds:
-                        return tds[0].text.strip().replace(",", "").replace("$", "")
+            # QuickStats tables: [Header] [Value], value in the same row
+            tds = _ROW_CELLS_BY_HEADER(tree, pattern=header_text)
+            if tds:
+                return tds[0].text_content().strip().replace(",", "").replace("$", "")
             return None
 
         data["Pop_Current"] = get_value(r"^People$")
@@ -61,32 +87,15 @@ def scrape_abs_quickstats(lga_code):
         # 2. Education (Bachelor or Higher)
         # Table: "Level of highest educational attainment"
         # Row: "Bachelor Degree level and above"
-        # Column: Percentage for the region (1st data col usually?)
-        # Let's verify table structure: Header row [Region, %, State, %, Aus, %]
-
-        edu_heading = soup.find(
-            string=re.compile(r"Level of highest educational attainment")
-        )
-        if edu_heading:
-            # Find the table following this heading
-            # The heading might be in a th or h2?
-            # Usually h2 -> table
-            table = None
-            # Traverse parents to find container, then look for table?
-            # Or strict search for table containing the text?
-            for t in soup.find_all("table"):
-                if t.find("th", string=re.compile("Bachelor Degree")):
-                    table = t
-                    break
-
-            if table:
-                row = table.find(
-                    "th", string=re.compile("Bachelor Degree level and above")
-                ).find_parent("tr")
-                cols = row.find_all("td")
-                if len(cols) > 1:
-                    # Col 0 is Count, Col 1 is %
-                    data["Tertiary_Quals_Pct"] = cols[1].text.strip().replace("%", "")
+        # Column: Percentage for the region
+        # Header row [Region, %, State, %, Aus, %]
+        if _EDU_HEADING(tree):
+            cols = _BACHELOR_ROW_CELLS(tree)
+            if len(cols) > 1:
+                # Col 0 is Count, Col 1 is %
+                data["Tertiary_Quals_Pct"] = (
+                    cols[1].text_content().strip().replace("%", "")
+                )
 
         # 3. Migration (Internal vs Overseas) is harder in QuickStats summary.
         # It's usually in "Country of birth" (Overseas born %)
@@ -100,13 +109,31 @@ def scrape_abs_quickstats(lga_code):
         return {"error": str(e)}
 
 
+def scrape_many(lga_codes, max_workers=MAX_WORKERS, pause=0.0):
+    """Scrape several LGAs concurrently; returns {lga_code: data}.
+
+    Each worker sleeps ``pause`` seconds after every fetch, so at most
+    ``max_workers`` requests per ``pause`` seconds reach abs.gov.au.
+    """
+
+    def fetch(lga_code):
+        data = scrape_abs_quickstats(lga_code)
+        if pause:
+            time.sleep(pause)  # Rate limit politely
+        return data
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return dict(zip(lga_codes, ex.map(fetch, lga_codes)))
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(json.dumps({"error": "No LGA code provided"}))
         sys.exit(1)
 
-    lga = sys.argv[1]
-    result = scrape_abs_quickstats(lga)
-    print(json.dumps(result, indent=2))
-    result = scrape_abs_quickstats(lga)
+    lgas = sys.argv[1:]
+    if len(lgas) == 1:
+        result = scrape_abs_quickstats(lgas[0])
+    else:
+        result = scrape_many(lgas)
     print(json.dumps(result, indent=2))
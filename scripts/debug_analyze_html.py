@@ -1,22 +1,46 @@
-import re
+import os
 
-with open("debug_domain_playwright.html", "r", encoding="utf-8") as f:
-    content = f.read()
+from lxml import etree
+
+HTML_PATH = "debug_domain_playwright.html"
 
 # Look for patterns
-print(f"Total length: {len(content)}")
+print(f"Total length: {os.path.getsize(HTML_PATH)}")
+
+# Stream the page element by element rather than reading it into memory;
+# only the attributes of interest are kept
+listing_classes = []
+testids = []
+has_css_classes = False
+for event, elem in etree.iterparse(HTML_PATH, events=("start", "end"), html=True):
+    if event == "end":
+        elem.clear(keep_tail=True)
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+        continue
+
+    # Attributes are read on "start" so hits stay in document order
+    cls = elem.get("class")
+    if cls:
+        if "listing" in cls:
+            listing_classes.append(cls)
+        if "css-" in cls:
+            has_css_classes = True
+    testid = elem.get("data-testid")
+    if testid is not None:
+        testids.append(testid)
 
 # Check for specific classes
-if "css-" in content:
+if has_css_classes:
     print("Found css- classes (styled components)")
 
-matches = re.findall(r'class="([^"]*listing[^"]*)"', content)
+matches = listing_classes
 print(f"Found {len(matches)} classes with 'listing':")
 for m in set(matches[:10]):
     print(f" - {m}")
 
 # Check for any data-testid
-matches = re.findall(r'data-testid="([^"]*)"', content)
+matches = testids
 print(f"Found {len(matches)} data-testids (total):")
 unique = sorted(list(set(matches)))
 for m in unique:
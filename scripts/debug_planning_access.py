@@ -2,6 +2,8 @@ import re
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -10,13 +12,25 @@ HEADERS = {
     "Referer": "https://www.google.com/",
 }
 
+# Shared keep-alive session so repeat checks skip the TCP/TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
+
 
 def check_planningalerts():
     # Use a real address search URL
     url = "https://www.planningalerts.org.au/applications?address=Doncaster+East+VIC"
     print(f"\nChecking PlanningAlerts: {url}")
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = SESSION.get(url, timeout=15)
         print(f"Status: {resp.status_code}")
         if resp.status_code == 200:
             # Simple regex to check for application items
@@ -50,7 +64,7 @@ def check_manningham():
     url = "https://www.manningham.vic.gov.au/planning-register"
     print(f"\nChecking Manningham Council: {url}")
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = SESSION.get(url, timeout=15)
         print(f"Status: {resp.status_code}")
 
         text_lower = resp.text.lower()
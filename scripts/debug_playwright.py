@@ -1,40 +1,71 @@
 import asyncio
+import sys
 
 from playwright.async_api import async_playwright
 
+UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+DEFAULT_URL = "https://www.domain.com.au/sold-listings/doncaster-vic-3108/?ptype=house,vacant-land&excludepricewithheld=1"
 
-async def debug():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        page = await context.new_page()
+# Not needed to inspect the markup, and most of a listing page's bytes
+BLOCKED_RESOURCES = {"image", "font", "media"}
 
-        url = "https://www.domain.com.au/sold-listings/doncaster-vic-3108/?ptype=house,vacant-land&excludepricewithheld=1"
-        print(f"Navigating to {url}...")
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            content = await page.content()
 
-            with open("debug_domain_playwright.html", "w", encoding="utf-8") as f:
-                f.write(content)
-            print("Saved debug_domain_playwright.html")
+class DomainBrowser:
+    """One Chromium launch and context shared by every page opened in it."""
 
-            # Check selectors
-            cards = await page.query_selector_all('[data-testid="listing-card"]')
-            print(f"Found {len(cards)} cards with primary selector")
+    async def __aenter__(self):
+        self.pw = await async_playwright().start()
+        self.browser = await self.pw.chromium.launch(headless=True)
+        self.ctx = await self.browser.new_context(user_agent=UA)
+        await self.ctx.route("**/*", self._block_heavy)
+        return self
 
-            cards2 = await page.query_selector_all('[class*="listing-result"]')
-            print(f"Found {len(cards2)} cards with secondary selector")
+    async def __aexit__(self, *exc):
+        await self.browser.close()
+        await self.pw.stop()
 
-        except Exception as e:
-            print(f"Error: {e}")
+    @staticmethod
+    async def _block_heavy(route):
+        if route.request.resource_type in BLOCKED_RESOURCES:
+            await route.abort()
+        else:
+            await route.continue_()
 
-        await browser.close()
+
+async def dump_page(browser, url, out_path):
+    page = await browser.ctx.new_page()
+    print(f"Navigating to {url}...")
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        content = await page.content()
+
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        print(f"Saved {out_path}")
+
+        # Check selectors
+        cards = await page.query_selector_all('[data-testid="listing-card"]')
+        print(f"Found {len(cards)} cards with primary selector")
+
+        cards2 = await page.query_selector_all('[class*="listing-result"]')
+        print(f"Found {len(cards2)} cards with secondary selector")
+
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        await page.close()
+
+
+async def debug(urls=(DEFAULT_URL,)):
+    async with DomainBrowser() as browser:
+        for i, url in enumerate(urls):
+            out_path = (
+                "debug_domain_playwright.html"
+                if len(urls) == 1
+                else f"debug_domain_playwright_{i}.html"
+            )
+            await dump_page(browser, url, out_path)
 
 
 if __name__ == "__main__":
-    asyncio.run(debug())
-if __name__ == "__main__":
-    asyncio.run(debug())
+    asyncio.run(debug(sys.argv[1:] or (DEFAULT_URL,)))
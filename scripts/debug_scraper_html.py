@@ -1,18 +1,33 @@
 import sys
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared keep-alive session so repeat fetches skip the TCP/TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    }
+)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
 
 
 def debug_domain():
     # URL for Donvale, >3000sqm
     url = "https://www.domain.com.au/sale/donvale-vic-3111/?landsize-min=3000"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
 
     print(f"Fetching {url}...")
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = SESSION.get(url, timeout=10)
         print(f"Status: {resp.status_code}")
         with open("debug_domain.html", "w", encoding="utf-8") as f:
             f.write(resp.text)
@@ -29,5 +44,3 @@ def debug_domain():
 
 if __name__ == "__main__":
     debug_domain()
-if __name__ == "__main__":
-    debug_domain()
@@ -2,8 +2,10 @@ import argparse
 import asyncio
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from rich.console import Console
 
@@ -13,7 +15,12 @@ sys.path.insert(0, os.path.join(os.getcwd(), "src"))
 from scanner.feasibility.dual_occ import DualOccFeasibility
 from scanner.ingest.domain import DomainScraper
 from scanner.ingest.rea import REAScraper
-from scanner.market.database import get_db, get_suburb_stats, init_db, save_comparable
+from scanner.market.database import (
+    get_db,
+    get_suburb_stats,
+    init_db,
+    save_comparables,
+)
 from scanner.models import Site
 
 # Initialize DB
@@ -23,98 +30,216 @@ console = Console()
 
 TARGET_SUBURBS_FILE = Path("config/suburbs_eastern.txt")
 REPORT_PATH = Path("reports/dual_occ_candidates.csv")
+SCRAPE_CONCURRENCY = 3  # Browsers scraping suburbs at once
+ASSESS_WORKERS = 2  # Feasibility consumers fed by the scrapers
+LISTING_QUEUE_SIZE = 200  # Scraped suburbs waiting for feasibility
+DEFAULT_GRV = {"value": 1_500_000, "median": 1_300_000, "count": 0}
 
 
-async def get_sold_data(suburbs: list[str], scraper) -> dict[str, dict]:
-    """Get median sold price for 3-4 bed houses to use as GRV proxy."""
-    grv_map = {}
-    console.print("[bold cyan]Updating GRV/Sold Data...[/bold cyan]")
+@lru_cache(maxsize=512)
+def _cached_stats(sub: str) -> dict | None:
+    """Suburb sold stats, looked up once per process."""
+    with next(get_db()) as db:
+        return get_suburb_stats(db, sub)
 
-    for sub in suburbs:
-        # Check DB first
+
+def save_sold_batch(listings: list[dict]) -> int:
+    """Save sold comparables in one transaction for the whole suburb."""
+    with next(get_db()) as db:
+        return save_comparables(db, listings)
+
+
+def grv_from_db(sub: str) -> dict | None:
+    """GRV from stored sold comparables, if there are enough of them."""
+    try:
+        stats = _cached_stats(sub)
+        if stats and stats["count"] >= 10:
+            console.print(f"  [dim]Using DB stats for {sub} (n={stats['count']})[/dim]")
+            return {
+                "value": stats["p80"],
+                "median": stats["median"],
+                "count": stats["count"],
+                "min": stats["min"],
+                "max": stats["max"],
+            }
+    except Exception as db_e:
+        console.print(f"[dim]DB lookup failed for {sub}: {db_e}[/dim]")
+    return None
+
+
+async def scrape_grv(sub: str, scraper) -> dict:
+    """Get median sold price for 3-4 bed houses in a suburb to use as GRV proxy."""
+    console.print(f"  Fetching fresh sold data for {sub}...")
+    try:
+        # REA Scraper checks (it has sold scraper now)
+        if isinstance(scraper, REAScraper):
+            listings = await scraper.scrape_sold(sub, max_pages=1)
+        else:
+            listings = await scraper.scrape_suburb(
+                sub,
+                max_pages=1,
+                search_type="sold",
+                property_types=["house", "townhouse"],
+            )
+
+        # Save to DB first, off the event loop so other scrapes keep going
         try:
-            with next(get_db()) as db:
-                stats = get_suburb_stats(db, sub)
-                if stats and stats["count"] >= 10:
-                    console.print(
-                        f"  [dim]Using DB stats for {sub} (n={stats['count']})[/dim]"
-                    )
-                    grv_map[sub.lower()] = {
-                        "value": stats["p80"],
-                        "median": stats["median"],
-                        "count": stats["count"],
-                        "min": stats["min"],
-                        "max": stats["max"],
-                    }
-                    continue
+            await asyncio.to_thread(save_sold_batch, listings)
         except Exception as db_e:
-            console.print(f"[dim]DB lookup failed for {sub}: {db_e}[/dim]")
+            console.print(f"[red]DB Save Error: {db_e}[/red]")
+
+        prices = []
+        for listing in listings:
+            # Get price for map
+            p = listing.get("sold_price")
+            if not p:
+                # Fallback parse
+                from scanner.market.utils import parse_sold_price
+
+                p = parse_sold_price(listing.get("price_text", ""))
+
+            if p and p > 600000:
+                prices.append(p)
+
+        if prices:
+            # Order statistics by O(n) selection rather than a full sort
+            arr = np.asarray(prices)
+            n = len(arr)
+            k_grv = int(n * 0.8) if n > 1 else 0
+            k_median = n // 2
+            ranked = np.partition(arr, [k_median, k_grv])
+            grv = ranked[k_grv].item()
+            median_price = ranked[k_median].item()
+
+            console.print(
+                f"  [green]Est GRV for {sub}: ${grv/1e6:.2f}M (n={n}) | Median: ${median_price/1e6:.2f}M[/green]"
+            )
+            return {
+                "value": grv,
+                "median": median_price,
+                "count": n,
+                "min": arr.min().item(),
+                "max": arr.max().item(),
+            }
+
+        console.print(f"  [yellow]No sold data for {sub}, using default[/yellow]")
+        return dict(DEFAULT_GRV)
+
+    except Exception as e:
+        console.print(f"[red]Error fetching sold data: {e}[/red]")
+        return dict(DEFAULT_GRV)
+
+
+async def scrape_listings(sub: str, scraper, source: str) -> list[dict]:
+    """Scrape one suburb's for-sale listings."""
+    if source == "rea":
+        # REAScraper default scrape_suburb signature
+        return await scraper.scrape_suburb(sub, max_pages=3)
+    return await scraper.scrape_suburb(
+        sub,
+        max_pages=3,
+        search_type="sale",
+        land_size_min=650,  # Dual Occ minimum for Domain
+    )
 
-        # REA Scraper checks (it has sold scraper now)
-        is_rea = "rea" in str(type(scraper)).lower()
 
-        console.print(f"  Fetching fresh sold data for {sub}...")
-        try:
-            if is_rea:
-                listings = await scraper.scrape_sold(sub, max_pages=1)
-            else:
-                listings = await scraper.scrape_suburb(
-                    sub,
-                    max_pages=1,
-                    search_type="sold",
-                    property_types=["house", "townhouse"],
-                )
+def fix_addresses(listings: list[dict]) -> list:
+    """Listing addresses, rebuilt from the URL slug where they look invalid.
+
+    An address is invalid if it is empty, contains a price or has no digits.
+    Listings without a usable URL keep their original address.
+    """
+    addrs = pd.Series([lst.get("address", "") for lst in listings], dtype=object)
+    urls = pd.Series([lst.get("url", "") for lst in listings], dtype=object)
+
+    text = addrs.where(addrs.map(type).eq(str)).astype("string")
+    invalid = (
+        text.isna()
+        | text.eq("")
+        | text.str.contains("$", regex=False)
+        | ~text.str.contains(r"\d")
+    ).fillna(True)
+    fixable = invalid & urls.map(type).eq(str)
+    if not fixable.any():
+        return addrs.tolist()
+
+    # Extract slug from URL: domain.com.au/address-suburb-listingID
+    slugs = (
+        urls[fixable]
+        .astype("string")
+        .str.split("domain.com.au/")
+        .str[-1]
+        .str.split("?")
+        .str[0]
+        .str.rsplit("/", n=1)
+        .str[-1]
+        # Remove listing ID if it looks like one (last part is long digit)
+        .str.replace(r"(?:^|-)\d{6,}$", "", regex=True)
+    )
+    addrs[fixable] = slugs.str.replace("-", " ", regex=False).str.title()
+    return addrs.tolist()
+
+
+def assess_listings(
+    listings: list[dict], scraper, grv_data: dict, source: str
+) -> list[dict]:
+    """Return the viable dual-occ candidates among a suburb's listings."""
+    candidates = []
+    grv_val = grv_data["value"]
+    addresses = fix_addresses(listings)
+
+    for listing, raw_addr in zip(listings, addresses):
+        # Convert to Site object for feasibility
+        p_low, p_high, p_guide = scraper.parse_price(listing.get("price_text", ""))
+
+        site = Site(
+            address_raw=raw_addr,
+            suburb=listing.get("suburb"),
+            land_size_listed=listing.get("land_size_m2"),
+            price_guide=p_guide,
+            price_low=p_low,
+            price_high=p_high,
+        )
 
-            prices = []
-            for listing in listings:
-                # Save to DB first
-                try:
-                    with next(get_db()) as db:
-                        save_comparable(db, listing)
-                except Exception as db_e:
-                    console.print(f"[red]DB Save Error: {db_e}[/red]")
-
-                # Get price for map
-                p = listing.get("sold_price")
-                if not p:
-                    # Fallback parse
-                    from scanner.market.utils import parse_sold_price
-
-                    p = parse_sold_price(listing.get("price_text", ""))
-
-                if p and p > 600000:
-                    prices.append(p)
-
-            if prices:
-                prices.sort()
-                grv = prices[int(len(prices) * 0.8) if len(prices) > 1 else 0]
-                median_price = prices[len(prices) // 2]
-
-                grv_map[sub.lower()] = {
-                    "value": grv,
-                    "median": median_price,
-                    "count": len(prices),
-                    "min": prices[0],
-                    "max": prices[-1],
+        # Basic filter (Land Size Check)
+        # Domain filters server-side, REA might not so we double check strictly
+        if not site.land_size_listed or site.land_size_listed < 650:
+            continue
+
+        # Feasibility
+        feas = DualOccFeasibility(site)
+
+        result = feas.calculate_margin(grv_val)
+
+        if result["viable"]:
+            console.print(
+                f"[bold green]FOUND: {site.address_raw} | Margin: {result['margin_percent']:.1f}%[/bold green]"
+            )
+            candidates.append(
+                {
+                    "address": site.address_raw,
+                    "suburb": site.suburb,
+                    "price": site.price_guide,
+                    "land": site.land_size_listed,
+                    "est_grv": grv_val,
+                    "grv_median": grv_data["median"],
+                    "grv_sold_count": grv_data["count"],
+                    "margin": result["margin_percent"],
+                    "profit": result["profit"],
+                    "url": listing.get("url"),
+                    "source": source,
+                    # Detailed Feasibility
+                    "product_type": result["product"],
+                    "target_gfa": result["target_gfa_sq"],
+                    "build_rate": result["build_rate_m2"],
+                    "est_build_cost": result["est_construction_cost"],
+                    "acq_cost": result["site_acquisition_cost"],
+                    "finance_cost": result["finance_cost"],
+                    "consultants": result["consultants_fees"],
                 }
-                console.print(
-                    f"  [green]Est GRV for {sub}: ${grv/1e6:.2f}M (n={len(prices)}) | Median: ${median_price/1e6:.2f}M[/green]"
-                )
-            else:
-                console.print(
-                    f"  [yellow]No sold data for {sub}, using default[/yellow]"
-                )
-                grv_map[sub.lower()] = {
-                    "value": 1_500_000,
-                    "median": 1_300_000,
-                    "count": 0,
-                }
-
-        except Exception as e:
-            console.print(f"[red]Error fetching sold data: {e}[/red]")
-            grv_map[sub.lower()] = {"value": 1_500_000, "median": 1_300_000, "count": 0}
+            )
 
-    return grv_map
+    return candidates
 
 
 async def find_sites(source: str = "domain"):
@@ -128,19 +253,53 @@ async def find_sites(source: str = "domain"):
         if sub_line.strip()
     ]
 
+    # Stats may have changed since a previous scan in this process
+    _cached_stats.cache_clear()
+
     console.print(f"[bold]Starting scan with source: {source.upper()}[/bold]")
-    if source == "rea":
-        scraper = REAScraper()
-    else:
-        scraper = DomainScraper()
 
-    await scraper.start()
+    # Each worker needs its own browser page, so concurrency is bounded by
+    # a small pool of started scrapers shared by GRV and listing scrapes.
+    # Only the first launches Chromium; the rest open contexts in it
+    scraper_cls = REAScraper if source == "rea" else DomainScraper
+    n_workers = max(1, min(SCRAPE_CONCURRENCY, len(suburbs)))
+    scrapers = [scraper_cls()]
+    pool = asyncio.Queue()
 
     try:
+        await scrapers[0].start()
+        extra = [scraper_cls(browser=scrapers[0].browser) for _ in range(n_workers - 1)]
+        scrapers.extend(extra)
+        await asyncio.gather(*(s.start() for s in extra))
+        for s in scrapers:
+            pool.put_nowait(s)
+
+        async def with_worker(job):
+            worker = await pool.get()
+            try:
+                return await job(worker)
+            finally:
+                # Polite pause per browser before it takes the next scrape
+                await asyncio.sleep(5)
+                pool.put_nowait(worker)
+
         # 1. Get GRV Data
         # We only do a subset to save time for this run, or all if small list
         gr_suburbs = suburbs[:5]  # Limit for demo speed, user can expand
-        grv_map = await get_sold_data(gr_suburbs, scraper)
+        console.print("[bold cyan]Updating GRV/Sold Data...[/bold cyan]")
+
+        # DB lookups up front, so grv_for takes a worker without pausing first
+        db_grv = await asyncio.gather(
+            *(asyncio.to_thread(grv_from_db, sub) for sub in gr_suburbs)
+        )
+        db_grv = dict(zip(gr_suburbs, db_grv))
+
+        async def grv_for(sub):
+            return db_grv[sub] or await with_worker(lambda w: scrape_grv(sub, w))
+
+        # Started before the listing scrapes so they queue for a worker first;
+        # a suburb's listings only wait on its GRV once they are scraped
+        grv_tasks = {sub: asyncio.create_task(grv_for(sub)) for sub in gr_suburbs}
 
         # 2. Find Sites
         console.print(
@@ -148,108 +307,42 @@ async def find_sites(source: str = "domain"):
         )
         candidates = []
 
-        for sub in suburbs:
-            # Scrape Listings
-            if source == "rea":
-                # REAScraper default scrape_suburb signature
-                listings = await scraper.scrape_suburb(sub, max_pages=3)
-            else:
-                listings = await scraper.scrape_suburb(
-                    sub,
-                    max_pages=3,
-                    search_type="sale",
-                    land_size_min=650,  # Dual Occ minimum for Domain
-                )
-
-            for listing in listings:
-                # Convert to Site object for feasibility
-                p_low, p_high, p_guide = scraper.parse_price(
-                    listing.get("price_text", "")
-                )
-
-                raw_addr = listing.get("address", "")
-                url = listing.get("url", "")
-
-                # If address looks invalid (contains price or no digits), try to fix from URL
-                if (
-                    not raw_addr
-                    or "$" in raw_addr
-                    or not any(c.isdigit() for c in raw_addr)
-                ):
-                    try:
-                        # Extract slug from URL: domain.com.au/address-suburb-listingID
-                        # Remove common prefixes/suffixes
-                        parts = url.split("domain.com.au/")[-1].split("?")[0]
-                        if "/" in parts:
-                            parts = parts.split("/")[-1]
-
-                        slug_parts = parts.split("-")
-                        # Remove listing ID if it looks like one (last part is long digit)
-                        if (
-                            slug_parts
-                            and slug_parts[-1].isdigit()
-                            and len(slug_parts[-1]) > 5
-                        ):
-                            slug_parts.pop()
-
-                        raw_addr = " ".join(slug_parts).title()
-                    except Exception:
-                        pass  # Keep original if fix fails
-
-                site = Site(
-                    address_raw=raw_addr,
-                    suburb=listing.get("suburb"),
-                    land_size_listed=listing.get("land_size_m2"),
-                    price_guide=p_guide,
-                    price_low=p_low,
-                    price_high=p_high,
-                )
-
-                # Basic filter (Land Size Check)
-                # Domain filters server-side, REA might not so we double check strictly
-                if not site.land_size_listed or site.land_size_listed < 650:
-                    continue
-
-                # Feasibility
-                feas = DualOccFeasibility(site)
-
-                # Look up GRV
-                grv_data = grv_map.get(
-                    sub.lower(), {"value": 1_500_000, "median": 1_300_000, "count": 0}
-                )
-                grv_val = grv_data["value"]
-
-                result = feas.calculate_margin(grv_val)
-
-                if result["viable"]:
-                    console.print(
-                        f"[bold green]FOUND: {site.address_raw} | Margin: {result['margin_percent']:.1f}%[/bold green]"
-                    )
-                    candidates.append(
-                        {
-                            "address": site.address_raw,
-                            "suburb": site.suburb,
-                            "price": site.price_guide,
-                            "land": site.land_size_listed,
-                            "est_grv": grv_val,
-                            "grv_median": grv_data["median"],
-                            "grv_sold_count": grv_data["count"],
-                            "margin": result["margin_percent"],
-                            "profit": result["profit"],
-                            "url": listing.get("url"),
-                            "source": source,
-                            # Detailed Feasibility
-                            "product_type": result["product"],
-                            "target_gfa": result["target_gfa_sq"],
-                            "build_rate": result["build_rate_m2"],
-                            "est_build_cost": result["est_construction_cost"],
-                            "acq_cost": result["site_acquisition_cost"],
-                            "finance_cost": result["finance_cost"],
-                            "consultants": result["consultants_fees"],
-                        }
+        # Scrapers produce each suburb's listings onto a queue and consumers
+        # run feasibility on them, so assessment overlaps the next scrapes
+        listings_q = asyncio.Queue(maxsize=LISTING_QUEUE_SIZE)
+        results = {}
+
+        async def produce(sub):
+            try:
+                listings = await with_worker(lambda w: scrape_listings(sub, w, source))
+            except Exception as e:
+                console.print(f"[red]Scan failed for {sub}: {e}[/red]")
+                return
+            await listings_q.put((sub, listings))
+
+        async def consume():
+            while (item := await listings_q.get()) is not None:
+                sub, listings = item
+                try:
+                    grv_data = await grv_tasks[sub] if sub in grv_tasks else DEFAULT_GRV
+                    # Off the event loop, so the browsers keep being driven
+                    results[sub] = await asyncio.to_thread(
+                        assess_listings, listings, scrapers[0], grv_data, source
                     )
+                except Exception as e:
+                    console.print(f"[red]Scan failed for {sub}: {e}[/red]")
 
-            await asyncio.sleep(5)
+        consumers = [asyncio.create_task(consume()) for _ in range(ASSESS_WORKERS)]
+        await asyncio.gather(*(produce(sub) for sub in suburbs))
+        for _ in consumers:
+            await listings_q.put(None)
+        await asyncio.gather(*consumers)
+
+        # Report in suburb order, whatever order the scrapes finished in
+        for sub in suburbs:
+            candidates.extend(results.get(sub, []))
+        # Let GRV scrapes for suburbs whose listings failed finish saving
+        await asyncio.gather(*grv_tasks.values(), return_exceptions=True)
 
         # Report
         if candidates:
@@ -257,12 +350,16 @@ async def find_sites(source: str = "domain"):
 
             if REPORT_PATH.exists():
                 try:
-                    existing_df = pd.read_csv(REPORT_PATH)
-                    # Combine and deduplicate
-                    combined_df = pd.concat([existing_df, new_df])
-                    # Keep last to effectively update listing details if re-scraped
-                    combined_df = combined_df.drop_duplicates(
-                        subset=["address"], keep="last"
+                    existing_df = pd.read_csv(
+                        REPORT_PATH, dtype={"address": "string"}, engine="c"
+                    )
+                    # New rows win, to update listing details if re-scraped.
+                    # Dropping superseded rows before the concat hashes only
+                    # the new addresses instead of the whole combined frame
+                    new_df = new_df.drop_duplicates(subset=["address"], keep="last")
+                    kept = existing_df[~existing_df["address"].isin(new_df["address"])]
+                    combined_df = pd.concat(
+                        [kept.drop_duplicates(subset=["address"], keep="last"), new_df]
                     )
 
                     combined_df.to_csv(REPORT_PATH, index=False)
@@ -283,7 +380,9 @@ async def find_sites(source: str = "domain"):
             console.print("\n[yellow]No candidates found[/yellow]")
 
     finally:
-        await scraper.stop()
+        # Contexts first, then the shared browser they live in
+        await asyncio.gather(*(s.stop() for s in scrapers[1:]), return_exceptions=True)
+        await scrapers[0].stop()
 
 
 if __name__ == "__main__":
@@ -41,4 +41,3 @@ def fix_format():
 
 if __name__ == "__main__":
     fix_format()
-    fix_format()
@@ -13,58 +13,104 @@ for key analysis points:
 import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 # ── Config ─────────────────────────────────────────────────────
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 EXPORT_DIR = DATA_DIR / "exports"
 INPUT_CSV = DATA_DIR / "market_scan_data.csv"
+# Typed copy of INPUT_CSV; pickle keeps the category dtypes and needs no extra deps
+INPUT_CACHE = DATA_DIR / "market_scan_data.pkl"
+
+
+# Only what the exports use; repeated labels are stored as categories.
+# Growth_Rate is left to inference so the exports copy its source text
+INPUT_COLS = ["Tab", "Region", "Metric", "Value", "Growth_Rate", "Source", "Notes"]
+INPUT_DTYPES = {
+    "Tab": "category",
+    "Region": "category",
+    "Source": "category",
+    "Value": "string",
+    "Notes": "string",
+}
 
 
 # ── Logic (Mirrors JS) ─────────────────────────────────────────
-def clean_growth(val):
-    try:
-        if pd.isna(val) or val == "N/A":
-            return None
-        return float(val)
-    except:
-        return None
+# Same pattern as the dashboard's DA-days check, so kept case-sensitive
+_DAYS_RE = re.compile(r"(\d+)\s*[Dd]ays")
 
 
-def assign_priority(row):
-    gr = clean_growth(row.get("Growth_Rate"))
-    if gr is None:
-        return "Medium"
-    if gr >= 0.02:
-        return "High"
-    if gr >= 0:
-        return "Medium"
-    return "Low"
+def clean_growth(values: pd.Series) -> pd.Series:
+    """Growth rates as floats; "N/A" and other text become NaN."""
+    return pd.to_numeric(values, errors="coerce")
 
 
-def compute_kill_status(row):
-    val = str(row.get("Value", ""))
-    gr = clean_growth(row.get("Growth_Rate"))
-    tab = row.get("Tab")
+def assign_priority(gr: pd.Series) -> pd.Series:
+    """Priority per row from cleaned growth rates (NaN = unknown)."""
+    return pd.Series(
+        np.select(
+            [gr.isna(), gr >= 0.02, gr >= 0], ["Medium", "High", "Medium"], "Low"
+        ),
+        index=gr.index,
+    )
 
-    # 1. Check DA Time > 90 days
-    days_match = re.search(r"(\d+)\s*[Dd]ays", val)
-    if days_match:
-        days = int(days_match.group(1))
-        if days > 90:
-            return "KILL", 0, f"DA {days}d > 90d"
 
-    # 2. Check Yield < 4% (Feasibility only)
-    if tab == "Feasibility" and gr is not None and gr < 0.04:
-        return "KILL", 0, f"Yield {gr*100:.1f}% < 4%"
+def compute_kill_status(df: pd.DataFrame, gr: pd.Series) -> pd.DataFrame:
+    """Kill_Status / Kill_Score / Kill_Reason for every row at once."""
+    status = pd.Series("GO", index=df.index, dtype=object)
+    score = pd.Series("-", index=df.index, dtype=object)
+    reason = pd.Series("", index=df.index, dtype=object)
 
     # 3. Calculate Score
-    if gr is not None:
-        base = gr + (gr if gr > 0 else 0)
-        score = round(base * 100)
-        return "GO", max(score, 1), ""
+    has_gr = gr.notna()
+    base = gr + gr.clip(lower=0)
+    score[has_gr] = np.maximum(np.rint(base[has_gr] * 100), 1).astype(int).tolist()
 
-    return "GO", "-", ""
+    # 2. Check Yield < 4% (Feasibility only)
+    kill_yield = (df["Tab"] == "Feasibility") & (gr < 0.04)
+    status[kill_yield] = "KILL"
+    score[kill_yield] = 0
+    reason[kill_yield] = (
+        "Yield " + (gr[kill_yield] * 100).map("{:.1f}".format) + "% < 4%"
+    )
+
+    # 1. Check DA Time > 90 days (takes precedence)
+    days = pd.to_numeric(df["Value"].astype(str).str.extract(_DAYS_RE, expand=False))
+    kill_days = days > 90
+    status[kill_days] = "KILL"
+    score[kill_days] = 0
+    reason[kill_days] = "DA " + days[kill_days].astype(int).astype(str) + "d > 90d"
+
+    return pd.DataFrame(
+        {"Kill_Status": status, "Kill_Score": score, "Kill_Reason": reason}
+    )
+
+
+def load_scan(csv_path: Path, cache_path: Path) -> pd.DataFrame | None:
+    """Load the scan, preferring the typed cache while it is newer than the CSV."""
+    try:
+        csv_mtime = csv_path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= csv_mtime:
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception as e:
+            print(f"Ignoring unreadable cache {cache_path.name}: {e}")
+
+    df = pd.read_csv(
+        csv_path,
+        usecols=INPUT_COLS,
+        dtype=INPUT_DTYPES,
+        engine="c",
+    )
+    try:
+        df.to_pickle(cache_path)
+    except OSError as e:
+        print(f"Could not write cache {cache_path.name}: {e}")
+    return df
 
 
 # ── Main ───────────────────────────────────────────────────────
@@ -72,19 +118,15 @@ def main():
     EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
     # Load Data
-    try:
-        df = pd.read_csv(INPUT_CSV)
-    except FileNotFoundError:
+    df = load_scan(INPUT_CSV, INPUT_CACHE)
+    if df is None:
         print(f"Error: {INPUT_CSV} not found.")
         return
 
     # Enrich Data
-    df["Priority"] = df.apply(assign_priority, axis=1)
-
-    kill_results = df.apply(compute_kill_status, axis=1)
-    df["Kill_Status"] = [x[0] for x in kill_results]
-    df["Kill_Score"] = [x[1] for x in kill_results]
-    df["Kill_Reason"] = [x[2] for x in kill_results]
+    gr = clean_growth(df["Growth_Rate"])
+    df["Priority"] = assign_priority(gr)
+    df[["Kill_Status", "Kill_Score", "Kill_Reason"]] = compute_kill_status(df, gr)
 
     # ── Export 1: Full Scan (Market Overview) ──────────────────
     feature_cols = [
@@ -104,27 +146,24 @@ def main():
     full_df.to_csv(EXPORT_DIR / "01_Full_Market_Scan.csv", index=False)
     print("✅ Exported: 01_Full_Market_Scan.csv")
 
-    # ── Export 2: High Priority (Growth Targets) ───────────────
-    high_pri = full_df[full_df["Priority"] == "High"]
-    high_pri.to_csv(EXPORT_DIR / "02_High_Growth_Priority.csv", index=False)
-    print("✅ Exported: 02_High_Growth_Priority.csv")
-
-    # ── Export 3: GO Status (Qualified Opportunities) ──────────
-    go_status = full_df[full_df["Kill_Status"] == "GO"]
-    go_status.to_csv(EXPORT_DIR / "03_GO_Status_Opportunities.csv", index=False)
-    print("✅ Exported: 03_GO_Status_Opportunities.csv")
-
-    # ── Export 4: Wollongong Deep Dive ─────────────────────────
-    wollongong = full_df[full_df["Region"] == "Wollongong"]
-    wollongong.to_csv(EXPORT_DIR / "04_Wollongong_Deep_Dive.csv", index=False)
-    print("✅ Exported: 04_Wollongong_Deep_Dive.csv")
-
-    # ── Export 5: Competition Summary ──────────────────────────
-    competition = full_df[full_df["Tab"] == "Competition"]
-    competition.to_csv(EXPORT_DIR / "05_Competition_Summary.csv", index=False)
-    print("✅ Exported: 05_Competition_Summary.csv")
+    # Exports 2-5 are single-value slices: pull each one from the groupby
+    # index rather than building a fresh boolean mask over the whole frame
+    def partition(col: str, value: str) -> pd.DataFrame:
+        try:
+            return full_df.groupby(col, observed=True).get_group(value)
+        except KeyError:
+            return full_df.iloc[:0]
+
+    subsets = [
+        ("Priority", "High", "02_High_Growth_Priority.csv"),
+        ("Kill_Status", "GO", "03_GO_Status_Opportunities.csv"),
+        ("Region", "Wollongong", "04_Wollongong_Deep_Dive.csv"),
+        ("Tab", "Competition", "05_Competition_Summary.csv"),
+    ]
+    for col, value, filename in subsets:
+        partition(col, value).to_csv(EXPORT_DIR / filename, index=False)
+        print(f"✅ Exported: {filename}")
 
 
 if __name__ == "__main__":
     main()
-    main()
@@ -1,13 +1,20 @@
+import asyncio
+import atexit
 import datetime
 import os
 import random
 import subprocess
 import sys
-import time
 from pathlib import Path
 
 from rich.console import Console
 
+# Add src to path
+sys.path.insert(0, os.path.join(os.getcwd(), "src"))
+
+from scanner.ingest.domain import DomainScraper, scrape_sold_domain
+from scanner.ingest.rea import REAScraper, scrape_sold_rea
+
 # Rich console for terminal output
 console = Console()
 
@@ -27,6 +34,10 @@ AU_LOCATIONS = {
 
 LOG_FILE = "harvest.log"
 
+# Opened once and line-buffered, rather than reopened for every log line
+_LOG_FH = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+atexit.register(_LOG_FH.close)
+
 
 def log(text, style=None):
     if style:
@@ -35,27 +46,65 @@ def log(text, style=None):
         console.print(text)
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {text}\n")
+        _LOG_FH.write(f"[{timestamp}] {text}\n")
     except Exception as e:
         console.print(f"[red]Logging failed:[/red] {e}")
 
 
-def run_vpn_command(args, check=True):
-    cmd = [VPN_CLI] + args
+async def run_vpn_command(args, check=True):
     try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, check=check, cwd=os.getcwd()
+        proc = await asyncio.create_subprocess_exec(
+            VPN_CLI,
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=os.getcwd(),
         )
-        if result.stdout.strip():
-            log(f"VPN: {result.stdout.strip()}", style="dim")
-        return result
+        stdout, stderr = await proc.communicate()
+        if check and proc.returncode != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, [VPN_CLI] + args, stdout, stderr
+            )
+        output = stdout.decode("utf-8", errors="replace").strip()
+        if output:
+            log(f"VPN: {output}", style="dim")
+        return proc
     except Exception as e:
         log(f"VPN Command Failed: {e}", style="red")
         return None
 
 
-def main():
+async def rotate_vpn():
+    """Reconnect the VPN through a random Australian location."""
+    loc_id = random.choice(list(AU_LOCATIONS.keys()))
+
+    # Disconnect first to ensure a fresh session
+    await run_vpn_command(["disconnect"], check=False)
+    await asyncio.sleep(2)
+
+    log(f"Connecting VPN: {AU_LOCATIONS[loc_id]}")
+    await run_vpn_command(["connect", loc_id])
+    await asyncio.sleep(12)  # Wait for connection stabilization
+
+
+# Scraper class, sold-scrape entry point and pages per suburb for each source
+SOURCES = {
+    "domain": (DomainScraper, scrape_sold_domain, 3),
+    "rea": (REAScraper, scrape_sold_rea, 1),
+}
+
+
+async def drop_scraper(scrapers, source):
+    """Close a scraper left in an unknown state; the next use starts afresh."""
+    scraper = scrapers.pop(source, None)
+    if scraper:
+        try:
+            await scraper.stop()
+        except Exception as e:
+            log(f"Scraper stop failed: {e}", style="dim")
+
+
+async def main():
     suburbs = [
         "Doncaster East",
         "Doncaster",
@@ -73,96 +122,62 @@ def main():
 
     # Reset VPN first
     log("Resetting VPN...", style="dim")
-    run_vpn_command(["disconnect"], check=False)
-    time.sleep(2)
+    await run_vpn_command(["disconnect"], check=False)
+    await asyncio.sleep(2)
 
-    for i, suburb in enumerate(suburbs):
-        # 1. Rotate VPN every suburb to be safe
-        loc_id = random.choice(list(AU_LOCATIONS.keys()))
-        log(f"\n[bold green]--- {suburb} ({i+1}/{len(suburbs)}) ---[/bold green]")
+    # 1. Rotate VPN every suburb to be safe. The first connect happens up
+    # front; later ones run during the break before their suburb
+    await rotate_vpn()
 
-        # Disconnect first to ensure a fresh session
-        run_vpn_command(["disconnect"], check=False)
-        time.sleep(2)
+    scrapers = {}
+    try:
+        await harvest(suburbs, scrapers)
+    finally:
+        for scraper in scrapers.values():
+            await scraper.stop()
+
+    await run_vpn_command(["disconnect"], check=False)
+    log("\n✨ Harvest Complete.", style="bold blue")
 
-        log(f"Connecting VPN: {AU_LOCATIONS[loc_id]}")
-        run_vpn_command(["connect", loc_id])
-        time.sleep(12)  # Wait for connection stabilization
+
+async def harvest(suburbs, scrapers):
+    for i, suburb in enumerate(suburbs):
+        log(f"\n[bold green]--- {suburb} ({i+1}/{len(suburbs)}) ---[/bold green]")
 
         # 2. Pick Source - Domain is currently more reliable for SOLD data
         # We'll do 3 Domain for every 1 REA attempt, or just stick to Domain if REA blocks
         source = "domain" if random.random() < 0.8 else "rea"
         log(f"Selected Source: {source.upper()}", style="cyan")
 
-        # 3. Build Command
-        cmd = [
-            "poetry",
-            "run",
-            "python",
-            "-m",
-            f"scanner.ingest.{source}",
-            "--suburb",
-            suburb,
-            "--type",
-            "sold",
-            "--limit",
-            "3" if source == "domain" else "1",
-        ]
-
-        log(f"Running: {' '.join(cmd)}", style="dim")
-
+        # 3. Scrape in this process; each source's browser is started on first
+        # use and reused for later suburbs instead of a fresh interpreter each
+        scraper_cls, scrape_sold, max_pages = SOURCES[source]
         try:
-            # Run and stream output
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                encoding="utf-8",
-                cwd=os.getcwd(),
+            if source not in scrapers:
+                scrapers[source] = scraper_cls()
+                await scrapers[source].start()
+
+            # 5 min timeout per suburb
+            saved = await asyncio.wait_for(
+                scrape_sold([suburb], max_pages=max_pages, scraper=scrapers[source]),
+                timeout=300,
             )
+            log(f"✅ Finished {suburb} ({saved} saved)", style="green")
 
-            # Read output in real-time
-            if process.stdout:
-                for line in process.stdout:
-                    clean_line = line.rstrip()
-                    if clean_line:
-                        # Skip noise like 'ValueError' cleanup logs if possible,
-                        # but show the core progress
-                        if (
-                            "ValueError" not in clean_line
-                            and "Traceback" not in clean_line
-                        ):
-                            print(f"  {clean_line}")
-
-            process.wait(timeout=300)  # 5 min timeout per suburb
-
-            if process.returncode == 0:
-                log(f"✅ Finished {suburb}", style="green")
-            else:
-                log(
-                    f"⚠️  Incomplete for {suburb} (Code {process.returncode})",
-                    style="yellow",
-                )
-
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             log(f"⏱️  Timeout for {suburb}, moving on...", style="yellow")
-            if process:
-                process.kill()
+            await drop_scraper(scrapers, source)
         except Exception as e:
             log(f"❌ Error processing {suburb}: {e}", style="red")
+            await drop_scraper(scrapers, source)
 
-        # 4. Long random delay between suburbs
+        # 4. Long random delay between suburbs, with the next suburb's VPN
+        # rotation run inside it (a reconnect takes less than the shortest break)
         if i < len(suburbs) - 1:
             delay = random.randint(20, 60)
             log(f"Random break: {delay}s...", style="dim")
-            time.sleep(delay)
-
-    run_vpn_command(["disconnect"], check=False)
-    log("\n✨ Harvest Complete.", style="bold blue")
+            await asyncio.gather(asyncio.sleep(delay), rotate_vpn())
 
 
 if __name__ == "__main__":
-    main()
-    main()
+    asyncio.run(main())
@@ -12,7 +12,19 @@ count = session.query(Comparable).count()
 print(f"Total Comparables: {count}")
 
 # Show sample
-comps = session.query(Comparable).limit(5).all()
+comps = (
+    session.query(
+        Comparable.address,
+        Comparable.suburb,
+        Comparable.property_type,
+        Comparable.sold_price,
+        Comparable.finish_quality,
+        Comparable.building_area,
+        Comparable.is_renovated,
+    )
+    .limit(5)
+    .all()
+)
 for c in comps:
     print(
         f"{c.address} | {c.suburb} | {c.property_type} | ${c.sold_price} | "
@@ -1,21 +1,31 @@
-from scanner.market.models import Comparable, get_db
+from scanner.market.models import Comparable, get_db, init_db
 
-session = next(get_db())
-# Look for records where we actually got some rich data
-comps = (
-    session.query(Comparable)
-    .filter(
-        (Comparable.year_built != None)
-        | (Comparable.finish_quality != "Standard")
-        | (Comparable.building_area != None)
-    )
-    .limit(20)
-    .all()
+# Only the columns shown below, as plain rows rather than full ORM objects
+DISPLAY_COLUMNS = (
+    Comparable.address,
+    Comparable.sold_price,
+    Comparable.finish_quality,
+    Comparable.is_renovated,
+    Comparable.year_built,
+    Comparable.agent,
 )
 
+init_db()  # Ensures the partial indexes the query below relies on
+session = next(get_db())
+# Look for records where we actually got some rich data. One query per
+# condition, so each can use its partial index; id keeps distinct
+# records distinct through the UNION
+rich = [
+    Comparable.year_built != None,
+    Comparable.finish_quality != "Standard",
+    Comparable.building_area != None,
+]
+first, *rest = (session.query(Comparable.id, *DISPLAY_COLUMNS).filter(c) for c in rich)
+comps = first.union(*rest).limit(20).all()
+
 # If nothing interesting, just show first 10
 if not comps:
-    comps = session.query(Comparable).limit(10).all()
+    comps = session.query(*DISPLAY_COLUMNS).limit(10).all()
 
 print(
     f"{'Address':<30} | {'Price':<12} | {'Qual':<10} | {'Ren':<5} | {'Year':<10} | {'Agent':<20}"
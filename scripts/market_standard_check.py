@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def calculate_market_standard_cost():
     # --- Assumptions (Standard Retail Builder) ---
     # Premium Specs: Miele, Stone, Timber floors, Double Glazing.
@@ -17,15 +20,11 @@ def calculate_market_standard_cost():
         {"label": "Unit 3", "living": 143.48, "garage": 38.39, "porch": 3.50},
     ]
 
-    total_structure = 0
-
-    for u in units:
-        cost = (
-            (u["living"] * RATE_DWELLING)
-            + (u["garage"] * RATE_GARAGE)
-            + (u["porch"] * RATE_PORCH)
-        )
-        total_structure += cost
+    # Units x area types against per-type rates; a rate sweep is the same
+    # matmul with a (3, n_scenarios) rates array
+    areas = np.array([[u["living"], u["garage"], u["porch"]] for u in units])
+    rates = np.array([RATE_DWELLING, RATE_GARAGE, RATE_PORCH])
+    total_structure = float((areas @ rates).sum())
 
     total_ex_gst = total_structure + SITE_LANDSCAPING
     total_inc_gst = total_ex_gst * 1.1
@@ -8,13 +8,20 @@ Outputs:
   - data/wollongong_friction_summary.json (aggregated stats for dashboard)
 """
 
+import argparse
+import hashlib
 import json
 import sys
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ── Configuration ──────────────────────────────────────────────
 # We try to discover the resource ID dynamically if this one fails.
@@ -23,6 +30,26 @@ API_ROOT = "https://data.nsw.gov.au/data/api/3/action"
 TARGET_LGA = "Wollongong City Council"
 KILL_THRESHOLD_DAYS = 90
 SAMPLE_LIMIT = 1000
+NS_PER_DAY = 86_400_000_000_000
+# Records as arrays plus one field list, rather than a dict per record
+RECORDS_FORMAT = "lists"
+
+# One pooled connection for discovery and fetch retries; CKAN's transient
+# 429/5xx responses are retried with backoff
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "feasibility-dashboard/nsw-friction-score"})
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
 
 # Output paths
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -30,6 +57,79 @@ DATA_DIR = PROJECT_ROOT / "data"
 CSV_OUTPUT = DATA_DIR / "wollongong_friction_data.csv"
 JSON_OUTPUT = DATA_DIR / "wollongong_friction_summary.json"
 
+# Raw API records are reused for a day; the DA feed doesn't move faster
+CACHE_DIR = DATA_DIR / ".cache"
+CACHE_TTL = 24 * 60 * 60  # 24 hours
+# Resource ID found by discovery, tried before the hard-coded RESOURCE_ID
+RESOURCE_ID_FILE = DATA_DIR / ".resource_id"
+
+
+def _cache_path(resource_id: str) -> Path:
+    """Cache file for a datastore query, keyed by everything that shapes it."""
+    key = json.dumps([resource_id, TARGET_LGA, SAMPLE_LIMIT, RECORDS_FORMAT])
+    return CACHE_DIR / f"nsw_da_{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _load_cached(resource_id: str) -> pd.DataFrame | None:
+    path = _cache_path(resource_id)
+    if not path.exists() or time.time() - path.stat().st_mtime >= CACHE_TTL:
+        return None
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        print(f"Ignoring unreadable cache {path.name}: {exc}")
+        return None
+    print(f"Using {cached['record_count']} cached records from {cached['fetched_at']}.")
+    return pd.DataFrame(cached["records"], columns=cached["fields"] or None)
+
+
+def _save_cached(resource_id: str, fields: list[str], records: list) -> None:
+    path = _cache_path(resource_id)
+    payload = {
+        "fetched_at": datetime.now().isoformat(),
+        "resource_id": resource_id,
+        "sample_limit": SAMPLE_LIMIT,
+        "record_count": len(records),
+        "fields": fields,
+        "records": records,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a private temp file then rename, so a crash never leaves
+        # a half-written cache entry
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, delete=False, encoding="utf-8"
+        ) as tmp:
+            # json.dumps, not json.dump: only the one-shot path uses the C
+            # encoder, and this payload is the whole raw record set
+            tmp.write(json.dumps(payload, separators=(",", ":")))
+        Path(tmp.name).replace(path)
+    except OSError as exc:
+        print(f"Could not write cache {path.name}: {exc}")
+
+
+def _load_resource_id() -> str | None:
+    """Resource ID saved by an earlier discovery against this API."""
+    try:
+        saved = json.loads(RESOURCE_ID_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if saved.get("api_root") != API_ROOT:
+        return None
+    return saved.get("id")
+
+
+def _save_resource_id(resource_id: str) -> None:
+    payload = {
+        "id": resource_id,
+        "discovered_at": datetime.now().isoformat(),
+        "api_root": API_ROOT,
+    }
+    try:
+        RESOURCE_ID_FILE.write_text(json.dumps(payload), encoding="utf-8")
+    except OSError as exc:
+        print(f"Could not save resource ID: {exc}")
+
 
 def find_resource_id() -> str | None:
     """Search for the correct resource ID via the CKAN API."""
@@ -38,7 +138,7 @@ def find_resource_id() -> str | None:
         # Search for the package
         search_url = f"{API_ROOT}/package_search"
         params = {"q": "Online DA Data", "rows": 5}
-        resp = requests.get(search_url, params=params, timeout=10)
+        resp = SESSION.get(search_url, params=params, timeout=10)
         resp.raise_for_status()
         data = resp.json()
 
@@ -71,38 +171,54 @@ def find_resource_id() -> str | None:
         return None
 
 
-def fetch_da_records() -> pd.DataFrame | None:
-    """Fetch DA records from the NSW Planning Portal API."""
+def fetch_da_records(refresh: bool = False) -> pd.DataFrame | None:
+    """Fetch DA records from the NSW Planning Portal API.
+
+    Records cached within the last CACHE_TTL are reused unless ``refresh``.
+    """
 
-    current_id = RESOURCE_ID
+    # A previously discovered ID saves re-failing on the hard-coded one
+    saved_id = _load_resource_id()
+    current_id = saved_id or RESOURCE_ID
 
     # First attempt
     print(f"── Connecting to NSW Planning API for {TARGET_LGA} (ID: {current_id}) ──")
-    df = _try_fetch(current_id)
+    df = _try_fetch(current_id, refresh)
 
     if df is not None:
         return df
 
-    # If failed, try discovery
+    # If failed, forget any saved ID and try discovery
+    if saved_id:
+        RESOURCE_ID_FILE.unlink(missing_ok=True)
     print("Initial ID failed. Attempting discovery...")
     discovered_id = find_resource_id()
     if discovered_id and discovered_id != current_id:
         print(f"Retrying with discovered ID: {discovered_id}")
-        return _try_fetch(discovered_id)
+        df = _try_fetch(discovered_id, refresh)
+        if df is not None:
+            _save_resource_id(discovered_id)
+        return df
 
     print("All fetch attempts failed.")
     return None
 
 
-def _try_fetch(resource_id: str) -> pd.DataFrame | None:
+def _try_fetch(resource_id: str, refresh: bool = False) -> pd.DataFrame | None:
+    if not refresh:
+        cached = _load_cached(resource_id)
+        if cached is not None:
+            return cached
+
     try:
         url = f"{API_ROOT}/datastore_search"
         params = {
             "resource_id": resource_id,
             "q": TARGET_LGA,
             "limit": SAMPLE_LIMIT,
+            "records_format": RECORDS_FORMAT,
         }
-        response = requests.get(url, params=params, timeout=30)
+        response = SESSION.get(url, params=params, timeout=30)
 
         if response.status_code == 404:
             print(f"Resource {resource_id} not found (404).")
@@ -115,19 +231,34 @@ def _try_fetch(resource_id: str) -> pd.DataFrame | None:
             print(f"API Error: {data.get('error', 'Unknown error')}")
             return None
 
-        records = data["result"]["records"]
+        result = data["result"]
+        fields = [f["id"] for f in result.get("fields", [])]
+        records = result["records"]
         if not records:
             print("No records returned from API.")
             return None
 
         print(f"Fetched {len(records)} raw records.")
-        return pd.DataFrame(records)
+        _save_cached(resource_id, fields, records)
+        # Row arrays go straight into columns; dict records (a server that
+        # ignores records_format) are picked apart by the same field names
+        return pd.DataFrame(records, columns=fields or None)
 
     except Exception as exc:
         print(f"Request failed: {exc}")
         return None
 
 
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """Parse CKAN date strings; anything unparseable becomes NaT.
+
+    CKAN emits ISO-8601, so the format is pinned rather than inferred (which
+    can fall back to dateutil per element). DAs share few distinct dates, so
+    unique strings are parsed once.
+    """
+    return pd.to_datetime(values, format="ISO8601", errors="coerce", cache=True)
+
+
 def calculate_friction(df: pd.DataFrame) -> pd.DataFrame | None:
     """Calculate days-to-process for determined DAs."""
     # Normalise column names
@@ -140,18 +271,30 @@ def calculate_friction(df: pd.DataFrame) -> pd.DataFrame | None:
         print(f"Missing columns: {required - available}")
         return None
 
-    # Parse dates
-    df["lodgement_date"] = pd.to_datetime(df["lodgement_date"], errors="coerce")
-    df["determination_date"] = pd.to_datetime(df["determination_date"], errors="coerce")
-
-    # Keep only determined DAs
-    determined = df.dropna(subset=["determination_date"]).copy()
-    determined["days_to_process"] = (
-        determined["determination_date"] - determined["lodgement_date"]
-    ).dt.days
-
-    # Filter invalid
-    determined = determined[determined["days_to_process"] > 0]
+    # Lodgement dates are parsed for determined DAs alone
+    determination_dates = _parse_dates(df["determination_date"])
+    decided = determination_dates.to_numpy(dtype="datetime64[ns]")
+    has_decision = ~np.isnat(decided)
+    lodgement_dates = _parse_dates(df.loc[has_decision, "lodgement_date"])
+    lodged = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+    lodged[has_decision] = lodgement_dates.to_numpy(dtype="datetime64[ns]")
+
+    # Whole days straight from the int64 nanosecond values, without building
+    # a timedelta series first. Floor division matches Timedelta.days
+    days = (decided.view("i8") - lodged.view("i8")) // NS_PER_DAY
+    has_lodgement = ~np.isnat(lodged)
+
+    # One mask (determined, lodged, positive duration) and one row copy
+    mask = has_decision & has_lodgement & (days > 0)
+    determined = df.loc[mask].assign(
+        lodgement_date=lodgement_dates[mask[has_decision]],
+        determination_date=determination_dates[mask],
+        days_to_process=days[mask],
+    )
+    # A determined DA missing its lodgement date made the day counts float
+    # (NaN) before it was filtered out; keep that dtype in the output
+    if (has_decision & ~has_lodgement).any():
+        determined["days_to_process"] = determined["days_to_process"].astype(float)
 
     if determined.empty:
         print("No valid determined DAs found.")
@@ -161,12 +304,27 @@ def calculate_friction(df: pd.DataFrame) -> pd.DataFrame | None:
     return determined
 
 
+def _order_stats(arr: np.ndarray, quantiles: list[float]) -> list[float]:
+    """Quantiles interpolated as pandas does, from one O(n) partition."""
+    positions = [(len(arr) - 1) * q for q in quantiles]
+    bounds = [(int(np.floor(pos)), int(np.ceil(pos))) for pos in positions]
+    ranked = np.partition(arr, sorted({k for pair in bounds for k in pair}))
+
+    stats = []
+    for pos, (lo_k, hi_k) in zip(positions, bounds):
+        lo, hi, t = ranked[lo_k], ranked[hi_k], pos - lo_k
+        # Same lerp as numpy, so values (and their rounding) match exactly
+        value = lo + (hi - lo) * t if t < 0.5 else hi - (hi - lo) * (1 - t)
+        stats.append(float(value))
+    return stats
+
+
 def build_summary(df: pd.DataFrame) -> dict:
-    median_days = float(df["days_to_process"].median())
-    mean_days = float(df["days_to_process"].mean())
-    p90_days = float(df["days_to_process"].quantile(0.90))
-    total_count = len(df)
-    over_threshold = int((df["days_to_process"] > KILL_THRESHOLD_DAYS).sum())
+    days = df["days_to_process"].to_numpy(dtype=np.float64)
+    median_days, p90_days = _order_stats(days, [0.5, 0.9])
+    mean_days = float(days.mean())
+    total_count = len(days)
+    over_threshold = int(np.count_nonzero(days > KILL_THRESHOLD_DAYS))
     kill_status = "KILL" if median_days > KILL_THRESHOLD_DAYS else "GO"
 
     return {
@@ -184,9 +342,15 @@ def build_summary(df: pd.DataFrame) -> dict:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--refresh", action="store_true", help="Ignore cached API records"
+    )
+    args = parser.parse_args()
+
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    raw_df = fetch_da_records()
+    raw_df = fetch_da_records(refresh=args.refresh)
     if raw_df is None:
         sys.exit(1)
 
@@ -207,7 +371,8 @@ def main() -> None:
         if c in friction_df.columns
     ]
 
-    friction_df[output_cols].to_csv(CSV_OUTPUT, index=False)
+    # columns= selects at write time instead of copying the frame first
+    friction_df.to_csv(CSV_OUTPUT, columns=output_cols, index=False)
     print(f"CSV saved → {CSV_OUTPUT}")
 
     # Save JSON summary
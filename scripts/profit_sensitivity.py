@@ -1,16 +1,60 @@
+import numpy as np
+
+# --- Assumptions ---
+# Costs (Fixed)
+PURCHASE = 1_160_000
+STAMP_DUTY = 65_800
+CONSTRUCTION_EX = 1_091_000
+SOFT_COSTS = 123_000
+FINANCE = 200_000
+LEGAL = 4500
+
+# Sale prices of Units 1 and 2; Unit 3 is the variable
+U1_PRICE = 1_372_000
+U2_PRICE = 1_182_000
+
+
+def unit3_profit(u3_prices) -> dict:
+    """Revenue, costs and returns for each Unit 3 sale price at once.
+
+    Takes a scalar or any array of prices, so a full sensitivity sweep
+    (e.g. ``np.linspace(1_100_000, 1_450_000, 1000)``) is one vector pass.
+    """
+    u3 = np.asarray(u3_prices, dtype=np.float64)
+    total_revenue = U1_PRICE + U2_PRICE + u3
+
+    agent_fees = total_revenue * 0.022
+    selling_costs = (agent_fees / 1.1) + LEGAL
+
+    # GST (Margin Scheme)
+    # GST = (Total Revenue - Purchase) / 11
+    gst = (total_revenue - PURCHASE) / 11
+
+    total_costs = (
+        PURCHASE
+        + STAMP_DUTY
+        + CONSTRUCTION_EX
+        + SOFT_COSTS
+        + FINANCE
+        + selling_costs
+        + gst
+    )
+
+    net_profit = total_revenue - total_costs
+    margin = (net_profit / total_costs) * 100
+
+    return {
+        "u3_price": u3,
+        "total_revenue": total_revenue,
+        "total_costs": total_costs,
+        "net_profit": net_profit,
+        "margin": margin,
+    }
+
+
 def calculate_conservative_profit():
-    # --- Assumptions ---
     # Scenario A: Unit 3 sells for same as Unit 2 ($1.182M) due to similar size.
     # Scenario B: Unit 3 sells for premium ($1.35M) due to rear position/privacy/4th bed.
-
-    # Costs (Fixed)
-    purchase = 1_160_000
-    stamp_duty = 65_800
-    construction_ex = 1_091_000
-    soft_costs = 123_000
-    finance = 200_000
-    legal = 4500
-
     scenarios = [
         {"label": "Conservative (Equal to Unit 2)", "u3_price": 1_182_000},
         {"label": "Optimistic (Rear Premium)", "u3_price": 1_350_000},
@@ -19,36 +63,13 @@ def calculate_conservative_profit():
     print("PROFIT SENSITIVITY ANALYSIS (Unit 3 Valuation)")
     print("-" * 60)
 
-    for s in scenarios:
-        u3 = s["u3_price"]
-        sales = [1_372_000, 1_182_000, u3]  # U1, U2, U3
-        total_revenue = sum(sales)
-
-        agent_fees = total_revenue * 0.022
-        selling_costs = (agent_fees / 1.1) + legal
-
-        # GST (Margin Scheme)
-        # GST = (Total Revenue - Purchase) / 11
-        gst = (total_revenue - purchase) / 11
-
-        total_costs = (
-            purchase
-            + stamp_duty
-            + construction_ex
-            + soft_costs
-            + finance
-            + selling_costs
-            + gst
-        )
-
-        net_profit = total_revenue - total_costs
-        margin = (net_profit / total_costs) * 100
-
+    results = unit3_profit([s["u3_price"] for s in scenarios])
+    for i, s in enumerate(scenarios):
         print(f"Scenario: {s['label']}")
-        print(f"  Unit 3 Price:   ${u3:,.0f}")
-        print(f"  Total Revenue:  ${total_revenue:,.0f}")
-        print(f"  Net Profit:     ${net_profit:,.0f}")
-        print(f"  Return on Cost: {margin:.1f}%")
+        print(f"  Unit 3 Price:   ${results['u3_price'][i]:,.0f}")
+        print(f"  Total Revenue:  ${results['total_revenue'][i]:,.0f}")
+        print(f"  Net Profit:     ${results['net_profit'][i]:,.0f}")
+        print(f"  Return on Cost: {results['margin'][i]:.1f}%")
         print("-" * 30)
 
 
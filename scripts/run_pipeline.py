@@ -37,9 +37,16 @@ async def run_pipeline():
     
     # Step 2: Scrape listings
     console.print("\n[bold]Step 2: Scrape Listings[/bold]")
-    domain_count = await scrape_domain()
-    rea_count = await scrape_rea()
-    console.print(f"  Total new listings: {domain_count + rea_count}")
+    # Different hosts, so both scrapers run at once; one failing doesn't
+    # abort the other
+    results = await asyncio.gather(scrape_domain(), scrape_rea(), return_exceptions=True)
+    total = 0
+    for name, result in zip(("Domain", "REA"), results):
+        if isinstance(result, Exception):
+            console.print(f"  [red]{name} scrape failed: {result}[/red]")
+        else:
+            total += result
+    console.print(f"  Total new listings: {total}")
     
     # Step 3: Geocode
     console.print("\n[bold]Step 3: Geocode Addresses[/bold]")
@@ -1,3 +1,4 @@
+import codecs
 import subprocess
 import time
 import random
@@ -27,6 +28,19 @@ AU_LOCATIONS = {
 # Config
 LOG_FILE = "scanner.log"
 
+# After connecting, poll the CLI's status this often, for at most this long
+CONNECT_POLL_INTERVAL = 0.5
+CONNECT_TIMEOUT = 15
+
+# Scanner output is read, and the log flushed, in blocks of this size;
+# the log is also flushed whenever the pipe is drained, and at least this
+# often while output keeps arriving
+STREAM_CHUNK_SIZE = 65536
+LOG_FLUSH_INTERVAL = 1.0
+
+# Don't allocate a console window for each CLI call (0 off Windows)
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
 def log(text, style=None):
     """
     Dual-logging: Print to Rich console and append to LOG_FILE.
@@ -63,7 +77,8 @@ def run_vpn_command(args, check=True):
             capture_output=True, 
             text=True, 
             check=check,
-            cwd=os.getcwd()
+            cwd=os.getcwd(),
+            creationflags=CREATE_NO_WINDOW
         )
         # Log stdout if any (useful for 'connect' success msg)
         if result.stdout.strip():
@@ -77,32 +92,77 @@ def run_vpn_command(args, check=True):
         log(f"VPN CLI not found at: {VPN_CLI}", style="red")
         sys.exit(1)
 
+def wait_for_connection(timeout=CONNECT_TIMEOUT, interval=CONNECT_POLL_INTERVAL):
+    """Poll `status` until the VPN reports Connected; False if it never does."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            result = subprocess.run(
+                [VPN_CLI, "status"],
+                capture_output=True,
+                text=True,
+                cwd=os.getcwd(),
+                creationflags=CREATE_NO_WINDOW
+            )
+            if result.stdout.lstrip().startswith("Connected"):
+                return True
+        except OSError as e:
+            log(f"VPN status check failed: {e}", style="dim")
+        time.sleep(interval)
+    return False
+
 def run_scanner_stream(cmd):
     """Run the scanner subprocess and stream output to log + console."""
-    # Use Popen to stream stdout
+    # Binary pipe read in large chunks: no per-line decode on the hot path,
+    # so a chatty scanner can't outrun the wrapper and stall on a full pipe
     process = subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT, # Merge stderr into stdout
-        text=True,
-        bufsize=1, # Line buffered
-        encoding='utf-8',
         cwd=os.getcwd()
     )
-    
-    # Read line by line
-    with open(LOG_FILE, "a", encoding="utf-8") as logf:
-        for line in process.stdout:
-            line_clean = line.rstrip()
-            
-            # Print to console (direct print to avoid buffering/rich interference on raw output)
-            print(line_clean)
-            
-            # Write to log
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            logf.write(f"[{timestamp}] {line_clean}\n")
-            logf.flush() # Ensure it's written immediately for 'tail'
-            
+    fd = process.stdout.fileno()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    pending = b""  # Trailing partial line, completed by the next chunk
+    unflushed = 0
+    last_flush = time.monotonic()
+    with open(LOG_FILE, "ab") as logf:
+        while True:
+            chunk = os.read(fd, STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            # Mirror to console; only this copy is decoded
+            sys.stdout.write(decoder.decode(chunk))
+            sys.stdout.flush()
+
+            # Log complete lines, stamped once per chunk
+            *lines, pending = (pending + chunk).split(b"\n")
+            if lines:
+                stamp = datetime.datetime.now().strftime("[%H:%M:%S] ").encode()
+                data = b"".join(stamp + line.rstrip() + b"\n" for line in lines)
+                logf.write(data)
+                unflushed += len(data)
+
+            # Flush for 'tail' once the pipe is drained (a short read), so
+            # nothing sits buffered while the scanner is quiet; under a
+            # sustained burst, every 64KB or second rather than every line
+            now = time.monotonic()
+            if (
+                len(chunk) < STREAM_CHUNK_SIZE
+                or unflushed >= STREAM_CHUNK_SIZE
+                or now - last_flush >= LOG_FLUSH_INTERVAL
+            ):
+                logf.flush()
+                unflushed = 0
+                last_flush = now
+
+        if pending.strip():
+            stamp = datetime.datetime.now().strftime("[%H:%M:%S] ").encode()
+            logf.write(stamp + pending.rstrip() + b"\n")
+        sys.stdout.write(decoder.decode(b"", final=True))
+
     returncode = process.wait()
     return returncode
 
@@ -145,8 +205,9 @@ def main():
         
         if result and result.returncode == 0:
             log(f"Successfully connected to {loc_name}!", style="green")
-            log("Waiting 15 seconds for DNS/Routing to stabilize...", style="dim")
-            time.sleep(15)
+            log(f"Waiting up to {CONNECT_TIMEOUT} seconds for DNS/Routing to stabilize...", style="dim")
+            if not wait_for_connection():
+                log("VPN status never reported Connected; continuing anyway.", style="yellow")
         else:
             log("Failed to connect to VPN. Aborting loop for safety.", style="red")
             break
@@ -1,5 +1,8 @@
+import hashlib
+import json
 import os
 import zipfile
+from email.utils import formatdate
 from pathlib import Path
 
 import requests
@@ -13,6 +16,103 @@ SCHOOL_ZONES_URL = "https://www.education.vic.gov.au/Documents/about/research/da
 DATA_DIR = Path("data")
 ZONES_DIR = DATA_DIR / "school_zones"
 ZIP_FILE = DATA_DIR / "school_zones_2025.zip"
+# ETag / Last-Modified of the downloaded ZIP, for conditional re-downloads
+VALIDATORS_FILE = ZIP_FILE.with_suffix(".etag")
+CHUNK_SIZE = 1 << 20
+# Written after a complete extraction; records which ZIP it came from
+EXTRACT_MARKER = ZONES_DIR / ".extract_ok"
+# Members worth extracting: shapefile parts plus the GeoJSON the loader reads
+# (the ZIP also carries PDFs and metadata nobody uses)
+SPATIAL_SUFFIXES = {".shp", ".shx", ".dbf", ".prj", ".cpg", ".geojson"}
+LAYER_SUFFIXES = {".shp", ".geojson"}
+
+
+def _conditional_headers() -> dict:
+    """Validators for a conditional GET of the ZIP we already have."""
+    if not ZIP_FILE.exists():
+        return {}
+    try:
+        saved = json.loads(VALIDATORS_FILE.read_text())
+    except (OSError, ValueError):
+        # Downloaded before validators were kept; the file's age will do
+        saved = {"last_modified": formatdate(ZIP_FILE.stat().st_mtime, usegmt=True)}
+
+    headers = {}
+    if saved.get("etag"):
+        headers["If-None-Match"] = saved["etag"]
+    if saved.get("last_modified"):
+        headers["If-Modified-Since"] = saved["last_modified"]
+    return headers
+
+
+def download_zip() -> bool:
+    """Fetch the ZIP unless the server says ours is current.
+
+    Returns True if a new copy was written.
+    """
+    headers = _conditional_headers()
+    console.print(f"Downloading from {SCHOOL_ZONES_URL}...")
+    with requests.get(
+        SCHOOL_ZONES_URL, headers=headers, stream=True, timeout=60
+    ) as resp:
+        if resp.status_code == 304:
+            console.print("[dim]Already up to date.[/dim]")
+            return False
+        resp.raise_for_status()
+
+        # Stream to a side file and swap it in, so an interrupted download
+        # never leaves a truncated ZIP that looks complete
+        part = ZIP_FILE.with_suffix(".part")
+        with open(part, "wb") as f:
+            for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                f.write(chunk)
+        os.replace(part, ZIP_FILE)
+
+        VALIDATORS_FILE.write_text(
+            json.dumps(
+                {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+            )
+        )
+    console.print("[green]Download complete.[/green]")
+    return True
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_marker() -> dict:
+    try:
+        return json.loads(EXTRACT_MARKER.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def extract_zip(zip_sha: str) -> list[str]:
+    """Extract the spatial members of ZIP_FILE and mark the extraction complete.
+
+    Returns the layer files extracted, relative to ZONES_DIR.
+    """
+    # Drop any marker first so an interrupted run is redone next time
+    ZONES_DIR.mkdir(parents=True, exist_ok=True)
+    EXTRACT_MARKER.unlink(missing_ok=True)
+    with zipfile.ZipFile(ZIP_FILE, "r") as zip_ref:
+        members = [
+            m for m in zip_ref.namelist() if Path(m).suffix.lower() in SPATIAL_SUFFIXES
+        ]
+        for member in members:
+            zip_ref.extract(member, ZONES_DIR)
+
+    layers = [m for m in members if Path(m).suffix.lower() in LAYER_SUFFIXES]
+    EXTRACT_MARKER.write_text(json.dumps({"sha256": zip_sha, "layers": layers}))
+    return layers
 
 
 def setup_school_zones():
@@ -21,27 +121,24 @@ def setup_school_zones():
     # Ensure data directory exists
     DATA_DIR.mkdir(exist_ok=True)
 
-    # 1. Download
-    if not ZIP_FILE.exists():
-        console.print(f"Downloading from {SCHOOL_ZONES_URL}...")
-        try:
-            resp = requests.get(SCHOOL_ZONES_URL, stream=True)
-            resp.raise_for_status()
-
-            with open(ZIP_FILE, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            console.print("[green]Download complete.[/green]")
-        except Exception as e:
-            console.print(f"[red]Download failed: {e}[/red]")
+    # 1. Download (conditional if we already have a copy)
+    try:
+        download_zip()
+    except Exception as e:
+        console.print(f"[red]Download failed: {e}[/red]")
+        if not ZIP_FILE.exists():
             return
+        console.print("[yellow]Using the existing ZIP.[/yellow]")
 
-    # 2. Extract
-    if not ZONES_DIR.exists():
+    # 2. Extract, unless the marker shows this exact ZIP was fully extracted
+    zip_sha = _sha256(ZIP_FILE)
+    marker = _read_marker()
+    if marker.get("sha256") == zip_sha:
+        layers = marker.get("layers", [])
+    else:
         console.print(f"Extracting to {ZONES_DIR}...")
         try:
-            with zipfile.ZipFile(ZIP_FILE, "r") as zip_ref:
-                zip_ref.extractall(ZONES_DIR)
+            layers = extract_zip(zip_sha)
             console.print("[green]Extraction complete.[/green]")
         except Exception as e:
             console.print(f"[red]Extraction failed: {e}[/red]")
@@ -49,9 +146,8 @@ def setup_school_zones():
 
     # 3. List files
     console.print("\nFound spatial files:")
-    shapefiles = list(ZONES_DIR.rglob("*.shp"))
-    for shp in shapefiles:
-        console.print(f" - {shp.name}")
+    for layer in layers:
+        console.print(f" - {Path(layer).name}")
 
     console.print("\n[yellow]Now run the loader:[/yellow]")
     console.print("python -m scanner.ingest.load_schools")
@@ -59,4 +155,3 @@ def setup_school_zones():
 
 if __name__ == "__main__":
     setup_school_zones()
-    setup_school_zones()
@@ -42,4 +42,3 @@ def check_and_guide():
 
 if __name__ == "__main__":
     check_and_guide()
-    check_and_guide()
@@ -1,11 +1,17 @@
 """Store the Donvale listings from today's browser scrape."""
 
+import re
 from datetime import datetime
 
+from sqlalchemy import insert, select
+
 from scanner.db import get_session, init_db
 from scanner.ingest.browser_agent import parse_price
 from scanner.models import RawListing, Site
 
+# Trailing listing ID of a Domain URL slug
+_LISTING_ID_RE = re.compile(r"-(\d+)$")
+
 # Initialize DB first
 init_db()
 
@@ -184,73 +190,87 @@ DONVALE_LISTINGS = [
 
 def extract_listing_id(url: str) -> str | None:
     """Extract listing ID from Domain URL."""
-    import re
-
-    match = re.search(r"-(\d+)$", url)
+    match = _LISTING_ID_RE.search(url)
     return match.group(1) if match else None
 
 
 def store_donvale_listings():
     """Store all Donvale listings in the database."""
-    new_count = 0
+    listings = []
+    for listing in DONVALE_LISTINGS:
+        listing_id = extract_listing_id(listing["url"])
+        if not listing_id:
+            print(f"  Skipping (no ID): {listing['address']}")
+            continue
+        listings.append((f"domain_browser:{listing_id}", listing_id, listing))
 
+    raw_rows = []
+    site_rows = []
     with get_session() as session:
-        for listing in DONVALE_LISTINGS:
-            listing_id = extract_listing_id(listing["url"])
-            if not listing_id:
-                print(f"  Skipping (no ID): {listing['address']}")
-                continue
-
-            raw_id = f"domain_browser:{listing_id}"
+        # One existence check for the whole batch
+        existing = set(
+            session.scalars(
+                select(RawListing.id).where(
+                    RawListing.id.in_([raw_id for raw_id, _, _ in listings])
+                )
+            )
+        )
 
-            # Check if exists
-            existing = session.query(RawListing).filter_by(id=raw_id).first()
-            if existing:
+        for raw_id, listing_id, listing in listings:
+            if raw_id in existing:
                 print(f"  Already exists: {listing['address']}")
                 continue
 
-            # Create raw listing
-            raw = RawListing(
-                id=raw_id,
-                source="domain_browser",
-                listing_id=listing_id,
-                url=listing["url"],
-                payload=listing,
+            # Raw listing
+            raw_rows.append(
+                {
+                    "id": raw_id,
+                    "source": "domain_browser",
+                    "listing_id": listing_id,
+                    "url": listing["url"],
+                    "payload": listing,
+                }
             )
-            session.add(raw)
 
             # Parse price
             price_low, price_high, price_guide = parse_price(
                 listing.get("price_text", "")
             )
 
-            # Create site
-            site = Site(
-                source="domain_browser",
-                domain_listing_id=listing_id,
-                url=listing["url"],
-                address_raw=listing["address"],
-                suburb="Donvale",
-                postcode="3111",
-                state="VIC",
-                property_type="house" if listing.get("bedrooms") else "vacant_land",
-                price_display=listing.get("price_text"),
-                price_low=price_low,
-                price_high=price_high,
-                price_guide=price_guide,
-                bedrooms=listing.get("bedrooms"),
-                bathrooms=listing.get("bathrooms"),
-                land_size_listed=listing.get("land_size_m2"),
-                geocode_status="pending",
+            # Site
+            site_rows.append(
+                {
+                    "source": "domain_browser",
+                    "domain_listing_id": listing_id,
+                    "url": listing["url"],
+                    "address_raw": listing["address"],
+                    "suburb": "Donvale",
+                    "postcode": "3111",
+                    "state": "VIC",
+                    "property_type": (
+                        "house" if listing.get("bedrooms") else "vacant_land"
+                    ),
+                    "price_display": listing.get("price_text"),
+                    "price_low": price_low,
+                    "price_high": price_high,
+                    "price_guide": price_guide,
+                    "bedrooms": listing.get("bedrooms"),
+                    "bathrooms": listing.get("bathrooms"),
+                    "land_size_listed": listing.get("land_size_m2"),
+                    "geocode_status": "pending",
+                }
             )
-            session.add(site)
-            new_count += 1
             print(f"  Added: {listing['address']} - {listing['price_text']}")
 
+        # Two executemany inserts in the session's single transaction
+        if raw_rows:
+            session.execute(insert(RawListing), raw_rows)
+            session.execute(insert(Site), site_rows)
+
+    new_count = len(raw_rows)
     print(f"\nStored {new_count} new listings")
     return new_count
 
 
 if __name__ == "__main__":
     store_donvale_listings()
-    store_donvale_listings()
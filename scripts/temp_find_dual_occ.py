@@ -3,10 +3,12 @@ import asyncio
 import csv
 import os
 import random
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from rich.console import Console
 
@@ -22,51 +24,153 @@ console = Console()
 
 TARGET_SUBURBS_FILE = Path("config/suburbs_eastern.txt")
 REPORT_PATH = Path("reports/dual_occ_candidates.csv")
+SCRAPE_CONCURRENCY = 4  # Browsers scraping suburbs at once
 
+# Trailing Domain listing ID on a URL slug (a long run of digits)
+_LISTING_ID_SUFFIX_RE = re.compile(r"(?:^|-)\d{6,}$")
 
-async def get_sold_data(suburbs: list[str], scraper) -> dict[str, float]:
-    """Get median sold price for 3-4 bed houses to use as GRV proxy."""
-    grv_map = {}
+
+def address_from_url(url: str) -> str:
+    """Best-effort address from a listing URL slug, minus its listing ID."""
+    slug = url.rpartition("domain.com.au/")[2].partition("?")[0].rpartition("/")[2]
+    return _LISTING_ID_SUFFIX_RE.sub("", slug).replace("-", " ").title()
+
+
+async def suburb_grv(sub: str, scraper) -> float:
+    """80th-percentile sold price in a suburb (GRV proxy), or the fallback."""
+    console.print(f"  Getting sold data for {sub}...")
+    try:
+        listings = await scraper.scrape_suburb(sub, max_pages=1, search_type="sold")
+
+        # Mid/value of each price; unparseable ones become NaN
+        mids = [scraper.parse_price(l.get("price_text", ""))[2] for l in listings]
+        arr = np.array([np.nan if p is None else p for p in mids], dtype=np.float64)
+        prices = arr[arr > 800000]  # Filter out anomalies/units (and NaN)
+
+        if prices.size:
+            # 80th percentile by O(n) selection rather than a full sort
+            k = min(int(prices.size * 0.8), prices.size - 1)
+            grv = np.partition(prices, k)[k].item()
+            console.print(
+                f"  [green]Est GRV for {sub}: ${grv/1e6:.2f}M (n={prices.size})[/green]"
+            )
+            return grv
+        console.print(
+            f"  [yellow]No sold data for {sub}, using default fallback[/yellow]"
+        )
+    except Exception as e:
+        console.print(f"[red]Error fetching sold data: {e}[/red]")
+    return 1_500_000  # Fallback
+
+
+async def get_sold_data(suburbs: list[str], run, source: str) -> dict[str, float]:
+    """Get median sold price for 3-4 bed houses to use as GRV proxy.
+
+    ``run(job, pause)`` runs ``job(scraper)`` on a pooled scraper.
+    """
     console.print("[bold cyan]Updating GRV/Sold Data...[/bold cyan]")
 
     # REA Scraper checks
-    if hasattr(scraper, "config") and "rea" in str(type(scraper)).lower():
+    if source == "rea":
         console.print(
             "[yellow]REA Scraper active - Skipping Live Sold Data (using defaults)[/yellow]"
         )
         return {}
 
-    for sub in suburbs:
-        console.print(f"  Getting sold data for {sub}...")
-        try:
-            listings = await scraper.scrape_suburb(sub, max_pages=1, search_type="sold")
-
-            prices = []
-            for l in listings:
-                p = scraper.parse_price(l.get("price_text", ""))[2]  # Get mid/value
-                if p and p > 800000:  # Filter out anomalies/units
-                    prices.append(p)
-
-            if prices:
-                prices.sort()
-                idx = int(len(prices) * 0.8)
-                grv = prices[min(idx, len(prices) - 1)]
-                grv_map[sub.lower()] = grv
-                console.print(
-                    f"  [green]Est GRV for {sub}: ${grv/1e6:.2f}M (n={len(prices)})[/green]"
-                )
-            else:
-                console.print(
-                    f"  [yellow]No sold data for {sub}, using default fallback[/yellow]"
-                )
-                grv_map[sub.lower()] = 1_500_000  # Fallback
-        except Exception as e:
-            console.print(f"[red]Error fetching sold data: {e}[/red]")
-            grv_map[sub.lower()] = 1_500_000
+    grvs = await asyncio.gather(
+        *(run(lambda w, sub=sub: suburb_grv(sub, w), 2) for sub in suburbs)
+    )
+    return {sub.lower(): grv for sub, grv in zip(suburbs, grvs)}
+
+
+def known_addresses() -> set[str]:
+    """Addresses already in the report; those listings aren't re-assessed."""
+    if not REPORT_PATH.exists():
+        return set()
+    try:
+        report = pd.read_csv(REPORT_PATH, usecols=["address"], dtype="string")
+    except (OSError, ValueError) as e:
+        console.print(f"[yellow]Could not read existing report: {e}[/yellow]")
+        return set()
+    return set(report["address"].dropna())
+
+
+async def scan_suburb(
+    sub: str, scraper, source: str, grv_map: dict, known: set[str]
+) -> list[dict]:
+    """Viable dual-occ candidates among a suburb's new listings."""
+    # Scrape Listings
+    if source == "rea":
+        # REAScraper default scrape_suburb signature
+        listings = await scraper.scrape_suburb(sub, max_pages=3)
+    else:
+        listings = await scraper.scrape_suburb(
+            sub,
+            max_pages=3,
+            search_type="sale",
+            land_size_min=650,  # Dual Occ minimum for Domain
+        )
 
-        await asyncio.sleep(2)
+    candidates = []
+    for l in listings:
+        # Validate Address
+        raw_addr = l.get("address", "")
+        url = l.get("url", "")
+
+        # If address looks invalid (contains price or no digits), try to fix from URL
+        if not raw_addr or "$" in raw_addr or not any(c.isdigit() for c in raw_addr):
+            try:
+                raw_addr = address_from_url(url)
+            except Exception:
+                pass  # Keep original if fix fails
+
+        # Already reported: skip before the price parsing and feasibility work
+        if raw_addr in known:
+            continue
+
+        # Convert to Site object for feasibility
+        p_low, p_high, p_guide = scraper.parse_price(l.get("price_text", ""))
+
+        site = Site(
+            address_raw=raw_addr,
+            suburb=l.get("suburb"),
+            land_size_listed=l.get("land_size_m2"),
+            price_guide=p_guide,
+            price_low=p_low,
+            price_high=p_high,
+        )
 
-    return grv_map
+        # Basic filter (Land Size Check)
+        # Domain filters server-side, REA might not so we double check strictly
+        if not site.land_size_listed or site.land_size_listed < 650:
+            continue
+
+        # Feasibility
+        feas = DualOccFeasibility(site)
+
+        # Look up GRV
+        grv = grv_map.get(sub.lower(), 1_500_000)
+
+        result = feas.calculate_margin(grv)
+
+        if result["viable"]:
+            console.print(
+                f"[bold green]FOUND: {site.address_raw} | Margin: {result['margin_percent']:.1f}%[/bold green]"
+            )
+            candidates.append(
+                {
+                    "address": site.address_raw,
+                    "suburb": site.suburb,
+                    "price": site.price_guide,
+                    "land": site.land_size_listed,
+                    "est_grv": grv,
+                    "margin": result["margin_percent"],
+                    "profit": result["profit"],
+                    "url": l.get("url"),
+                    "source": source,
+                }
+            )
+    return candidates
 
 
 async def find_sites(source: str = "domain"):
@@ -79,131 +183,76 @@ async def find_sites(source: str = "domain"):
     ]
 
     console.print(f"[bold]Starting scan with source: {source.upper()}[/bold]")
-    if source == "rea":
-        scraper = REAScraper()
-    else:
-        scraper = DomainScraper()
 
-    await scraper.start()
+    # Suburbs are scraped on a small pool of scrapers, each with its own
+    # page; only the first launches Chromium, the rest share it
+    scraper_cls = REAScraper if source == "rea" else DomainScraper
+    n_workers = max(1, min(SCRAPE_CONCURRENCY, len(suburbs)))
+    scrapers = [scraper_cls()]
+    pool = asyncio.Queue()
 
     try:
+        await scrapers[0].start()
+        extra = [scraper_cls(browser=scrapers[0].browser) for _ in range(n_workers - 1)]
+        scrapers.extend(extra)
+        await asyncio.gather(*(s.start() for s in extra))
+        for s in scrapers:
+            pool.put_nowait(s)
+
+        async def run(job, pause):
+            worker = await pool.get()
+            try:
+                return await job(worker)
+            finally:
+                # Polite pause per browser before it takes the next scrape
+                await asyncio.sleep(pause)
+                pool.put_nowait(worker)
+
         # 1. Get GRV Data
         # We only do a subset to save time for this run, or all if small list
         gr_suburbs = suburbs[:5]  # Limit for demo speed, user can expand
-        grv_map = await get_sold_data(gr_suburbs, scraper)
+        grv_map = await get_sold_data(gr_suburbs, run, source)
 
         # 2. Find Sites
         console.print(
             f"\n[bold cyan]Scanning for Sites ({source.upper()})...[/bold cyan]"
         )
-        candidates = []
-
-        for sub in suburbs:
-            # Scrape Listings
-            if source == "rea":
-                # REAScraper default scrape_suburb signature
-                listings = await scraper.scrape_suburb(sub, max_pages=3)
-            else:
-                listings = await scraper.scrape_suburb(
-                    sub,
-                    max_pages=3,
-                    search_type="sale",
-                    land_size_min=650,  # Dual Occ minimum for Domain
-                )
-
-            for l in listings:
-                # Convert to Site object for feasibility
-                p_low, p_high, p_guide = scraper.parse_price(l.get("price_text", ""))
-
-                # Validate Address
-                raw_addr = l.get("address", "")
-                url = l.get("url", "")
-
-                # If address looks invalid (contains price or no digits), try to fix from URL
-                if (
-                    not raw_addr
-                    or "$" in raw_addr
-                    or not any(c.isdigit() for c in raw_addr)
-                ):
-                    try:
-                        # Extract slug from URL: domain.com.au/address-suburb-listingID
-                        # Remove common prefixes/suffixes
-                        parts = url.split("domain.com.au/")[-1].split("?")[0]
-                        if "/" in parts:
-                            parts = parts.split("/")[-1]
-
-                        slug_parts = parts.split("-")
-                        # Remove listing ID if it looks like one (last part is long digit)
-                        if (
-                            slug_parts
-                            and slug_parts[-1].isdigit()
-                            and len(slug_parts[-1]) > 5
-                        ):
-                            slug_parts.pop()
-
-                        raw_addr = " ".join(slug_parts).title()
-                    except Exception:
-                        pass  # Keep original if fix fails
-
-                site = Site(
-                    address_raw=raw_addr,
-                    suburb=l.get("suburb"),
-                    land_size_listed=l.get("land_size_m2"),
-                    price_guide=p_guide,
-                    price_low=p_low,
-                    price_high=p_high,
-                )
-
-                # Basic filter (Land Size Check)
-                # Domain filters server-side, REA might not so we double check strictly
-                if not site.land_size_listed or site.land_size_listed < 650:
-                    continue
-
-                # Feasibility
-                feas = DualOccFeasibility(site)
-
-                # Look up GRV
-                grv = grv_map.get(sub.lower(), 1_500_000)
-
-                result = feas.calculate_margin(grv)
-
-                if result["viable"]:
-                    console.print(
-                        f"[bold green]FOUND: {site.address_raw} | Margin: {result['margin_percent']:.1f}%[/bold green]"
-                    )
-                    candidates.append(
-                        {
-                            "address": site.address_raw,
-                            "suburb": site.suburb,
-                            "price": site.price_guide,
-                            "land": site.land_size_listed,
-                            "est_grv": grv,
-                            "margin": result["margin_percent"],
-                            "profit": result["profit"],
-                            "url": l.get("url"),
-                            "source": source,
-                        }
-                    )
-
-            await asyncio.sleep(5)
+        known = known_addresses()
+        results = await asyncio.gather(
+            *(
+                run(lambda w, sub=sub: scan_suburb(sub, w, source, grv_map, known), 5)
+                for sub in suburbs
+            )
+        )
+        candidates = [c for sub_candidates in results for c in sub_candidates]
 
         # Report
         if candidates:
-            new_df = pd.DataFrame(candidates)
+            # Known addresses were skipped, so only this run's own repeats
+            # (a listing seen from two suburbs) need dropping
+            new_df = pd.DataFrame(candidates).drop_duplicates(
+                subset=["address"], keep="last"
+            )
 
             if REPORT_PATH.exists():
                 try:
-                    existing_df = pd.read_csv(REPORT_PATH)
-                    # Combine and deduplicate
-                    combined_df = pd.concat([existing_df, new_df])
-                    # Keep last to effectively update listing details if re-scraped
-                    combined_df = combined_df.drop_duplicates(
-                        subset=["address"], keep="last"
-                    )
-
-                    combined_df.to_csv(REPORT_PATH, index=False)
+                    header = list(pd.read_csv(REPORT_PATH, nrows=0).columns)
+                    if header == list(new_df.columns):
+                        # Same layout: append rather than rewrite the report
+                        new_df.to_csv(REPORT_PATH, mode="a", header=False, index=False)
+                        total = len(known | set(new_df["address"].dropna()))
+                    else:
+                        existing_df = pd.read_csv(REPORT_PATH)
+                        # Combine and deduplicate
+                        combined_df = pd.concat([existing_df, new_df])
+                        # Keep last to effectively update listing details if re-scraped
+                        combined_df = combined_df.drop_duplicates(
+                            subset=["address"], keep="last"
+                        )
+                        combined_df.to_csv(REPORT_PATH, index=False)
+                        total = len(combined_df)
                     console.print(
-                        f"\n[green]Merged {len(candidates)} new candidates. Total unique: {len(combined_df)}[/green]"
+                        f"\n[green]Merged {len(candidates)} new candidates. Total unique: {total}[/green]"
                     )
                 except Exception as e:
                     console.print(
@@ -219,7 +268,9 @@ async def find_sites(source: str = "domain"):
             console.print("\n[yellow]No candidates found[/yellow]")
 
     finally:
-        await scraper.stop()
+        # Contexts first, then the shared browser they live in
+        await asyncio.gather(*(s.stop() for s in scrapers[1:]), return_exceptions=True)
+        await scrapers[0].stop()
 
 
 if __name__ == "__main__":
@@ -21,78 +21,97 @@ PROPERTIES = [
 ]
 
 
-async def scrape_and_assess():
-    async with async_playwright() as p:
-        # Use a stealthy context similar to domain.py
-        browser = await p.chromium.launch(
-            headless=True, args=["--disable-blink-features=AutomationControlled"]
-        )
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        page = await context.new_page()
+CONCURRENCY = 4  # Pages loading at once
+DESCRIPTION = '[data-testid="description-wrapper"]'
 
-        for prop in PROPERTIES:
-            print(f"\n--- Processing: {prop['address']} ---")
-            print(f"URL: {prop['url']}")
 
-            try:
-                await page.goto(
-                    prop["url"], wait_until="domcontentloaded", timeout=60000
-                )
+async def process(context, prop, sem):
+    """Scrape and assess one property on its own page.
 
-                # Domain Property Profile content extraction
-                # Description is usually in a div with class css-1nxgjc7 or similar, or just paragraphs
-                # We'll grab the full text of the main content area
+    Output is collected and printed in one go so concurrent pages don't
+    interleave their lines.
+    """
+    out = [f"\n--- Processing: {prop['address']} ---", f"URL: {prop['url']}"]
+    async with sem:
+        page = await context.new_page()
+        try:
+            # Navigate only until the response starts, then wait for the
+            # element we need rather than for every third-party script
+            await page.goto(prop["url"], wait_until="commit", timeout=60000)
+
+            # Domain Property Profile content extraction
+            # Description is usually in a div with class css-1nxgjc7 or similar, or just paragraphs
+            # We'll grab the full text of the main content area
+            content_div = None
+            try:
+                content_div = await page.wait_for_selector(DESCRIPTION, timeout=10000)
+            except Exception:
+                await page.wait_for_load_state("domcontentloaded")
 
-                # Try to click "Read more" if it exists
-                try:
-                    read_more = await page.query_selector(
-                        'button:has-text("Read more")'
+            # Try to click "Read more" if it exists
+            try:
+                read_more = await page.query_selector('button:has-text("Read more")')
+                if read_more:
+                    await read_more.click()
+                    content_div = await page.wait_for_selector(
+                        DESCRIPTION, state="visible", timeout=2000
                     )
-                    if read_more:
-                        await read_more.click()
-                        await asyncio.sleep(1)
-                except:
-                    pass
-
-                # Get description text
-                description = None
-
-                # Check for standard description container
-                content_div = await page.query_selector(
-                    '[data-testid="description-wrapper"]'
+            except Exception:
+                pass
+
+            # Get description text
+            description = None
+
+            # Check for standard description container
+            if content_div:
+                description = await content_div.inner_text()
+
+            if not description:
+                # Fallback to body text accumulation
+                body = await page.inner_text("body")
+                # simplistic extraction: look for block of text
+                description = body[:4000]  # Cap it
+
+            out.append(
+                f"Extracted Description Length: {len(description) if description else 0}"
+            )
+            if description and len(description) > 100:
+                out.append(f"Snippet: {description[:200]}...")
+
+                # Run Analysis (blocking CLI call, kept off the event loop)
+                out.append("Running Quality Assessment...")
+                result = await asyncio.to_thread(delegate_extraction, description)
+
+                out.append(f"Assessment Result:")
+                out.append(f"  Quality: {result.get('finish_quality')}")
+                out.append(
+                    f"  Condition: {'Renovated' if result.get('renovated') else 'Original/Unknown'}"
                 )
-                if content_div:
-                    description = await content_div.inner_text()
-
-                if not description:
-                    # Fallback to body text accumulation
-                    body = await page.inner_text("body")
-                    # simplistic extraction: look for block of text
-                    description = body[:4000]  # Cap it
+                out.append(f"  Key Features: {result.get('features')}")
+            else:
+                out.append("Failed to extract meaningful description.")
 
-                print(
-                    f"Extracted Description Length: {len(description) if description else 0}"
-                )
-                if description and len(description) > 100:
-                    print(f"Snippet: {description[:200]}...")
+        except Exception as e:
+            out.append(f"Error processing {prop['address']}: {e}")
+        finally:
+            await page.close()
+    print("\n".join(out))
 
-                    # Run Analysis
-                    print("Running Quality Assessment...")
-                    result = delegate_extraction(description)
 
-                    print(f"Assessment Result:")
-                    print(f"  Quality: {result.get('finish_quality')}")
-                    print(
-                        f"  Condition: {'Renovated' if result.get('renovated') else 'Original/Unknown'}"
-                    )
-                    print(f"  Key Features: {result.get('features')}")
-                else:
-                    print("Failed to extract meaningful description.")
+async def scrape_and_assess():
+    async with async_playwright() as p:
+        # Use a stealthy context similar to domain.py
+        browser = await p.chromium.launch(
+            headless=True, args=["--disable-blink-features=AutomationControlled"]
+        )
+        context = await browser.new_context(
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            viewport={"width": 1280, "height": 800},
+        )
 
-            except Exception as e:
-                print(f"Error processing {prop['address']}: {e}")
+        # One page per property, a few at a time
+        sem = asyncio.Semaphore(CONCURRENCY)
+        await asyncio.gather(*(process(context, prop, sem) for prop in PROPERTIES))
 
         await browser.close()
 
@@ -11,7 +11,6 @@ Usage:
 
 import os
 import sys
-import time
 
 import pandas as pd
 
@@ -52,34 +51,31 @@ def update_data():
         # 'Avg_Household_Size': 'Avg_Household_Size' # Add to schema if needed
     }
 
-    # Iterate rows
-    for index, row in df.iterrows():
-        region_id = str(row["Region_ID"])
-
-        # ABS Connector
-        if region_id.startswith("LGA"):
-            print(f"[{region_id}] Fetching ABS Data...")
-            try:
-                data = abs_scraper.scrape_abs_quickstats(region_id)
-
-                if "error" in data:
-                    print(f"  Warning: {data['error']}")
-                else:
-                    changes = []
-                    for schema_col, abs_key in abs_map.items():
-                        if abs_key in data and data[abs_key]:
-                            old_val = row[schema_col]
-                            new_val = data[abs_key]
-                            df.at[index, schema_col] = new_val
-                            changes.append(f"{schema_col}: {old_val} -> {new_val}")
-
-                    print(f"  Updated {len(changes)} fields.")
-
-            except Exception as e:
-                print(f"  Error running ABS scraper: {e}")
-
-            # Rate limit politely
-            time.sleep(1)
+    # ABS Connector: each LGA once, fetched by a few paced workers
+    region_ids = df["Region_ID"].astype(str)
+    lga_ids = list(region_ids[region_ids.str.startswith("LGA")].unique())
+    print(f"Fetching ABS Data for {len(lga_ids)} LGAs...")
+    results = abs_scraper.scrape_many(lga_ids, max_workers=3, pause=1.0)
+
+    # New values per LGA (None = keep the template value)
+    updates = {}
+    for region_id, data in results.items():
+        if "error" in data:
+            print(f"[{region_id}] Warning: {data['error']}")
+            continue
+        updates[region_id] = {
+            schema_col: data[abs_key] if data.get(abs_key) else None
+            for schema_col, abs_key in abs_map.items()
+        }
+        changed = sum(v is not None for v in updates[region_id].values())
+        print(f"[{region_id}] Updated {changed} fields.")
+
+    # One column-wise write per field instead of per-row df.at
+    if updates:
+        abs_df = pd.DataFrame.from_dict(updates, orient="index")
+        for schema_col in abs_map:
+            new_vals = region_ids.map(abs_df[schema_col])
+            df[schema_col] = new_vals.where(new_vals.notna(), df[schema_col])
 
     print(f"Saving updated data to {OUTPUT_FILE}...")
     df.to_csv(OUTPUT_FILE, index=False)
@@ -90,4 +86,3 @@ if __name__ == "__main__":
     # Ensure script can find connectors
     sys.path.append(os.path.join(os.path.dirname(__file__)))
     update_data()
-    update_data()
@@ -1,22 +1,27 @@
 import sys
 
+from sqlalchemy import case, func
+
 from scanner.market.models import Comparable, SessionLocal
 
 try:
-    db = SessionLocal()
-    count = db.query(Comparable).count()
-    de_count = (
-        db.query(Comparable).filter(Comparable.suburb.ilike("%Doncaster East%")).count()
-    )
-    print(f"DEBUG: Total records: {count}")
-    print(f"DEBUG: Doncaster East records: {de_count}")
-
-    # Show last 5
-    last_5 = db.query(Comparable).order_by(Comparable.id.desc()).limit(5).all()
-    for c in last_5:
-        print(f"  - {c.suburb}: {c.sold_price} ({c.sold_date})")
+    with SessionLocal() as db:
+        # Both counts in one pass over the table
+        count, de_count = db.query(
+            func.count(Comparable.id),
+            func.count(case((Comparable.suburb.ilike("%Doncaster East%"), 1))),
+        ).one()
+        print(f"DEBUG: Total records: {count}")
+        print(f"DEBUG: Doncaster East records: {de_count}")
 
-    db.close()
+        # Show last 5
+        last_5 = (
+            db.query(Comparable.suburb, Comparable.sold_price, Comparable.sold_date)
+            .order_by(Comparable.id.desc())
+            .limit(5)
+            .all()
+        )
+        for c in last_5:
+            print(f"  - {c.suburb}: {c.sold_price} ({c.sold_date})")
 except Exception as e:
     print(f"ERROR: {e}")
-    print(f"ERROR: {e}")
@@ -217,11 +217,15 @@ def write_report(rows: list[dict], report_path: Path) -> None:
         "sewer_note",
     ]
 
-    with report_path.open("w", newline="", encoding="utf-8") as f:
+    # Write then rename, so readers polling the report (auto_find_candidates)
+    # never see a half-written file
+    tmp_path = report_path.with_name(report_path.name + ".tmp")
+    with tmp_path.open("w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for row in rows:
             writer.writerow(row)
+    tmp_path.replace(report_path)
 
     console.print(f"[green]Report written:[/green] {report_path}")
 
@@ -4,6 +4,7 @@ import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import yaml
 from rich.console import Console
 
@@ -187,6 +188,72 @@ def calculate_simple_feasibility(
     )
 
 
+def calculate_simple_feasibility_batch(
+    land_prices,
+    land_areas_sqm,
+    strategies,
+    config: SimpleFeasibilityConfig = SimpleFeasibilityConfig(),
+    max_footprints_sqm=None,
+    max_dwellings=None,
+) -> np.ndarray:
+    """
+    Vectorized margin_percent of calculate_simple_feasibility for many sites.
+
+    Inputs are array-likes of equal length (or scalars, which broadcast);
+    None / NaN footprints fall back to 60% of land area as in the scalar path.
+    """
+    land_price = np.asarray(land_prices, dtype=float)
+    land_area = np.asarray(land_areas_sqm, dtype=float)
+    strategy = np.asarray(strategies)
+
+    # Same "Downgraded to Single" rule as the scalar path
+    dual = strategy == "DualOcc"
+    if max_dwellings is not None:
+        caps = np.asarray(max_dwellings, dtype=float)
+        dual &= ~((caps > 0) & (caps < 2))
+
+    # 1. Estimate Yield
+    if max_footprints_sqm is None:
+        max_ground_floor = land_area * 0.6
+    else:
+        footprint = np.asarray(max_footprints_sqm, dtype=float)
+        has_footprint = np.nan_to_num(footprint) > 0
+        max_ground_floor = np.where(has_footprint, footprint, land_area * 0.6)
+    dwelling_size_sqm = np.minimum(220, max_ground_floor * 1.8 / 2)
+    total_build_area_sqm = np.where(dual, dwelling_size_sqm * 2, 0.0)
+    gdv = np.where(dual, 1_200_000 * 2, land_price * 1.2)
+
+    # 2. TDC
+    construction_cost = total_build_area_sqm * config.build_cost_per_sqm
+    prof_fees = construction_cost * config.prof_fees_percent
+    contingency = construction_cost * config.contingency_percent
+    statutory_costs = 0.05 * land_price
+    finance_cost = (
+        (land_price + construction_cost)
+        * config.interest_rate
+        * (config.holding_period_months / 12)
+        * 0.6
+    )
+    selling_costs = gdv * config.selling_costs_percent
+
+    tdc = (
+        land_price
+        + statutory_costs
+        + construction_cost
+        + prof_fees
+        + contingency
+        + finance_cost
+        + selling_costs
+    )
+
+    # 3. Margin
+    gst_payable = (gdv - land_price) / 11
+    net_profit = gdv - tdc - gst_payable
+    return np.divide(
+        net_profit * 100, tdc, out=np.zeros_like(tdc, dtype=float), where=tdc > 0
+    )
+
+
 # Sale price estimates by suburb (AUD per dwelling)
 # These are rough estimates - should be updated with market data
 SUBURB_SALE_PRICES = {
@@ -19,7 +19,7 @@ from scanner.ingest.human_like import (
     setup_human_browser,
     simulate_reading,
 )
-from scanner.market.database import save_comparable
+from scanner.market.database import save_comparables
 from scanner.market.models import SessionLocal as MarketSessionLocal
 from scanner.models import RawListing, Site
 from scanner.utils.delegator import delegate_extraction
@@ -32,27 +32,31 @@ class DomainScraper:
 
     BASE_URL = "https://www.domain.com.au"
 
-    def __init__(self):
+    def __init__(self, browser: Browser | None = None):
         self.config = get_config()
-        self.browser: Browser | None = None
+        # A shared browser is owned (and closed) by whoever launched it;
+        # this scraper then only opens and closes its own context
+        self.browser: Browser | None = browser
+        self._owns_browser = browser is None
         self.context: BrowserContext | None = None
         self.page: Page | None = None
         self.session = SessionManager(max_pages_per_session=30)
 
     async def start(self):
         """Start browser with human-like settings."""
-        playwright = await async_playwright().start()
-
-        # Use headed browser occasionally for more realistic behavior
-        headless = random.random() > 0.1  # 90% headless, 10% headed
-
-        self.browser = await playwright.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-            ],
-        )
+        if self._owns_browser:
+            playwright = await async_playwright().start()
+
+            # Use headed browser occasionally for more realistic behavior
+            headless = random.random() > 0.1  # 90% headless, 10% headed
+
+            self.browser = await playwright.chromium.launch(
+                headless=headless,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--no-sandbox",
+                ],
+            )
 
         # Create context with realistic settings
         self.context = await self.browser.new_context(
@@ -80,7 +84,10 @@ class DomainScraper:
 
     async def stop(self):
         """Close browser."""
-        if self.browser:
+        if not self._owns_browser:
+            if self.context:
+                await self.context.close()
+        elif self.browser:
             await self.browser.close()
 
     def build_search_url(
@@ -667,7 +674,11 @@ async def scrape_domain(suburbs: list[str] | None = None) -> int:
         await scraper.stop()
 
 
-async def scrape_sold_domain(suburbs: list[str] | None = None, max_pages: int = 3):
+async def scrape_sold_domain(
+    suburbs: list[str] | None = None,
+    max_pages: int = 3,
+    scraper: DomainScraper | None = None,
+):
     """Scrape SOLD listings from Domain to populate market data."""
     config = get_config()
     suburbs = suburbs or config.suburbs
@@ -676,9 +687,13 @@ async def scrape_sold_domain(suburbs: list[str] | None = None, max_pages: int =
         console.print("[yellow]No suburbs configured for sold scrape[/yellow]")
         return 0
 
-    scraper = DomainScraper()
+    # A caller-supplied scraper is already started and stays open afterwards
+    owns_scraper = scraper is None
+    if owns_scraper:
+        scraper = DomainScraper()
     try:
-        await scraper.start()
+        if owns_scraper:
+            await scraper.start()
         total_saved = 0
 
         for suburb in suburbs:
@@ -699,8 +714,8 @@ async def scrape_sold_domain(suburbs: list[str] | None = None, max_pages: int =
                     if not listing.get("suburb"):
                         listing["suburb"] = suburb
 
-                    save_comparable(db, listing)
-                    total_saved += 1
+                # One transaction per suburb; a bad row is skipped, not fatal
+                total_saved += save_comparables(db, listings)
             finally:
                 db.close()
 
@@ -711,7 +726,8 @@ async def scrape_sold_domain(suburbs: list[str] | None = None, max_pages: int =
         )
         return total_saved
     finally:
-        await scraper.stop()
+        if owns_scraper:
+            await scraper.stop()
 
 
 def run():
@@ -24,7 +24,7 @@ from scanner.ingest.human_like import (
     setup_human_browser,
     simulate_reading,
 )
-from scanner.market.database import save_comparable
+from scanner.market.database import save_comparables
 from scanner.market.utils import parse_sold_price
 from scanner.models import RawListing, Site
 
@@ -36,9 +36,12 @@ class REAScraper:
 
     BASE_URL = "https://www.realestate.com.au"
 
-    def __init__(self):
+    def __init__(self, browser: Browser | None = None):
         self.config = get_config()
-        self.browser: Browser | None = None
+        # A shared browser is owned (and closed) by whoever launched it;
+        # this scraper then only opens and closes its own context
+        self.browser: Browser | None = browser
+        self._owns_browser = browser is None
         self.context: BrowserContext | None = None
         self.page: Page | None = None
         self.session = SessionManager(
@@ -47,16 +50,17 @@ class REAScraper:
 
     async def start(self):
         """Start browser with stealth settings."""
-        playwright = await async_playwright().start()
-
-        self.browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ],
-        )
+        if self._owns_browser:
+            playwright = await async_playwright().start()
+
+            self.browser = await playwright.chromium.launch(
+                headless=True,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--disable-dev-shm-usage",
+                    "--no-sandbox",
+                ],
+            )
 
         # Realistic context
         self.context = await self.browser.new_context(
@@ -99,7 +103,10 @@ class REAScraper:
             console.print(f"[yellow]Homepage load issue: {e}[/yellow]")
 
     async def stop(self):
-        if self.browser:
+        if not self._owns_browser:
+            if self.context:
+                await self.context.close()
+        elif self.browser:
             await self.browser.close()
 
     def build_sold_url(self, suburb: str, page: int = 1) -> str:
@@ -497,7 +504,11 @@ async def scrape_rea(suburbs: list[str] | None = None) -> int:
         await scraper.stop()
 
 
-async def scrape_sold_rea(suburbs: list[str] | None = None, max_pages: int = 1):
+async def scrape_sold_rea(
+    suburbs: list[str] | None = None,
+    max_pages: int = 1,
+    scraper: REAScraper | None = None,
+):
     """Scrape only SOLD listings from REA."""
     config = get_config()
     suburbs = suburbs or config.suburbs
@@ -505,9 +516,13 @@ async def scrape_sold_rea(suburbs: list[str] | None = None, max_pages: int = 1):
     if not suburbs:
         return 0
 
-    scraper = REAScraper()
+    # A caller-supplied scraper is already started and stays open afterwards
+    owns_scraper = scraper is None
+    if owns_scraper:
+        scraper = REAScraper()
     try:
-        await scraper.start()
+        if owns_scraper:
+            await scraper.start()
         total_saved = 0
 
         for suburb in suburbs:
@@ -515,13 +530,16 @@ async def scrape_sold_rea(suburbs: list[str] | None = None, max_pages: int = 1):
 
             from scanner.market.models import SessionLocal as MarketSessionLocal
 
+            priced = []
+            for sold in sold_listings:
+                price_val = parse_sold_price(sold.get("price_text", ""))
+                if price_val:
+                    sold["sold_price"] = price_val
+                    priced.append(sold)
+
             with MarketSessionLocal() as db:
-                for sold in sold_listings:
-                    price_val = parse_sold_price(sold.get("price_text", ""))
-                    if price_val:
-                        sold["sold_price"] = price_val
-                        save_comparable(db, sold)
-                        total_saved += 1
+                # One transaction per suburb; a bad row is skipped, not fatal
+                total_saved += save_comparables(db, priced)
 
             await random_delay(30, 60)
 
@@ -530,7 +548,8 @@ async def scrape_sold_rea(suburbs: list[str] | None = None, max_pages: int = 1):
         )
         return total_saved
     finally:
-        await scraper.stop()
+        if owns_scraper:
+            await scraper.stop()
 
 
 def run():
@@ -1,13 +1,20 @@
 from datetime import datetime
 
+from rich.console import Console
 from sqlalchemy.orm import Session
 
 from scanner.market.models import Comparable, get_db, init_db  # noqa: F401
 from scanner.market.utils import parse_sold_price
 
+console = Console()
 
-def save_comparable(db: Session, data: dict):
-    """Save or update a comparable sale."""
+
+def save_comparable(db: Session, data: dict, commit: bool = True):
+    """Save or update a comparable sale.
+
+    Pass commit=False to batch several saves into one transaction; the row
+    is only flushed, so later saves in the batch still see it.
+    """
     # Create ID if missing
     listing_id = data.get("listing_id")
     if not listing_id:
@@ -72,7 +79,31 @@ def save_comparable(db: Session, data: dict):
         url=data.get("url"),
     )
     db.add(comp)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+
+
+def save_comparables(db: Session, listings: list[dict]) -> int:
+    """Save a batch of comparables in one transaction; returns how many saved.
+
+    Each row gets its own savepoint, so a row that fails is rolled back,
+    reported and skipped without losing the rest of the batch.
+    """
+    saved = 0
+    for listing in listings:
+        try:
+            with db.begin_nested():
+                save_comparable(db, listing, commit=False)
+        except Exception as e:
+            console.print(
+                f"[yellow]Skipping comparable {listing.get('listing_id')}: {e}[/yellow]"
+            )
+            continue
+        saved += 1
     db.commit()
+    return saved
 
 
 def get_suburb_stats(db: Session, suburb: str, property_type: str = "Townhouse"):
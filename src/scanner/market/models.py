@@ -1,6 +1,15 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, create_engine
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    create_engine,
+    text,
+)
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 Base = declarative_base()
@@ -40,6 +49,24 @@ class Comparable(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
 
+# Partial indexes covering each "has rich data" branch, so SQLite can answer
+# them separately (an OR across the three columns forces a full scan)
+Index(
+    "ix_comp_year_built",
+    Comparable.year_built,
+    sqlite_where=text("year_built IS NOT NULL"),
+)
+Index(
+    "ix_comp_finish_quality",
+    Comparable.finish_quality,
+    sqlite_where=text("finish_quality != 'Standard'"),
+)
+Index(
+    "ix_comp_building_area",
+    Comparable.building_area,
+    sqlite_where=text("building_area IS NOT NULL"),
+)
+
 # DB Setup
 DB_PATH = "sqlite:///market_data.db"
 engine = create_engine(DB_PATH)
@@ -48,6 +75,9 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    # create_all skips indexes on tables that already exist
+    for index in Comparable.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
 
 
 def get_db():
@@ -283,6 +283,30 @@ class CachedZone(Base):
     fetched_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
 
+class CachedParcel(Base):
+    """Cached Vicmap property polygon lookup by coordinate."""
+
+    __tablename__ = "cached_parcels"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    lat_round = Column(Float, index=True)
+    lon_round = Column(Float, index=True)
+    geom_wkt = Column(Text)  # WKT Polygon
+    fetched_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class CachedGeocode(Base):
+    """Cached Nominatim result keyed by the address string that was looked up."""
+
+    __tablename__ = "cached_geocodes"
+
+    address = Column(Text, primary_key=True)
+    lat = Column(Float)
+    lon = Column(Float)
+    display_name = Column(Text)
+    fetched_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
 class CachedOverlay(Base):
     """Cached planning overlay (Polygon)."""
 
@@ -325,6 +349,7 @@ Index("ix_sites_listing_status", Site.listing_status)
 Index("ix_sites_geocode_status", Site.geocode_status)
 
 Index("ix_cached_zones_lat_lon", CachedZone.lat_round, CachedZone.lon_round)
+Index("ix_cached_parcels_lat_lon", CachedParcel.lat_round, CachedParcel.lon_round)
 
 
 class CachedSchoolZone(Base):
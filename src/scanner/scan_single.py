@@ -1,3 +1,5 @@
+import time
+
 import requests
 from rich.console import Console
 
@@ -26,6 +28,62 @@ def geocode_address(address: str):
         return None
 
 
+def geocode_batch(addresses: list[str]) -> dict[str, tuple[float, float, str]]:
+    """Geocode many addresses at once, reusing previously cached results.
+
+    Nominatim has no bulk endpoint, so cached hits are read back in a single
+    query and only the misses are looked up, at the 1 request/second its
+    usage policy allows. New results are stored in ``cached_geocodes`` so a
+    retry costs no HTTP at all.
+
+    Returns a dict of address -> (lat, lon, display_name); addresses that
+    could not be geocoded are omitted.
+    """
+    from scanner.db import engine, get_session
+    from scanner.models import CachedGeocode
+
+    unique = list(dict.fromkeys(a for a in addresses if a))
+    results: dict[str, tuple[float, float, str]] = {}
+
+    CachedGeocode.__table__.create(bind=engine, checkfirst=True)
+    with get_session() as session:
+        # Chunk the IN list to stay under SQLite's bound-parameter limit
+        for i in range(0, len(unique), 500):
+            rows = session.query(CachedGeocode).filter(
+                CachedGeocode.address.in_(unique[i : i + 500])
+            )
+            for row in rows:
+                results[row.address] = (row.lat, row.lon, row.display_name)
+
+        misses = [a for a in unique if a not in results]
+        if misses:
+            console.print(
+                f"[dim]Geocoding {len(misses)} new addresses "
+                f"({len(results)} cached)...[/dim]"
+            )
+
+        last_request = 0.0
+        for address in misses:
+            wait = 1.0 - (time.monotonic() - last_request)
+            if wait > 0:
+                time.sleep(wait)
+            result = geocode_address(address)
+            last_request = time.monotonic()
+            if not result:
+                continue
+
+            results[address] = result
+            lat, lon, display_name = result
+            session.add(
+                CachedGeocode(
+                    address=address, lat=lat, lon=lon, display_name=display_name
+                )
+            )
+            session.commit()  # Keep progress if a later lookup is interrupted
+
+    return results
+
+
 def extract_suburb(address: str) -> str | None:
     """Extract suburb name from address string.
 
@@ -0,0 +1,76 @@
+"""Parcel polygon cache to reduce WFS calls."""
+
+import threading
+from datetime import datetime, timedelta
+
+from shapely import wkt
+from shapely.geometry import Polygon
+
+from scanner.db import engine, get_session
+from scanner.models import CachedParcel
+from scanner.spatial.geometry import get_property_polygon
+
+ROUND_DECIMALS = 5  # ~1m, same grid as the zone cache
+DEFAULT_MAX_AGE_DAYS = 90
+
+_table_ready = False
+_table_lock = threading.Lock()  # Callers may be pool worker threads
+
+
+def _round_coord(value: float) -> float:
+    return round(value, ROUND_DECIMALS)
+
+
+def get_property_polygon_cached(
+    lat: float,
+    lon: float,
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+) -> Polygon | None:
+    """Return the property polygon at a point, using cached results when possible.
+
+    Re-scraped listings often geocode to the same point under a different
+    address string, so the cache is keyed on rounded coordinates.
+    """
+    global _table_ready
+    if lat is None or lon is None:
+        return None
+
+    if not _table_ready:
+        with _table_lock:
+            if not _table_ready:
+                CachedParcel.__table__.create(bind=engine, checkfirst=True)
+                _table_ready = True
+
+    lat_round = _round_coord(lat)
+    lon_round = _round_coord(lon)
+    cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+
+    with get_session() as session:
+        cached = (
+            session.query(CachedParcel)
+            .filter(
+                CachedParcel.lat_round == lat_round,
+                CachedParcel.lon_round == lon_round,
+            )
+            .order_by(CachedParcel.fetched_at.desc())
+            .first()
+        )
+        if cached and cached.fetched_at and cached.fetched_at >= cutoff:
+            return wkt.loads(cached.geom_wkt)
+
+    poly = get_property_polygon(lat, lon)
+    # Misses aren't cached: they are usually transient WFS failures
+    if poly is None:
+        return None
+
+    with get_session() as session:
+        session.add(
+            CachedParcel(
+                lat_round=lat_round,
+                lon_round=lon_round,
+                geom_wkt=poly.wkt,
+                fetched_at=datetime.utcnow(),
+            )
+        )
+
+    return poly
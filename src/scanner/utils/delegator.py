@@ -1,7 +1,15 @@
+import functools
 import json
 import os
+import shutil
 import subprocess
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+
+@functools.lru_cache(maxsize=1)
+def _gemini_executable() -> Optional[str]:
+    """Full path of the Gemini CLI (gemini.cmd on Windows), looked up once."""
+    return shutil.which("gemini")
 
 
 def delegate_extraction(raw_text: str) -> Dict[str, Any]:
@@ -31,41 +39,28 @@ def delegate_extraction(raw_text: str) -> Dict[str, Any]:
     {raw_text[:2000]}
     """
 
-    try:
-        # Construct command: gemini -p "prompt"
-        # We need to escape double quotes in prompt if necessary, or pass via stdin if gemini supports it.
-        # Most CLIs support reading from stdin. Let's try passing the prompt as an argument carefully.
-
-        # Using temp file for prompt to avoid shell length limits and quoting issues
-        temp_file = "temp_prompt.txt"
-        with open(temp_file, "w", encoding="utf-8") as f:
-            f.write(prompt)
-
-        # Run gemini command
-        # gemini command usually takes prompt as positional arg or via -p
+    gemini = _gemini_executable()
+    if not gemini:
+        print("Gemini CLI not found on PATH")
+        return {}
 
-        # User requested Fast/Flash model. Using gemini-2.0-flash-exp or similar.
+    try:
+        # Prompt goes straight to the CLI's stdin: no temp file, shell or
+        # `cat`/`type` process per call, and concurrent calls can't clobber
+        # each other's prompt file
         env = os.environ.copy()
+        # User requested Fast/Flash model. Using gemini-2.0-flash-exp or similar.
         # env["GEMINI_MODEL"] = "gemini-2.0-flash-exp"
 
-        if os.name == "nt":
-            command = f'type "{temp_file}" | gemini'
-        else:
-            command = f'cat "{temp_file}" | gemini'
-
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        process = subprocess.run(
+            [gemini],
+            input=prompt,
+            capture_output=True,
             text=True,
             encoding="utf-8",
             env=env,
-            shell=True,
         )
-        stdout, stderr = process.communicate()
-
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+        stdout, stderr = process.stdout, process.stderr
 
         if process.returncode != 0:
             print(f"Gemini CLI Failed. RC: {process.returncode}")
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-import runpy
+import importlib.util
 from pathlib import Path
 import sys
 
 ROOT = Path(__file__).resolve().parents[1]
 TARGET = ROOT / "codex_cli.py"
 sys.path.insert(0, str(ROOT))
-runpy.run_path(str(TARGET), run_name="__main__")
+# Load through the import system so the target's __pycache__ bytecode is reused
+spec = importlib.util.spec_from_file_location("__main__", TARGET)
+module = importlib.util.module_from_spec(spec)
+sys.modules["__main__"] = module
+spec.loader.exec_module(module)
@@ -1,21 +1,55 @@
 
 #!/usr/bin/env python3
 from __future__ import annotations
-import argparse, subprocess, sys, os, time
+import argparse, codecs, functools, hashlib, subprocess, sys, os, tempfile, threading, time
 from pathlib import Path
 from tools.ai._shim_utils import load_usage, save_usage, append_call_log, estimate_tokens_rough, find_executable, now_ts
 
-def run(cmd: list[str], timeout: int | None = None) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, text=True, capture_output=True, timeout=timeout)
+STREAM_CHUNK = 65536
 
-def resolve_gemini_path(bin_dir: Path) -> str | None:
-    env_path = os.environ.get("GEMINI_CLI_PATH")
+def run(cmd: list[str], timeout: int | None = None) -> subprocess.CompletedProcess[str]:
+    # Echo stdout as it arrives (and keep a copy for token estimation).
+    # stderr goes to a temp file, not a second pipe, so it can never stall the reader.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    out_chunks: list[str] = []
+    timed_out = threading.Event()
+    with tempfile.TemporaryFile() as err, subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=err, bufsize=STREAM_CHUNK
+    ) as proc:
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            for chunk in iter(lambda: proc.stdout.read1(STREAM_CHUNK), b""):
+                text = decoder.decode(chunk)
+                sys.stdout.write(text)
+                sys.stdout.flush()
+                out_chunks.append(text)
+            out_chunks.append(decoder.decode(b"", final=True))
+            returncode = proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+        err.seek(0)
+        stderr = err.read().decode("utf-8", errors="replace")
+
+    stdout = "".join(out_chunks)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr=stderr)
+
+@functools.lru_cache(maxsize=8)
+def _probe_gemini_path(bin_dir: str, env_path: str | None, home: str | None, path_env: str | None) -> str | None:
+    # path_env is only part of the cache key; find_executable reads PATH itself
     if env_path:
         p = Path(env_path).expanduser()
         if p.exists():
             return str(p)
 
-    home = os.environ.get("GEMINI_HOME")
     if home:
         base = Path(home).expanduser()
         for name in ("gemini.cmd", "gemini.exe", "gemini"):
@@ -36,7 +70,33 @@ def resolve_gemini_path(bin_dir: Path) -> str | None:
                 if cand.exists():
                     return str(cand)
 
-    return find_executable("gemini", exclude_dir=bin_dir)
+    return find_executable("gemini", exclude_dir=Path(bin_dir))
+
+PATH_CACHE_FILE = Path.home() / ".cache" / "gemini_wrapper" / "path"
+
+def resolve_gemini_path(bin_dir: Path, force_refresh: bool = False) -> str | None:
+    # Probing touches up to ~10 paths; remember the answer per environment, in-process
+    # and on disk, and only re-check that the cached binary still exists.
+    key = (str(bin_dir), os.environ.get("GEMINI_CLI_PATH"), os.environ.get("GEMINI_HOME"), os.environ.get("PATH"))
+    key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+    if force_refresh:
+        _probe_gemini_path.cache_clear()
+    else:
+        try:
+            cached_hash, cached_path = PATH_CACHE_FILE.read_text(encoding="utf-8").split("\n", 1)
+            if cached_hash == key_hash and Path(cached_path).exists():
+                return cached_path
+        except (OSError, ValueError):
+            pass
+
+    path = _probe_gemini_path(*key)
+    if path:
+        try:
+            PATH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            PATH_CACHE_FILE.write_text(f"{key_hash}\n{path}", encoding="utf-8")
+        except OSError:
+            pass
+    return path
 
 def env_allowed_mcp_server_names() -> list[str]:
     raw = os.environ.get("GEMINI_ALLOWED_MCP_SERVER_NAMES")
@@ -59,13 +119,14 @@ def main():
     parser = argparse.ArgumentParser(description="Gemini CLI wrapper (passthrough + usage tracking)")
     parser.add_argument("--force-npx", action="store_true", help="Use npx @google/gemini-cli even if gemini is installed")
     parser.add_argument("--timeout", type=int, default=0, help="Timeout seconds (0 = no timeout)")
+    parser.add_argument("--force-refresh", action="store_true", help="Re-probe for the gemini binary instead of using the cached path")
     parser.add_argument("args", nargs=argparse.REMAINDER, help="Args to pass to gemini CLI")
     ns, unknown = parser.parse_known_args()
 
     # Avoid recursion if repo/bin is in PATH
     wrapper_root = Path(__file__).resolve().parent
     bin_dir = wrapper_root / "bin"
-    gemini_path = None if ns.force_npx else resolve_gemini_path(bin_dir)
+    gemini_path = None if ns.force_npx else resolve_gemini_path(bin_dir, force_refresh=ns.force_refresh)
 
     if gemini_path is None:
         # Fallback: npx (requires node + network)
@@ -77,7 +138,10 @@ def main():
     passthrough.extend(unknown)
     passthrough.extend([a for a in ns.args if a != "--"])  # tolerate " -- " separator
 
-    if not any(arg.startswith("--allowed-mcp-server-names") for arg in passthrough):
+    # Flags the caller already set, with any "=value" suffix dropped (--model=pro -> --model)
+    flags_present = {a.split("=", 1)[0] for a in passthrough if a.startswith("-")}
+
+    if "--allowed-mcp-server-names" not in flags_present:
         allowed_mcp = env_allowed_mcp_server_names()
         if allowed_mcp:
             passthrough.extend(["--allowed-mcp-server-names", *allowed_mcp])
@@ -85,7 +149,7 @@ def main():
     cmd += passthrough
 
     # Inject default model if not specified
-    if not any(arg.startswith(("-m", "--model")) for arg in cmd):
+    if not flags_present & {"-m", "--model"}:
         model = default_model()
         if model:
             cmd.extend(["--model", model])
@@ -105,8 +169,7 @@ def main():
         try:
             cp = run(cmd, timeout=None if ns.timeout == 0 else ns.timeout)
             returncode = cp.returncode
-            if cp.stdout:
-                sys.stdout.write(cp.stdout)
+            # stdout was already streamed through by run()
             if cp.stderr:
                 sys.stderr.write(cp.stderr)
             ok = (returncode == 0)
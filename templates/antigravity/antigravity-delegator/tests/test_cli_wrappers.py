@@ -64,7 +64,7 @@ class TestCodexCLI(unittest.TestCase):
         self.assertGreater(usage_data["codex"]["used"], 100)
 
 class TestGeminiCLI(unittest.TestCase):
-    @patch('gemini_cli.subprocess.run')
+    @patch('gemini_cli.run')
     @patch('gemini_cli.load_usage')
     @patch('gemini_cli.save_usage')
     @patch('gemini_cli.append_call_log')
@@ -92,7 +92,7 @@ class TestGeminiCLI(unittest.TestCase):
         self.assertIn('--model', cmd_list)
         self.assertIn('flash', cmd_list)
 
-    @patch('gemini_cli.subprocess.run')
+    @patch('gemini_cli.run')
     @patch('gemini_cli.load_usage')
     @patch('gemini_cli.save_usage')
     @patch('gemini_cli.append_call_log')
@@ -117,7 +117,7 @@ class TestGeminiCLI(unittest.TestCase):
         self.assertIn('gemini-1.5-pro', cmd_list)
         self.assertNotIn('flash', cmd_list)
 
-    @patch('gemini_cli.subprocess.run')
+    @patch('gemini_cli.run')
     @patch('gemini_cli.load_usage')
     @patch('gemini_cli.save_usage')
     @patch('gemini_cli.append_call_log')
@@ -144,6 +144,36 @@ class TestGeminiCLI(unittest.TestCase):
         self.assertIn('gemini-1.5-flash', cmd_list)
         self.assertNotIn('flash', cmd_list)
 
+    @patch('gemini_cli.run')
+    @patch('gemini_cli.load_usage')
+    @patch('gemini_cli.save_usage')
+    @patch('gemini_cli.append_call_log')
+    @patch('gemini_cli.resolve_gemini_path')
+    @patch('sys.stderr')
+    def test_model_flag_forms(self, mock_stderr, mock_resolve, mock_append, mock_save, mock_load, mock_run):
+        """Test that --model=X counts as a model flag but look-alike flags do not"""
+        mock_resolve.return_value = '/path/to/gemini'
+        mock_load.return_value = {}
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        with patch.dict(os.environ, {"GEMINI_DEFAULT_MODEL": "flash"}, clear=False):
+            with patch.object(sys, 'argv', ['gemini_cli.py', '--model=gemini-1.5-pro', 'prompt']):
+                try:
+                    gemini_cli.main()
+                except SystemExit:
+                    pass
+            cmd_list = mock_run.call_args[0][0]
+            self.assertNotIn('flash', cmd_list)
+
+            with patch.object(sys, 'argv', ['gemini_cli.py', '--modeler', 'prompt']):
+                try:
+                    gemini_cli.main()
+                except SystemExit:
+                    pass
+            cmd_list = mock_run.call_args[0][0]
+            self.assertIn('--model', cmd_list)
+            self.assertIn('flash', cmd_list)
+
 
 if __name__ == '__main__':
     unittest.main()
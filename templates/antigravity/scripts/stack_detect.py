@@ -9,18 +9,38 @@ ROOT = pathlib.Path(__file__).resolve().parents[1]
 def exists(*parts: str) -> bool:
     return (ROOT / pathlib.Path(*parts)).exists()
 
+# Vendored, generated or VCS trees: never walked
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "target", "dist", "build"}
+# Languages hinted by any source file of these extensions, or by a marker file
+LANG_EXTS = {"typescript": {".ts", ".tsx"}, "python": {".py"}, "go": {".go"}, "rust": {".rs"}}
+LANG_MARKERS = {"python": ("pyproject.toml", "requirements.txt"), "go": ("go.mod",), "rust": ("Cargo.toml",)}
+
+def languages(pending: dict[str, set[str]]) -> set[str]:
+    """Languages in ``pending`` with a source file under ROOT.
+
+    One pruned tree walk, stopped as soon as every pending language is found.
+    """
+    found = set()
+    pending = dict(pending)
+    for _, dirnames, filenames in os.walk(ROOT):
+        if not pending:
+            break
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        exts = {os.path.splitext(name)[1] for name in filenames}
+        for lang, lang_exts in list(pending.items()):
+            if exts & lang_exts:
+                found.add(lang)
+                del pending[lang]
+    return found
+
 def detect() -> dict:
     hints = []
     if exists("package.json"):
         hints.append("node")
-    if any(ROOT.glob("**/*.ts")) or any(ROOT.glob("**/*.tsx")):
-        hints.append("typescript")
-    if any(ROOT.glob("**/*.py")) or exists("pyproject.toml") or exists("requirements.txt"):
-        hints.append("python")
-    if any(ROOT.glob("**/*.go")) or exists("go.mod"):
-        hints.append("go")
-    if any(ROOT.glob("**/*.rs")) or exists("Cargo.toml"):
-        hints.append("rust")
+    # Marker files settle a language without walking for its sources
+    langs = {lang for lang, markers in LANG_MARKERS.items() if any(exists(m) for m in markers)}
+    langs |= languages({lang: exts for lang, exts in LANG_EXTS.items() if lang not in langs})
+    hints.extend(langs)
     if exists("docker-compose.yml") or exists("Dockerfile"):
         hints.append("docker")
     if exists("openapi.yaml") or exists("openapi.yml"):